@@ -4,13 +4,24 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration"""
+    """Application configuration (read from the environment once, at import)"""
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./ledgera.db")
     
+    # Auth
+    JWT_SECRET: str = os.getenv("JWT_SECRET", "dev-secret-key-change-in-production")
+
+    # Shared cache for admin aggregates across workers (optional)
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
+
+    # Proxies whose X-Forwarded-For is honored (comma-separated; empty = never)
+    TRUSTED_PROXIES: frozenset = frozenset(
+        h.strip() for h in os.getenv("TRUSTED_PROXIES", "").split(",") if h.strip()
+    )
+
     # API
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
     API_PORT: int = int(os.getenv("API_PORT", 8000))
@@ -23,5 +34,17 @@ class Config:
     # Base currency
     BASE_CURRENCY: str = os.getenv("BASE_CURRENCY", "SGD")
 
+    # Serve closed months of the analytics endpoints from the
+    # mv_monthly_posting_totals view (PostgreSQL only). Edits to past
+    # months show up after the next view refresh.
+    ANALYTICS_MONTHLY_TOTALS_VIEW: bool = os.getenv("ANALYTICS_MONTHLY_TOTALS_VIEW", "False").lower() == "true"
+
 
 config = Config()
+
+# Hot fields as plain module constants
+DATABASE_URL = config.DATABASE_URL
+JWT_SECRET = config.JWT_SECRET
+TRUSTED_PROXIES = config.TRUSTED_PROXIES
+REDIS_URL = config.REDIS_URL
+ANALYTICS_MONTHLY_TOTALS_VIEW = config.ANALYTICS_MONTHLY_TOTALS_VIEW
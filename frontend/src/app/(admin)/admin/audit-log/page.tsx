@@ -152,12 +152,7 @@ export default function AdminAuditLogPage() {
   )
 }
 
-function formatDetails(details: string): string {
-  try {
-    const parsed = JSON.parse(details)
-    if (parsed.email) return parsed.email
-    return details
-  } catch {
-    return details
-  }
+function formatDetails(details: Record<string, unknown>): string {
+  if (typeof details.email === "string") return details.email
+  return JSON.stringify(details)
 }
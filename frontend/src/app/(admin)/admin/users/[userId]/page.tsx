@@ -236,7 +236,7 @@ export default function AdminUserDetailPage() {
                     </TableCell>
                     <TableCell className="text-sm">{log.actor_email || log.actor_user_id}</TableCell>
                     <TableCell className="text-sm text-muted-foreground max-w-[200px] truncate">
-                      {log.details || "-"}
+                      {log.details ? JSON.stringify(log.details) : "-"}
                     </TableCell>
                   </TableRow>
                 ))}
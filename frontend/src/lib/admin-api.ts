@@ -82,6 +82,7 @@ export async function getUsers(params: {
   if (params.is_disabled !== undefined) qs.set("is_disabled", String(params.is_disabled))
   if (params.offset !== undefined) qs.set("offset", String(params.offset))
   if (params.limit !== undefined) qs.set("limit", String(params.limit))
+  qs.set("include_total", "true")
   return adminFetch<PaginatedUserResponse>(`/api/v1/admin/users?${qs}`)
 }
 
@@ -158,6 +159,7 @@ export async function getAuditLogs(params: {
   if (params.days) qs.set("days", String(params.days))
   if (params.offset) qs.set("offset", String(params.offset))
   if (params.limit) qs.set("limit", String(params.limit))
+  qs.set("include_total", "true")
   return adminFetch<PaginatedAuditLogResponse>(`/api/v1/admin/audit-logs?${qs}`)
 }
 
@@ -38,9 +38,11 @@ export interface AdminUserDetail extends AdminUserListItem {
 
 export interface PaginatedUserResponse {
   users: AdminUserListItem[]
-  total: number
+  total: number  // present because the admin API client always sends include_total=true
   offset: number
   limit: number
+  has_more?: boolean
+  next_cursor?: string | null
 }
 
 export interface SystemStats {
@@ -102,16 +104,18 @@ export interface AuditLogEntry {
   action: string
   target_type: string | null
   target_id: string | null
-  details: string | null
+  details: Record<string, unknown> | null
   ip_address: string | null
   created_at: string
 }
 
 export interface PaginatedAuditLogResponse {
   logs: AuditLogEntry[]
-  total: number
+  total: number  // present because the admin API client always sends include_total=true
   offset: number
   limit: number
+  has_more?: boolean
+  next_cursor?: string | null
 }
 
 // ---------------------
@@ -148,4 +152,6 @@ export interface PaginatedBugReportResponse {
   total: number
   offset: number
   limit: number
+  has_more?: boolean
+  next_cursor?: string | null
 }
@@ -552,6 +552,15 @@ export async function createOrUpdateAllocationOverride(
   })
 }
 
+export async function createOrUpdateAllocationOverrides(
+  data: CreateFundAllocationOverrideRequest[]
+): Promise<FundAllocationOverride[]> {
+  return apiFetch<FundAllocationOverride[]>("/api/v1/analytics/fund-allocation-overrides/batch", {
+    method: "POST",
+    body: JSON.stringify(data),
+  })
+}
+
 export async function getAllocationOverrides(
   year?: number,
   month?: number
@@ -1,24 +1,28 @@
 """Admin-specific FastAPI dependencies"""
 
-from fastapi import HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from fastapi import HTTPException, Request, status, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.data.database import get_session
-from src.data.repositories import UserRepository
+from src.data.database import get_async_session
 from src.data.models import UserModel
 from src.api.deps import get_user_id
 
 
-def require_admin(
+async def require_admin(
+    request: Request,
     user_id: str = Depends(get_user_id),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> UserModel:
     """
     FastAPI dependency that verifies the current user is an admin.
     Returns the UserModel if admin, raises 403 otherwise.
+    The verified admin is also kept on request.state.admin.
     """
-    user_repo = UserRepository(session)
-    user = user_repo.read(user_id)
+    cached = getattr(request.state, "admin", None)
+    if cached is not None:
+        return cached
+
+    user = await session.get(UserModel, user_id)
 
     if not user:
         raise HTTPException(
@@ -38,4 +42,5 @@ def require_admin(
             detail="Account is disabled"
         )
 
+    request.state.admin = user
     return user
@@ -0,0 +1,69 @@
+"""
+Wildcard CORS middleware (pure ASGI)
+
+Equivalent to Starlette's CORSMiddleware configured with allow_origins,
+allow_methods and allow_headers all set to "*" and allow_credentials=True,
+without the per-request origin/method/header matching that configuration
+never needs. All header values are precomputed at import.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_MAX_AGE = b"600"
+
+
+class FastCORSMiddleware:
+    """Allow every origin, method and header; answer preflights directly."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a cross-origin request: nothing to add
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Echo the origin (a literal "*" is rejected by browsers when
+        # credentials are allowed), and vary on it for shared caches
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + [
+                (b"access-control-allow-methods", _ALLOW_METHODS),
+                (b"access-control-max-age", _MAX_AGE),
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", b"2"),
+            ]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
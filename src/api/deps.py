@@ -1,6 +1,11 @@
 """Shared FastAPI dependencies for auth and workspace scoping"""
 
-from fastapi import Request, HTTPException, status
+from typing import NamedTuple
+
+from fastapi import Depends, Request, HTTPException, status
+from sqlalchemy.orm import Session
+
+from src.data.database import get_session
 
 
 def get_user_id(request: Request) -> str:
@@ -23,3 +28,14 @@ def get_workspace_id(request: Request) -> str:
             detail="Not authenticated"
         )
     return workspace_id
+
+
+class Scope(NamedTuple):
+    """Workspace id and DB session for a workspace-scoped request"""
+    workspace_id: str
+    session: Session
+
+
+def get_scope(request: Request, session: Session = Depends(get_session)) -> Scope:
+    """Resolve workspace + session as one dependency for workspace-scoped routes"""
+    return Scope(get_workspace_id(request), session)
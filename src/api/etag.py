@@ -0,0 +1,43 @@
+"""
+Route-level ETags
+
+Lets hot list endpoints derive a weak ETag from cheap metadata
+(e.g. MAX(updated_at) + row count) and answer 304 before building the
+response body at all. CacheControlMiddleware keeps any ETag a route sets
+instead of hashing the body itself.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # pragma: no cover - optional speedup
+    _blake3 = None
+
+
+def weak_etag(*parts) -> str:
+    """Build a weak ETag from any reprable values identifying a resource version."""
+    raw = repr(parts).encode()
+    if _blake3 is not None:
+        digest = _blake3(raw).hexdigest(length=12)
+    else:
+        digest = hashlib.md5(raw).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match header covers this ETag."""
+    header: Optional[str] = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip() == etag for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the ETag."""
+    return Response(status_code=304, headers={"ETag": etag, "Vary": "Authorization"})
@@ -1,23 +1,44 @@
 """FastAPI application and routes"""
 
+import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from src.data.database import init_db
+from config.settings import DATABASE_URL
+from src.data.database import init_db, refresh_growth_views, warm_connection_pool
 from .schemas import HealthResponse
-from .routes import accounts, transactions, projections, prices, auth, workspace, categories, analytics, payments, recurring, admin, bugs
+from .routes import accounts, transactions, projections, prices, auth, workspace, categories, analytics, payments, recurring, admin, bugs, batch
 from .middleware import AuthMiddleware
 from .middleware_cache import CacheControlMiddleware
+from .cors_fast import FastCORSMiddleware
+
+
+logger = logging.getLogger(__name__)
+
+GROWTH_VIEW_REFRESH_SECONDS = int(os.environ.get("GROWTH_VIEW_REFRESH_SECONDS", "3600"))
+
+
+async def _refresh_growth_views_periodically() -> None:
+    """Keep the materialized views at most about an interval stale (one worker refreshes)."""
+    while True:
+        try:
+            await asyncio.to_thread(refresh_growth_views, GROWTH_VIEW_REFRESH_SECONDS)
+        except Exception as e:
+            logger.warning("Growth view refresh failed: %s", e)
+        await asyncio.sleep(GROWTH_VIEW_REFRESH_SECONDS)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup"""
-    db_url = os.environ.get("DATABASE_URL", "sqlite:///./ledgera.db")
-    init_db(db_url)
+    """Initialize database, warm the connection pool and start view refreshes"""
+    init_db(DATABASE_URL)
+    warm_connection_pool(int(os.environ.get("POOL_WARM", "5")))
+    refresher = asyncio.create_task(_refresh_growth_views_periodically())
     yield
+    refresher.cancel()
 
 
 app = FastAPI(
@@ -25,7 +46,8 @@ app = FastAPI(
     description="Dual-approach banking + projections + line-by-line accounting",
     version="0.1.0",
     lifespan=lifespan,
-    redirect_slashes=False
+    redirect_slashes=False,
+    default_response_class=ORJSONResponse,
 )
 
 # Cache headers middleware (innermost — adds Cache-Control/ETag to responses)
@@ -34,14 +56,9 @@ app.add_middleware(CacheControlMiddleware)
 # JWT authentication middleware (runs after CORS, before cache)
 app.add_middleware(AuthMiddleware)
 
-# CORS configuration (outer — wraps ALL responses including auth errors)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS (outer — wraps ALL responses including auth errors).
+# Allow-all policy; see cors_fast.py for why this isn't CORSMiddleware.
+app.add_middleware(FastCORSMiddleware)
 
 
 @app.get("/", response_model=HealthResponse)
@@ -68,7 +85,9 @@ app.include_router(prices.router, prefix="/api/v1/prices", tags=["prices"])
 app.include_router(payments.router, prefix="/api/v1/payments", tags=["payments"])
 app.include_router(recurring.router, prefix="/api/v1/recurring", tags=["recurring"])
 app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
+app.include_router(admin.media_router, prefix="/api/v1/admin", tags=["admin"])
 app.include_router(bugs.router, prefix="/api/v1/bugs", tags=["bugs"])
+app.include_router(batch.router, prefix="/api/v1", tags=["batch"])
 
 
 if __name__ == "__main__":
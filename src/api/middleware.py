@@ -1,72 +1,141 @@
 """Authentication middleware"""
 
-import os
-from fastapi import Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+import logging
+import time
 
-from src.services.auth_service import AuthService
+from cachetools import TTLCache
+from sqlalchemy import select
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-JWT_SECRET = os.environ.get("JWT_SECRET", "dev-secret-key-change-in-production")
+from config.settings import JWT_SECRET
+from src.data.database import AsyncSessionLocal
+from src.data.models import UserModel
+from src.services.auth_service import AuthService, JWT_ALGORITHM, JWT_PRIVATE_KEY, JWT_PUBLIC_KEY
 
+logger = logging.getLogger(__name__)
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """JWT authentication middleware."""
+# Public endpoints that bypass authentication
+_SKIP_PATHS = frozenset({
+    "/auth/signup",
+    "/auth/login",
+    "/auth/firebase",
+    "/health",
+    "/docs",
+    "/openapi.json",
+    "/redoc",
+})
 
-    def __init__(self, app):
-        super().__init__(app)
-        self.auth_service = AuthService(secret_key=JWT_SECRET)
+# Decoded tokens: raw token -> (user_id, workspace_id, exp). Entries are
+# dropped after the TTL or once the token itself is about to expire.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_TOKEN_EXPIRY_LEEWAY = 5  # seconds
 
-    async def dispatch(self, request: Request, call_next):
-        # Skip auth for public endpoints
-        skip_paths = ["/auth/signup", "/auth/login", "/auth/firebase", "/health", "/docs", "/openapi.json", "/redoc"]
-        if request.url.path in skip_paths:
-            request.state.user_id = None
-            request.state.workspace_id = None
-            return await call_next(request)
+# user_id -> is_disabled. Keeps the disabled-account check off the DB for
+# most requests; admin enable/disable routes invalidate entries directly,
+# but only in their own process: other workers can keep serving a newly
+# disabled user for up to the TTL.
+_DISABLED_CACHE: TTLCache = TTLCache(maxsize=50_000, ttl=30)
 
-        # Extract Bearer token
-        auth_header = request.headers.get("Authorization", "")
-        if not auth_header.startswith("Bearer "):
-            request.state.user_id = None
-            request.state.workspace_id = None
-            return await call_next(request)
+# CORS preflights and HEAD probes never carry credentials worth checking
+_UNAUTHENTICATED_METHODS = frozenset({"OPTIONS", "HEAD"})
 
-        token = auth_header[7:]
+# Pre-encoded error bodies (sent directly, no JSONResponse construction)
+_UNAUTHORIZED_BODY = b'{"detail":"Invalid or expired token"}'
+_DISABLED_BODY = b'{"detail":"Account is disabled. Contact support."}'
 
-        # Decode token
-        result = self.auth_service.decode_access_token(token)
-        if not result:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid or expired token"},
-                headers={"WWW-Authenticate": "Bearer"}
-            )
 
-        user_id, workspace_id = result
-        request.state.user_id = str(user_id)
-        request.state.workspace_id = str(workspace_id)
+async def _send_json_error(send: Send, status_code: int, body: bytes, extra_headers=()) -> None:
+    """Send a small JSON error response straight through the ASGI channel."""
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode("latin-1")),
+        *extra_headers,
+    ]
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class AuthMiddleware:
+    """JWT authentication middleware (pure ASGI)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.auth_service = AuthService(
+            secret_key=JWT_SECRET,
+            algorithm=JWT_ALGORITHM,
+            private_key=JWT_PRIVATE_KEY,
+            public_key=JWT_PUBLIC_KEY,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        state["user_id"] = None
+        state["workspace_id"] = None
+
+        # Skip auth for preflight/HEAD requests and public endpoints
+        if scope["method"] in _UNAUTHENTICATED_METHODS or scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Extract Bearer token (compare raw bytes, decode only the token)
+        auth_header = b""
+        for key, value in scope["headers"]:
+            if key == b"authorization":
+                auth_header = value
+                break
+        if auth_header[:7] != b"Bearer ":
+            await self.app(scope, receive, send)
+            return
+
+        token = auth_header[7:].decode("latin-1")
+
+        # Decode token (cached per raw token until shortly before it expires)
+        cached = _TOKEN_CACHE.get(token)
+        if cached is not None and time.time() > cached[2] - _TOKEN_EXPIRY_LEEWAY:
+            _TOKEN_CACHE.pop(token, None)
+            cached = None
+        if cached is None:
+            result = self.auth_service.decode_access_token_with_expiry(token)
+            if not result:
+                await _send_json_error(
+                    send, 401, _UNAUTHORIZED_BODY,
+                    extra_headers=[(b"www-authenticate", b"Bearer")],
+                )
+                return
+            user_id, workspace_id, exp = result
+            cached = (str(user_id), str(workspace_id), exp)
+            _TOKEN_CACHE[token] = cached
+
+        user_id, workspace_id, _ = cached
+        state["user_id"] = user_id
+        state["workspace_id"] = workspace_id
 
         # Block disabled users from accessing any endpoint
-        try:
-            from src.data.database import get_session as _get_session
-            from src.data.models import UserModel
-            gen = _get_session()
-            db = next(gen)
-            disabled = db.query(UserModel.id).filter(
-                UserModel.id == str(user_id),
-                UserModel.is_disabled == True  # noqa: E712
-            ).first()
+        disabled = _DISABLED_CACHE.get(user_id)
+        if disabled is None:
             try:
-                gen.close()
-            except StopIteration:
-                pass
-            if disabled:
-                return JSONResponse(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    content={"detail": "Account is disabled. Contact support."},
-                )
-        except Exception:
-            pass  # Don't block requests if check fails
+                async with AsyncSessionLocal() as db:
+                    disabled = (await db.execute(select(UserModel.id).where(
+                        UserModel.id == user_id,
+                        UserModel.is_disabled == True  # noqa: E712
+                    ).limit(1))).first() is not None
+                _DISABLED_CACHE[user_id] = disabled
+            except Exception as e:
+                # Don't block requests if the check fails, but keep it visible
+                logger.warning("Disabled-user check failed for %s: %s", user_id, e)
+                disabled = False
+
+        if disabled:
+            await _send_json_error(send, 403, _DISABLED_BODY)
+            return
+
+        await self.app(scope, receive, send)
+
 
-        return await call_next(request)
+def invalidate_disabled_cache(user_id: str) -> None:
+    """Forget the cached disabled flag for a user (call after changing it)."""
+    _DISABLED_CACHE.pop(user_id, None)
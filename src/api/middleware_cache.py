@@ -4,15 +4,20 @@ Adds HTTP caching headers to responses
 """
 
 import hashlib
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from typing import Callable, List, Optional
 
+from fastapi import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-class CacheControlMiddleware(BaseHTTPMiddleware):
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # pragma: no cover - optional speedup
+    _blake3 = None
+
+
+class CacheControlMiddleware:
     """
-    Middleware that adds HTTP caching headers to responses.
+    Middleware (pure ASGI) that adds HTTP caching headers to responses.
 
     Implements:
     - Cache-Control headers (max-age, stale-while-revalidate)
@@ -21,7 +26,7 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
     """
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
 
         # Cache strategies by endpoint pattern
         self.cache_strategies = {
@@ -53,68 +58,123 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
             "/api/v1/projections/scenarios": {"max_age": 300, "swr": 60},
         }
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Only cache GET requests
-        if request.method != "GET":
-            return await call_next(request)
-
-        # Check if client sent If-None-Match header (ETag validation)
-        client_etag = request.headers.get("if-none-match")
+        # Pre-encode each strategy's Cache-Control value once
+        for strategy in self.cache_strategies.values():
+            strategy["cache_control"] = (
+                f"max-age={strategy['max_age']}, "
+                f"stale-while-revalidate={strategy['swr']}, private"
+            ).encode("latin-1")
 
-        # Get the response
-        response = await call_next(request)
+        # Prefix patterns sorted longest-first so the first hit is the most
+        # specific match (e.g. /recurring/pending before /recurring)
+        self._prefixes = tuple(
+            sorted(self.cache_strategies.items(), key=lambda kv: -len(kv[0]))
+        )
 
-        # Only cache successful responses
-        if response.status_code != 200:
-            return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Only cache GET requests
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
 
         # Check if this endpoint should be cached
-        path = request.url.path
-        cache_strategy = self._get_cache_strategy(path)
-
-        if cache_strategy:
-            # Add Cache-Control header
-            max_age = cache_strategy["max_age"]
-            swr = cache_strategy["swr"]
-            response.headers["Cache-Control"] = (
-                f"max-age={max_age}, stale-while-revalidate={swr}, private"
-            )
-
-            # Add Vary header for user-specific caching
-            # This ensures different users get different cache entries
-            response.headers["Vary"] = "Authorization"
-
-            # Generate ETag based on response body
-            # Note: This requires reading the response body, which may impact performance
-            # For production, consider generating ETags at the route level
-            if hasattr(response, "body"):
-                etag = self._generate_etag(response.body)
-                response.headers["ETag"] = etag
-
-                # If client's ETag matches, return 304 Not Modified
-                if client_etag and client_etag == etag:
-                    return Response(
-                        status_code=304,
-                        headers={
-                            "Cache-Control": response.headers["Cache-Control"],
-                            "ETag": etag,
-                            "Vary": "Authorization",
-                        },
-                    )
-
-        return response
-
-    def _get_cache_strategy(self, path: str) -> dict | None:
+        cache_strategy = self._get_cache_strategy(scope["path"])
+        if cache_strategy is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Check if client sent If-None-Match header (ETag validation)
+        client_etag = None
+        for key, value in scope["headers"]:
+            if key == b"if-none-match":
+                client_etag = value.decode("latin-1")
+                break
+
+        cache_control = cache_strategy["cache_control"]
+        start_message: Optional[Message] = None
+        body_parts: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                # Only cache successful responses
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                    return
+
+                # One pass over the raw headers: drop any Cache-Control/Vary
+                # we're about to set and note whether the route set an ETag
+                has_etag = False
+                headers = []
+                for key, value in message.get("headers", ()):
+                    if key == b"cache-control" or key == b"vary":
+                        continue
+                    if key == b"etag":
+                        has_etag = True
+                    headers.append((key, value))
+                # Vary on Authorization so each user gets their own cache entry
+                headers.append((b"cache-control", cache_control))
+                headers.append((b"vary", b"Authorization"))
+                message["headers"] = headers
+
+                # Prefer an ETag set by the route (see src/api/etag.py); routes
+                # that set one also answer If-None-Match themselves.
+                if has_etag:
+                    passthrough = True
+                    await send(message)
+                    return
+
+                # Otherwise hold the start message until the body is complete
+                start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            etag = self._generate_etag(body)
+            etag_bytes = etag.encode("latin-1")
+
+            # If client's ETag matches, return 304 Not Modified
+            if client_etag and client_etag == etag:
+                await send({
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (b"cache-control", cache_control),
+                        (b"etag", etag_bytes),
+                        (b"vary", b"Authorization"),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            start_message["headers"].append((b"etag", etag_bytes))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _get_cache_strategy(self, path: str) -> Optional[dict]:
         """
         Get cache strategy for a given path.
-        Matches exact paths or path prefixes.
+        Matches exact paths, then the longest matching path prefix.
         """
         # Exact match
-        if path in self.cache_strategies:
-            return self.cache_strategies[path]
+        strategy = self.cache_strategies.get(path)
+        if strategy is not None:
+            return strategy
 
-        # Prefix match (for dynamic routes like /api/v1/accounts/{id})
-        for pattern, strategy in self.cache_strategies.items():
+        # Longest-prefix match (for dynamic routes like /api/v1/accounts/{id})
+        for pattern, strategy in self._prefixes:
             if path.startswith(pattern):
                 return strategy
 
@@ -123,8 +183,11 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
     def _generate_etag(self, content: bytes) -> str:
         """
         Generate an ETag from response content.
-        Uses MD5 hash for simplicity (not cryptographic use).
+        Uses BLAKE3 (SIMD-accelerated) when installed, MD5 otherwise.
+        Not a cryptographic use either way.
         """
+        if _blake3 is not None:
+            return f'"{_blake3(content).hexdigest(length=16)}"'
         return f'"{hashlib.md5(content).hexdigest()}"'
 
 
@@ -1,22 +1,23 @@
 """Account endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.data.database import get_session
-from src.data.repositories import AccountRepository
+from src.data.database import get_async_session
+from src.data.repositories import AsyncAccountRepository
 from src.data.models import AccountModel
 from src.api.schemas import AccountCreate, AccountResponse
 from src.api.deps import get_workspace_id
+from src.api.etag import weak_etag, etag_matches, not_modified
 
 router = APIRouter()
 
 
 @router.post("", response_model=AccountResponse)
-def create_account(
+async def create_account(
     account: AccountCreate,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Create a new account in the current workspace"""
     db_account = AccountModel(
@@ -28,8 +29,8 @@ def create_account(
         starting_balance=account.starting_balance
     )
 
-    repo = AccountRepository(session)
-    repo.create(db_account)
+    repo = AsyncAccountRepository(session)
+    await repo.create(db_account)
 
     return {
         "id": db_account.id,
@@ -44,14 +45,14 @@ def create_account(
 
 
 @router.get("/{account_id}", response_model=AccountResponse)
-def get_account(
+async def get_account(
     account_id: str,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Get account by ID (scoped to workspace)"""
-    repo = AccountRepository(session)
-    account = repo.read_for_workspace(account_id, workspace_id)
+    repo = AsyncAccountRepository(session)
+    account = await repo.read_for_workspace(account_id, workspace_id)
 
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
@@ -69,39 +70,49 @@ def get_account(
 
 
 @router.get("")
-def list_accounts(
+async def list_accounts(
+    request: Request,
+    response: Response,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     """List all accounts in the current workspace"""
-    repo = AccountRepository(session)
-    accounts = repo.read_by_workspace(workspace_id)
+    repo = AsyncAccountRepository(session)
+
+    # Answer conditional requests from one aggregate query, before loading rows
+    last_updated, count = await repo.version_by_workspace(workspace_id)
+    etag = weak_etag("accounts", workspace_id, last_updated, count)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    rows = await repo.list_columns_by_workspace(workspace_id)
 
     return [
         {
-            "id": acc.id,
-            "name": acc.name,
-            "account_type": acc.type,
-            "currency": acc.account_currency,
-            "balance": float(acc.starting_balance or 0),
-            "starting_balance": float(acc.starting_balance or 0),
-            "institution": acc.institution,
-            "created_at": acc.created_at
+            "id": r.id,
+            "name": r.name,
+            "account_type": r.type,
+            "currency": r.account_currency,
+            "balance": r.balance,
+            "starting_balance": r.balance,
+            "institution": r.institution,
+            "created_at": r.created_at
         }
-        for acc in accounts
+        for r in rows
     ]
 
 
 @router.put("/{account_id}")
-def update_account(
+async def update_account(
     account_id: str,
     account_data: AccountCreate,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Update an account (scoped to workspace)"""
-    repo = AccountRepository(session)
-    account = repo.read_for_workspace(account_id, workspace_id)
+    repo = AsyncAccountRepository(session)
+    account = await repo.read_for_workspace(account_id, workspace_id)
 
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
@@ -112,7 +123,7 @@ def update_account(
     account.institution = account_data.institution
     account.starting_balance = account_data.starting_balance
 
-    repo.update(account)
+    await repo.update(account)
     return {
         "id": account.id,
         "name": account.name,
@@ -126,17 +137,17 @@ def update_account(
 
 
 @router.delete("/{account_id}")
-def delete_account(
+async def delete_account(
     account_id: str,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     """Delete an account (scoped to workspace)"""
-    repo = AccountRepository(session)
-    account = repo.read_for_workspace(account_id, workspace_id)
+    repo = AsyncAccountRepository(session)
+    account = await repo.read_for_workspace(account_id, workspace_id)
 
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    repo.delete(account_id)
+    await repo.delete(account_id)
     return {"message": "Account deleted"}
@@ -1,43 +1,87 @@
 """Admin panel API routes"""
 
-import json
 import logging
-from typing import Optional, List
+from enum import Enum
+from typing import AsyncIterator, Callable, Optional, List
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from urllib.parse import quote
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationInfo, field_validator
+
+from config.settings import JWT_SECRET, REDIS_URL, TRUSTED_PROXIES
 
 logger = logging.getLogger(__name__)
 
-from src.data.database import get_session
+from src.data.database import SessionLocal, get_async_session, get_session
 from src.data.models import UserModel
 from src.data.admin_repository import AdminRepository
 from src.services.firebase_service import delete_firebase_user_by_uid, delete_firebase_user_by_email
 from src.data.audit_repository import AuditLogRepository
+from src.data.bug_repository import BugReportRepository
+from src.data.repositories import UserRepository
 from src.api.admin_deps import require_admin
+from src.api.etag import etag_matches, not_modified
+from src.api.middleware import invalidate_disabled_cache
+from src.services.auth_service import AuthService, JWT_ALGORITHM, JWT_PRIVATE_KEY, JWT_PUBLIC_KEY
+from src.services.cache_service import RateLimiter, RedisJSONCache, TTLMemo
+
+# Every admin route requires an admin; handlers that need the admin user
+# itself still declare Depends(require_admin), which FastAPI resolves once.
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+# Media is fetched with ?token= (no Authorization header) and authorizes
+# inside the handler, so it lives on its own router
+media_router = APIRouter()
 
-router = APIRouter()
+# Cross-tenant aggregates change on the scale of minutes; cache them briefly
+ANALYTICS_CACHE_TTL = 60
+_analytics_cache = TTLMemo(maxsize=64, ttl=ANALYTICS_CACHE_TTL)
+# Shared across workers when REDIS_URL is set; None otherwise
+_shared_analytics_cache = RedisJSONCache.from_url(REDIS_URL)
+_ANALYTICS_CACHE_CONTROL = f"private, max-age={ANALYTICS_CACHE_TTL}, stale-while-revalidate={ANALYTICS_CACHE_TTL}"
+
+# Dashboard polling guard: per admin and endpoint, across open tabs
+_dashboard_limiter = RateLimiter(limit=30, window=60)
 
 
 # ── Response Schemas ──
 
 class AdminUserListItem(BaseModel):
+    # Validated straight from UserModel instances / list_users rows
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     email: str
     first_name: Optional[str] = None
     last_name: Optional[str] = None
-    auth_provider: str
-    profile_completed: bool
-    is_admin: bool
-    is_disabled: bool
+    auth_provider: str = "email"
+    profile_completed: bool = False
+    is_admin: bool = False
+    is_disabled: bool = False
     email_verified: bool = False
     phone_verified: bool = False
     address_country: Optional[str] = None
-    created_at: str
-    last_login_at: Optional[str] = None
+    created_at: datetime
+    last_login_at: Optional[datetime] = None
     login_count: int = 0
 
+    @field_validator(
+        "auth_provider", "profile_completed", "is_admin", "is_disabled",
+        "email_verified", "phone_verified", "login_count",
+        mode="before",
+    )
+    @classmethod
+    def _null_as_default(cls, value, info: ValidationInfo):
+        """Older rows may hold NULL in these columns; read that as the default"""
+        if value is None:
+            return cls.model_fields[info.field_name].default
+        return value
+
 
 class WorkspaceStats(BaseModel):
     workspace_id: str
@@ -62,9 +106,11 @@ class AdminUserDetail(AdminUserListItem):
 
 class PaginatedUserResponse(BaseModel):
     users: List[AdminUserListItem]
-    total: int
-    offset: int
+    total: Optional[int] = None  # only with include_total=true
+    offset: int  # deprecated, use next_cursor
     limit: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class SystemStatsResponse(BaseModel):
@@ -121,133 +167,223 @@ class AuditLogEntry(BaseModel):
     action: str
     target_type: Optional[str] = None
     target_id: Optional[str] = None
-    details: Optional[str] = None
+    details: Optional[dict] = None
     ip_address: Optional[str] = None
-    created_at: str
+    created_at: datetime
 
 
 class PaginatedAuditLogResponse(BaseModel):
     logs: List[AuditLogEntry]
-    total: int
-    offset: int
+    total: Optional[int] = None  # only with include_total=true
+    offset: int  # deprecated, use next_cursor
     limit: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 # ── Helpers ──
 
 def _get_client_ip(request: Request) -> str:
-    """Extract client IP from request"""
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
+    """Extract client IP from request.
 
+    X-Forwarded-For is only honored when the peer is in TRUSTED_PROXIES
+    (unset = never). Entries are walked from the right, since only the hops
+    our proxies appended can be trusted; the first untrusted one is the client.
+    """
+    ip = getattr(request.state, "client_ip", None)
+    if ip is not None:
+        return ip
+    ip = request.client.host if request.client else "unknown"
+    if ip in TRUSTED_PROXIES:
+        for hop in reversed(request.headers.get("X-Forwarded-For", "").split(",")):
+            hop = hop.strip()
+            if not hop:
+                continue
+            ip = hop
+            if hop not in TRUSTED_PROXIES:
+                break
+    # Cached for the rest of the request (scope state is shared)
+    request.state.client_ip = ip
+    return ip
+
+
+def _write_audit(**fields) -> None:
+    """Write an audit entry in its own session (runs as a background task)"""
+    try:
+        with SessionLocal() as db:
+            AuditLogRepository(db).create(**fields)
+    except Exception:
+        logger.exception("Failed to write audit log entry %s", fields.get("action"))
 
-def _user_to_list_item(user: UserModel) -> AdminUserListItem:
-    return AdminUserListItem(
-        id=user.id,
-        email=user.email,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        auth_provider=user.auth_provider or "email",
-        profile_completed=user.profile_completed or False,
-        is_admin=user.is_admin or False,
-        is_disabled=user.is_disabled or False,
-        email_verified=user.email_verified if hasattr(user, 'email_verified') else False,
-        phone_verified=user.phone_verified if hasattr(user, 'phone_verified') else False,
-        address_country=user.address_country,
-        created_at=user.created_at.isoformat() if user.created_at else "",
-        last_login_at=user.last_login_at.isoformat() if user.last_login_at else None,
-        login_count=user.login_count or 0,
-    )
+
+async def _run_admin_repo(session: AsyncSession, method: Callable, *args, **kwargs):
+    """
+    Run a (sync) AdminRepository method on the async session's connection.
+
+    run_sync drives the ORM through the async driver on the event loop, so
+    handlers don't occupy a threadpool worker while the query runs.
+    """
+    return await session.run_sync(lambda s: method(AdminRepository(s), *args, **kwargs))
+
+
+async def _cached_analytics(response: Response, key: tuple, session: AsyncSession, method: Callable, *args):
+    """
+    Serve an aggregate from the analytics caches and mark it client-cacheable.
+
+    Lookup order: in-process TTL cache, then Redis (if configured), then the
+    database; a computed value is written back to both.
+    """
+    response.headers["Cache-Control"] = _ANALYTICS_CACHE_CONTROL
+
+    async def compute():
+        redis_key = "admin:" + ":".join(str(part) for part in key)
+        if _shared_analytics_cache is not None:
+            value = await _shared_analytics_cache.get(redis_key)
+            if value is not None:
+                return value
+        value = await _run_admin_repo(session, method, *args)
+        if _shared_analytics_cache is not None:
+            await _shared_analytics_cache.set(redis_key, value, ANALYTICS_CACHE_TTL)
+        return value
+
+    return await _analytics_cache.aget_or_compute(key, compute)
+
+
+async def _invalidate_analytics() -> None:
+    """Drop cached aggregates after a user mutation (locally and in Redis)"""
+    _analytics_cache.clear()
+    if _shared_analytics_cache is not None:
+        await _shared_analytics_cache.delete_prefix("admin:")
+
+
+async def _limit_dashboard_polling(request: Request) -> None:
+    """Dependency: 429 with Retry-After once an admin polls an endpoint too often"""
+    retry_after = _dashboard_limiter.hit((request.state.user_id, request.url.path))
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+# Adapters are built once at import; each validates a whole payload in
+# one pydantic-core call
+_USER_LIST_ADAPTER = TypeAdapter(List[AdminUserListItem])
+_WS_STATS_ADAPTER = TypeAdapter(List[WorkspaceStats])
+_FEATURE_ADOPTION_ADAPTER = TypeAdapter(FeatureAdoption)
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a (large) response model straight to JSON bytes in pydantic-core.
+
+    Skips FastAPI's response_model round trip (validate, dump to Python
+    objects, re-encode); the route's response_model still documents the shape.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
 
 
 # ── Dashboard / Overview ──
 
-@router.get("/stats", response_model=SystemStatsResponse)
-def get_system_stats(
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+@router.get(
+    "/stats", response_model=SystemStatsResponse,
+    dependencies=[Depends(_limit_dashboard_polling)],
+)
+async def get_system_stats(
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Get system-wide statistics"""
-    repo = AdminRepository(session)
-    return repo.get_system_stats()
+    return await _cached_analytics(response, ("stats",), session, AdminRepository.get_system_stats)
 
 
-@router.get("/growth/signups", response_model=List[TimeSeriesPoint])
-def get_signup_growth(
+@router.get(
+    "/growth/signups", response_model=List[TimeSeriesPoint],
+    dependencies=[Depends(_limit_dashboard_polling)],
+)
+async def get_signup_growth(
+    response: Response,
     days: int = Query(default=90, ge=7, le=365),
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Daily signup counts"""
-    repo = AdminRepository(session)
-    return repo.get_signups_by_period(days)
+    return await _cached_analytics(response, ("signups", days), session, AdminRepository.get_signups_by_period, days)
 
 
-@router.get("/growth/dau", response_model=List[TimeSeriesPoint])
-def get_daily_active_users(
+@router.get(
+    "/growth/dau", response_model=List[TimeSeriesPoint],
+    dependencies=[Depends(_limit_dashboard_polling)],
+)
+async def get_daily_active_users(
+    response: Response,
     days: int = Query(default=30, ge=7, le=365),
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Daily active users"""
-    repo = AdminRepository(session)
-    return repo.get_dau(days)
+    return await _cached_analytics(response, ("dau", days), session, AdminRepository.get_dau, days)
 
 
-@router.get("/growth/mau", response_model=List[TimeSeriesPoint])
-def get_monthly_active_users(
+@router.get(
+    "/growth/mau", response_model=List[TimeSeriesPoint],
+    dependencies=[Depends(_limit_dashboard_polling)],
+)
+async def get_monthly_active_users(
+    response: Response,
     months: int = Query(default=12, ge=1, le=36),
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Monthly active users"""
-    repo = AdminRepository(session)
-    return repo.get_mau(months)
+    return await _cached_analytics(response, ("mau", months), session, AdminRepository.get_mau, months)
 
 
 # ── User Management ──
 
 @router.get("/users", response_model=PaginatedUserResponse)
-def list_users(
+async def list_users(
     search: Optional[str] = None,
     auth_provider: Optional[str] = None,
     is_admin: Optional[bool] = None,
     is_disabled: Optional[bool] = None,
-    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
+    offset: int = Query(default=0, ge=0, deprecated=True),
     limit: int = Query(default=50, ge=1, le=200),
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    include_total: bool = False,
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """List all users with search and filters"""
-    repo = AdminRepository(session)
-    users, total = repo.list_users(
-        search=search, auth_provider=auth_provider,
-        is_admin=is_admin, is_disabled=is_disabled,
-        offset=offset, limit=limit,
-    )
-    return PaginatedUserResponse(
-        users=[_user_to_list_item(u) for u in users],
+    """List all users with search and filters (paginate with next_cursor)"""
+    try:
+        users, total, next_cursor = await _run_admin_repo(
+            session, AdminRepository.list_users,
+            search=search, auth_provider=auth_provider,
+            is_admin=is_admin, is_disabled=is_disabled,
+            offset=offset, limit=limit, cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    page = PaginatedUserResponse.model_construct(
+        users=_USER_LIST_ADAPTER.validate_python(users),
         total=total, offset=offset, limit=limit,
+        has_more=next_cursor is not None, next_cursor=next_cursor,
     )
+    return _json_response(page)
 
 
 @router.get("/users/{user_id}", response_model=AdminUserDetail)
-def get_user_detail(
+async def get_user_detail(
     user_id: str,
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Get detailed user info (never includes password)"""
-    repo = AdminRepository(session)
-    user = repo.get_user_detail(user_id)
-    if not user:
+    result = await _run_admin_repo(session, AdminRepository.get_user_detail_with_stats, user_id)
+    if not result:
         raise HTTPException(status_code=404, detail="User not found")
+    user, ws_stats = result
 
-    ws_stats = repo.get_user_workspace_stats(user_id)
-
-    return AdminUserDetail(
+    # Built from the ORM row we just loaded (NULLs already defaulted
+    # below), so skip re-validation and serialize directly
+    detail = AdminUserDetail.model_construct(
         id=user.id,
         email=user.email,
         first_name=user.first_name,
@@ -257,290 +393,302 @@ def get_user_detail(
         is_admin=user.is_admin or False,
         is_disabled=user.is_disabled or False,
         address_country=user.address_country,
-        created_at=user.created_at.isoformat() if user.created_at else "",
-        last_login_at=user.last_login_at.isoformat() if user.last_login_at else None,
+        created_at=user.created_at,
+        last_login_at=user.last_login_at,
         login_count=user.login_count or 0,
         date_of_birth=user.date_of_birth,
-        nationalities=json.loads(user.nationalities or '[]'),
-        tax_residencies=json.loads(user.tax_residencies or '[]'),
+        nationalities=user.nationalities or [],
+        tax_residencies=user.tax_residencies or [],
         phone_country_code=user.phone_country_code,
         phone_number=user.phone_number,
         address_city=user.address_city,
         address_state=user.address_state,
         address_postal_code=user.address_postal_code,
-        workspaces=[WorkspaceStats(**ws) for ws in ws_stats.get("workspaces", [])],
+        workspaces=_WS_STATS_ADAPTER.validate_python(ws_stats),
     )
+    return _json_response(detail)
 
 
 @router.post("/users/{user_id}/disable")
-def disable_user(
+async def disable_user(
     user_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Disable a user account"""
-    if user_id == admin.id:
-        raise HTTPException(status_code=400, detail="Cannot disable your own account")
-
-    repo = AdminRepository(session)
-    user = repo.disable_user(user_id)
-    if not user:
+    email = await _run_admin_repo(session, AdminRepository.disable_user, user_id, actor_id=admin.id)
+    if email is None:
+        if user_id == admin.id:
+            raise HTTPException(status_code=400, detail="Cannot disable your own account")
         raise HTTPException(status_code=404, detail="User not found")
+    invalidate_disabled_cache(user_id)
+    await _invalidate_analytics()
 
-    audit = AuditLogRepository(session)
-    audit.create(
+    background_tasks.add_task(
+        _write_audit,
         actor_user_id=admin.id,
         action="admin.user.disable",
         target_type="user",
         target_id=user_id,
-        details=json.dumps({"email": user.email}),
+        details={"email": email},
         ip_address=_get_client_ip(request),
     )
-    return {"message": f"User {user.email} disabled"}
+    return {"message": f"User {email} disabled"}
 
 
 @router.post("/users/{user_id}/enable")
-def enable_user(
+async def enable_user(
     user_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Enable a user account"""
-    repo = AdminRepository(session)
-    user = repo.enable_user(user_id)
-    if not user:
+    email = await _run_admin_repo(session, AdminRepository.enable_user, user_id)
+    if email is None:
         raise HTTPException(status_code=404, detail="User not found")
+    invalidate_disabled_cache(user_id)
+    await _invalidate_analytics()
 
-    audit = AuditLogRepository(session)
-    audit.create(
+    background_tasks.add_task(
+        _write_audit,
         actor_user_id=admin.id,
         action="admin.user.enable",
         target_type="user",
         target_id=user_id,
-        details=json.dumps({"email": user.email}),
+        details={"email": email},
         ip_address=_get_client_ip(request),
     )
-    return {"message": f"User {user.email} enabled"}
+    return {"message": f"User {email} enabled"}
 
 
 @router.post("/users/{user_id}/promote")
-def promote_user(
+async def promote_user(
     user_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Promote a user to admin"""
-    repo = AdminRepository(session)
-    user = repo.promote_to_admin(user_id)
-    if not user:
+    email = await _run_admin_repo(session, AdminRepository.promote_to_admin, user_id)
+    if email is None:
         raise HTTPException(status_code=404, detail="User not found")
+    await _invalidate_analytics()
 
-    audit = AuditLogRepository(session)
-    audit.create(
+    background_tasks.add_task(
+        _write_audit,
         actor_user_id=admin.id,
         action="admin.user.promote",
         target_type="user",
         target_id=user_id,
-        details=json.dumps({"email": user.email}),
+        details={"email": email},
         ip_address=_get_client_ip(request),
     )
-    return {"message": f"User {user.email} promoted to admin"}
+    return {"message": f"User {email} promoted to admin"}
 
 
 @router.post("/users/{user_id}/demote")
-def demote_user(
+async def demote_user(
     user_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Remove admin role from a user"""
-    if user_id == admin.id:
-        raise HTTPException(status_code=400, detail="Cannot demote yourself")
-
-    repo = AdminRepository(session)
-    user = repo.demote_from_admin(user_id)
-    if not user:
+    email = await _run_admin_repo(session, AdminRepository.demote_from_admin, user_id, actor_id=admin.id)
+    if email is None:
+        if user_id == admin.id:
+            raise HTTPException(status_code=400, detail="Cannot demote yourself")
         raise HTTPException(status_code=404, detail="User not found")
+    await _invalidate_analytics()
 
-    audit = AuditLogRepository(session)
-    audit.create(
+    background_tasks.add_task(
+        _write_audit,
         actor_user_id=admin.id,
         action="admin.user.demote",
         target_type="user",
         target_id=user_id,
-        details=json.dumps({"email": user.email}),
+        details={"email": email},
         ip_address=_get_client_ip(request),
     )
-    return {"message": f"User {user.email} demoted from admin"}
+    return {"message": f"User {email} demoted from admin"}
 
 
 @router.delete("/users/{user_id}")
-def delete_user(
+async def delete_user(
     user_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Permanently delete a user and all their data"""
-    if user_id == admin.id:
-        raise HTTPException(status_code=400, detail="Cannot delete yourself")
-
-    repo = AdminRepository(session)
-    user = repo.get_user_detail(user_id)
-    if not user:
+    deleted = await _run_admin_repo(session, AdminRepository.delete_user, user_id, actor_id=admin.id)
+    if deleted is None:
+        if user_id == admin.id:
+            raise HTTPException(status_code=400, detail="Cannot delete yourself")
         raise HTTPException(status_code=404, detail="User not found")
 
-    email = user.email
-    audit = AuditLogRepository(session)
-    audit.create(
+    email, firebase_uid = deleted
+    background_tasks.add_task(
+        _write_audit,
         actor_user_id=admin.id,
         action="admin.user.delete",
         target_type="user",
         target_id=user_id,
-        details=json.dumps({"email": email}),
+        details={"email": email},
         ip_address=_get_client_ip(request),
     )
 
-    if user.firebase_uid:
-        delete_firebase_user_by_uid(user.firebase_uid)
+    # Firebase Admin SDK calls are blocking network I/O
+    if firebase_uid:
+        await run_in_threadpool(delete_firebase_user_by_uid, firebase_uid)
     else:
-        delete_firebase_user_by_email(user.email)
+        await run_in_threadpool(delete_firebase_user_by_email, email)
 
-    repo.delete_user(user_id)
+    invalidate_disabled_cache(user_id)
+    await _invalidate_analytics()
     return {"message": f"User {email} permanently deleted"}
 
 
 # ── Analytics ──
 
 @router.get("/analytics/auth-providers", response_model=List[AuthProviderBreakdown])
-def get_auth_provider_breakdown(
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+async def get_auth_provider_breakdown(
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Auth provider breakdown (email vs Google)"""
-    repo = AdminRepository(session)
-    return repo.get_auth_provider_breakdown()
+    return await _cached_analytics(response, ("auth-providers",), session, AdminRepository.get_auth_provider_breakdown)
 
 
 @router.get("/analytics/profile-completion")
-def get_profile_completion(
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+async def get_profile_completion(
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Profile completion rates"""
-    repo = AdminRepository(session)
-    return repo.get_profile_completion_stats()
+    return await _cached_analytics(response, ("profile-completion",), session, AdminRepository.get_profile_completion_stats)
 
 
 @router.get("/analytics/geographic")
-def get_geographic_distribution(
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+async def get_geographic_distribution(
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """User geographic distribution"""
-    repo = AdminRepository(session)
-    return repo.get_geographic_distribution()
+    return await _cached_analytics(response, ("geographic",), session, AdminRepository.get_geographic_distribution)
 
 
 @router.get("/analytics/age-breakdown")
-def get_age_breakdown(
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+async def get_age_breakdown(
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """User age distribution by bracket"""
-    repo = AdminRepository(session)
-    return repo.get_age_breakdown()
+    return await _cached_analytics(response, ("age-breakdown",), session, AdminRepository.get_age_breakdown)
 
 
 @router.get("/analytics/retention", response_model=List[RetentionCohort])
-def get_retention_cohorts(
+async def get_retention_cohorts(
     months: int = Query(default=6, ge=1, le=24),
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Monthly cohort retention"""
-    repo = AdminRepository(session)
-    return repo.get_retention_cohorts(months)
+    return await _run_admin_repo(session, AdminRepository.get_retention_cohorts, months)
 
 
 @router.get("/analytics/funnel", response_model=ConversionFunnel)
-def get_conversion_funnel(
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+async def get_conversion_funnel(
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Conversion funnel: signup -> profile -> active"""
-    repo = AdminRepository(session)
-    return repo.get_conversion_funnel()
+    return await _cached_analytics(response, ("funnel",), session, AdminRepository.get_conversion_funnel)
 
 
 @router.get("/analytics/feature-adoption", response_model=FeatureAdoption)
-def get_feature_adoption(
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+async def get_feature_adoption(
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Feature adoption rates"""
-    repo = AdminRepository(session)
-    data = repo.get_feature_adoption()
-    return FeatureAdoption(
-        projections=FeatureAdoptionItem(**data["projections"]),
-        custom_funds=FeatureAdoptionItem(**data["custom_funds"]),
-        recurring_transactions=FeatureAdoptionItem(**data["recurring_transactions"]),
-    )
+    data = await _cached_analytics(response, ("feature-adoption",), session, AdminRepository.get_feature_adoption)
+    return _FEATURE_ADOPTION_ADAPTER.validate_python(data)
 
 
 # ── Audit Log ──
 
 @router.get("/audit-logs", response_model=PaginatedAuditLogResponse)
-def list_audit_logs(
+async def list_audit_logs(
     action_prefix: Optional[str] = None,
     actor_user_id: Optional[str] = None,
     target_type: Optional[str] = None,
     target_id: Optional[str] = None,
     days: int = Query(default=30, ge=1, le=365),
-    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
+    offset: int = Query(default=0, ge=0, deprecated=True),
     limit: int = Query(default=100, ge=1, le=500),
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    include_total: bool = False,
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """List audit log entries with filters"""
-    audit_repo = AuditLogRepository(session)
-    logs, total = audit_repo.list_logs(
-        action_prefix=action_prefix,
-        actor_user_id=actor_user_id,
-        target_type=target_type,
-        target_id=target_id,
-        days=days, offset=offset, limit=limit,
+    """List audit log entries with filters (paginate with next_cursor)"""
+    def load(sync_session: Session):
+        logs, total, next_cursor = AuditLogRepository(sync_session).list_logs(
+            action_prefix=action_prefix,
+            actor_user_id=actor_user_id,
+            target_type=target_type,
+            target_id=target_id,
+            days=days, offset=offset, limit=limit, cursor=cursor,
+            include_total=include_total,
+        )
+        # Enrich with actor email (one IN query for all actors on the page)
+        actor_emails = UserRepository(sync_session).read_emails(
+            {log.actor_user_id for log in logs}
+        )
+        return logs, total, next_cursor, actor_emails
+
+    try:
+        logs, total, next_cursor, actor_emails = await session.run_sync(load)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Stream the page row by row (same shape as PaginatedAuditLogResponse)
+    # rather than building the entry list and then the full JSON body
+    trailer = {
+        "total": total, "offset": offset, "limit": limit,
+        "has_more": next_cursor is not None, "next_cursor": next_cursor,
+    }
+    return StreamingResponse(
+        _stream_audit_logs(logs, actor_emails, trailer),
+        media_type="application/json",
     )
 
-    # Enrich with actor email
-    from src.data.repositories import UserRepository
-    user_repo = UserRepository(session)
-    actor_cache: dict = {}
 
-    entries = []
+async def _stream_audit_logs(logs, actor_emails: dict, trailer: dict) -> AsyncIterator[bytes]:
+    """Yield {"logs": [...], **trailer} as JSON, one entry per chunk"""
+    yield b'{"logs":['
+    sep = b""
     for log in logs:
-        if log.actor_user_id not in actor_cache:
-            actor = user_repo.read(log.actor_user_id)
-            actor_cache[log.actor_user_id] = actor.email if actor else "unknown"
-        entries.append(AuditLogEntry(
-            id=log.id,
-            actor_user_id=log.actor_user_id,
-            actor_email=actor_cache[log.actor_user_id],
-            action=log.action,
-            target_type=log.target_type,
-            target_id=log.target_id,
-            details=log.details,
-            ip_address=log.ip_address,
-            created_at=log.created_at.isoformat() if log.created_at else "",
-        ))
-
-    return PaginatedAuditLogResponse(
-        logs=entries, total=total, offset=offset, limit=limit,
-    )
+        yield sep + orjson.dumps({
+            "id": log.id,
+            "actor_user_id": log.actor_user_id,
+            "actor_email": actor_emails.get(log.actor_user_id, "unknown"),
+            "action": log.action,
+            "target_type": log.target_type,
+            "target_id": log.target_id,
+            "details": log.details,
+            "ip_address": log.ip_address,
+            "created_at": log.created_at,
+        })
+        sep = b","
+    # Splice the trailer object's fields in after the array
+    yield b"]," + orjson.dumps(trailer)[1:]
 
 
 # ── Bug Reports (Admin) ──
@@ -573,78 +721,86 @@ class AdminBugReportDetail(AdminBugReportListItem):
 class PaginatedBugReportResponse(BaseModel):
     reports: List[AdminBugReportListItem]
     total: int
-    offset: int
+    offset: int  # deprecated, use next_cursor
     limit: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+class BugStatus(str, Enum):
+    open = "open"
+    in_progress = "in_progress"
+    resolved = "resolved"
 
 
 class UpdateBugStatusRequest(BaseModel):
-    status: str
+    status: BugStatus  # anything else is rejected with a 422
 
 
 @router.get("/bugs", response_model=PaginatedBugReportResponse)
-def list_bug_reports(
+async def list_bug_reports(
     status_filter: Optional[str] = Query(default=None),
-    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
+    offset: int = Query(default=0, ge=0, deprecated=True),
     limit: int = Query(default=50, ge=1, le=200),
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """List all bug reports (admin)"""
-    from src.data.bug_repository import BugReportRepository
-    from src.data.repositories import UserRepository
-
-    repo = BugReportRepository(session)
-    reports, total = repo.list_all(
-        status_filter=status_filter,
-        offset=offset,
-        limit=limit,
-    )
+    """List all bug reports (admin, paginate with next_cursor)"""
+    def load(sync_session: Session):
+        reports, total, next_cursor = BugReportRepository(sync_session).list_all(
+            status_filter=status_filter,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+        )
+        # Reporter emails for the whole page in one IN query
+        user_emails = UserRepository(sync_session).read_emails({r.user_id for r, _ in reports})
+        return reports, total, next_cursor, user_emails
 
-    user_repo = UserRepository(session)
-    user_cache: dict = {}
+    try:
+        reports, total, next_cursor, user_emails = await session.run_sync(load)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     items = []
-    for r in reports:
-        if r.user_id not in user_cache:
-            user = user_repo.read(r.user_id)
-            user_cache[r.user_id] = user.email if user else "unknown"
-        items.append(AdminBugReportListItem(
+    for r, media_count in reports:
+        items.append(AdminBugReportListItem.model_construct(
             id=r.id,
             user_id=r.user_id,
-            user_email=user_cache[r.user_id],
+            user_email=user_emails.get(r.user_id, "unknown"),
             title=r.title,
             description=r.description,
             status=r.status,
-            media_count=len(r.media) if r.media else 0,
+            media_count=media_count,
             created_at=r.created_at.isoformat(),
             updated_at=r.updated_at.isoformat(),
             resolved_at=r.resolved_at.isoformat() if r.resolved_at else None,
         ))
 
-    return PaginatedBugReportResponse(
+    page = PaginatedBugReportResponse.model_construct(
         reports=items, total=total, offset=offset, limit=limit,
+        has_more=next_cursor is not None, next_cursor=next_cursor,
     )
+    return _json_response(page)
 
 
 @router.get("/bugs/{bug_id}", response_model=AdminBugReportDetail)
-def get_bug_report_detail(
+async def get_bug_report_detail(
     bug_id: str,
-    admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Get bug report details with media info (admin)"""
-    from src.data.bug_repository import BugReportRepository
-    from src.data.repositories import UserRepository
+    def load(sync_session: Session):
+        report = BugReportRepository(sync_session).get_by_id(bug_id)
+        if not report:
+            return None, None
+        return report, UserRepository(sync_session).read(report.user_id)
 
-    repo = BugReportRepository(session)
-    report = repo.get_by_id(bug_id)
+    report, user = await session.run_sync(load)
     if not report:
         raise HTTPException(status_code=404, detail="Bug report not found")
 
-    user_repo = UserRepository(session)
-    user = user_repo.read(report.user_id)
-
-    return AdminBugReportDetail(
+    detail = AdminBugReportDetail.model_construct(
         id=report.id,
         user_id=report.user_id,
         user_email=user.email if user else "unknown",
@@ -656,7 +812,7 @@ def get_bug_report_detail(
         updated_at=report.updated_at.isoformat(),
         resolved_at=report.resolved_at.isoformat() if report.resolved_at else None,
         media=[
-            AdminBugReportMediaInfo(
+            AdminBugReportMediaInfo.model_construct(
                 id=m.id,
                 filename=m.filename,
                 content_type=m.content_type,
@@ -666,60 +822,94 @@ def get_bug_report_detail(
             for m in report.media
         ],
     )
+    return _json_response(detail)
 
 
 @router.patch("/bugs/{bug_id}")
-def update_bug_status(
+async def update_bug_status(
     bug_id: str,
     body: UpdateBugStatusRequest,
     request: Request,
+    background_tasks: BackgroundTasks,
     admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Update bug report status (admin)"""
-    from src.data.bug_repository import BugReportRepository
-    from src.data.repositories import UserRepository
     from src.services.email_service import send_bug_report_resolved
 
-    valid_statuses = {'open', 'in_progress', 'resolved'}
-    if body.status not in valid_statuses:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid status. Must be one of: {valid_statuses}"
-        )
+    new_status = body.status.value
+    resolved = body.status is BugStatus.resolved
+
+    def update(sync_session: Session):
+        repo = BugReportRepository(sync_session)
+        report = repo.update_status(bug_id, new_status)
+        if not report:
+            return None, None
+        if not resolved:
+            return report, None
+        # If resolved, delete media and look up the reporter to notify
+        repo.delete_media_for_report(bug_id)
+        try:
+            user = UserRepository(sync_session).read(report.user_id)
+        except Exception:
+            user = None
+        return report, user.email if user else None
 
-    repo = BugReportRepository(session)
-    report = repo.update_status(bug_id, body.status)
+    report, reporter_email = await session.run_sync(update)
     if not report:
         raise HTTPException(status_code=404, detail="Bug report not found")
 
-    # If resolved, delete media and send email
-    if body.status == 'resolved':
-        repo.delete_media_for_report(bug_id)
-
-        try:
-            user_repo = UserRepository(session)
-            user = user_repo.read(report.user_id)
-            if user and user.email:
-                send_bug_report_resolved(user.email, report.title)
-        except Exception:
-            pass
+    # The email send blocks, so it runs after the response (in the threadpool)
+    if reporter_email:
+        background_tasks.add_task(send_bug_report_resolved, reporter_email, report.title)
 
-    # Audit log
-    audit = AuditLogRepository(session)
-    audit.create(
+    background_tasks.add_task(
+        _write_audit,
         actor_user_id=admin.id,
-        action=f"admin.bug.{body.status}",
+        action=f"admin.bug.{new_status}",
         target_type="bug_report",
         target_id=bug_id,
-        details=json.dumps({"title": report.title, "new_status": body.status}),
+        details={"title": report.title, "new_status": new_status},
         ip_address=_get_client_ip(request),
     )
 
-    return {"message": f"Bug report status updated to {body.status}"}
+    return {"message": f"Bug report status updated to {new_status}"}
+
 
+_MEDIA_CHUNK_SIZE = 64 * 1024
 
-@router.get("/bugs/{bug_id}/media/{media_id}")
+
+def _inline_disposition(filename: str) -> str:
+    """
+    Content-Disposition for a stored filename.
+
+    Headers must be Latin-1 encodable, so non-ASCII names (e.g. macOS
+    screenshots use U+202F before AM/PM) go in RFC 5987 filename*, with
+    an ASCII-replaced filename= for old clients.
+    """
+    if filename.isascii():
+        escaped = filename.replace('"', '\\"')
+        return f'inline; filename="{escaped}"'
+    fallback = filename.encode("ascii", "replace").decode("ascii").replace('"', '\\"')
+    return f"inline; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+
+# Decodes ?token= for media links (same key setup as AuthMiddleware)
+_media_auth = AuthService(
+    secret_key=JWT_SECRET,
+    algorithm=JWT_ALGORITHM,
+    private_key=JWT_PRIVATE_KEY,
+    public_key=JWT_PUBLIC_KEY,
+)
+
+
+async def _iter_chunks(view: memoryview) -> AsyncIterator[bytes]:
+    """Yield a buffer in fixed-size chunks (one small copy per chunk)"""
+    for start in range(0, view.nbytes, _MEDIA_CHUNK_SIZE):
+        yield view[start:start + _MEDIA_CHUNK_SIZE].tobytes()
+
+
+@media_router.get("/bugs/{bug_id}/media/{media_id}")
 def serve_bug_media(
     request: Request,
     bug_id: str,
@@ -733,20 +923,12 @@ def serve_bug_media(
     The query-param path allows fetch() without the Authorization header,
     avoiding CORS preflight issues on cross-origin deployments.
     """
-    import os
-    from fastapi.responses import Response
-    from src.data.bug_repository import BugReportRepository
-    from src.data.repositories import UserRepository
-    from src.services.auth_service import AuthService
-
     try:
         # ── Authenticate: header first, then query-param fallback ──
         user_id = getattr(request.state, "user_id", None)
 
         if not user_id and token:
-            secret = os.environ.get("JWT_SECRET", "dev-secret-key-change-in-production")
-            auth_svc = AuthService(secret_key=secret)
-            result = auth_svc.decode_access_token(token)
+            result = _media_auth.decode_access_token(token)
             if result:
                 user_id = str(result[0])
 
@@ -761,22 +943,28 @@ def serve_bug_media(
 
         # ── Serve the file ──
         repo = BugReportRepository(session)
-        media = repo.get_media(media_id)
+        media = repo.get_media_meta(media_id)
         if not media or media.bug_report_id != bug_id:
             raise HTTPException(status_code=404, detail="Media not found")
 
-        file_content = bytes(media.file_data) if media.file_data else b""
-        # HTTP headers must be Latin-1 encodable; replace non-ASCII chars
-        # (e.g. macOS screenshots use U+202F narrow no-break space before AM/PM)
-        safe_filename = media.filename.encode("ascii", "replace").decode("ascii").replace('"', '\\"')
+        # Media rows are never modified after upload, so the id is a
+        # sufficient validator; revalidation skips loading the BLOB entirely
+        etag = f'"{media.id}"'
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        # Stream the BLOB in slices of a memoryview instead of copying
+        # the whole thing into a new bytes object first
+        file_view = memoryview(repo.get_media_data(media_id) or b"")
 
-        return Response(
-            content=file_content,
+        return StreamingResponse(
+            _iter_chunks(file_view),
             media_type=media.content_type,
             headers={
-                "Content-Disposition": f'inline; filename="{safe_filename}"',
-                "Content-Length": str(len(file_content)),
-                "Cache-Control": "private, max-age=3600",
+                "Content-Disposition": _inline_disposition(media.filename),
+                "Content-Length": str(file_view.nbytes),
+                "Cache-Control": "private, max-age=31536000, immutable",
+                "ETag": etag,
             },
         )
     except HTTPException:
@@ -787,30 +975,34 @@ def serve_bug_media(
 
 
 @router.delete("/bugs/{bug_id}")
-def delete_bug_report(
+async def delete_bug_report(
     bug_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     admin: UserModel = Depends(require_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Permanently delete a bug report and its media (admin)"""
-    from src.data.bug_repository import BugReportRepository
-
-    repo = BugReportRepository(session)
-    report = repo.get_by_id(bug_id)
-    if not report:
+    def delete(sync_session: Session) -> Optional[str]:
+        repo = BugReportRepository(sync_session)
+        report = repo.get_by_id(bug_id)
+        if not report:
+            return None
+        title = report.title
+        repo.delete_report(bug_id)
+        return title
+
+    title = await session.run_sync(delete)
+    if title is None:
         raise HTTPException(status_code=404, detail="Bug report not found")
 
-    title = report.title
-    repo.delete_report(bug_id)
-
-    audit = AuditLogRepository(session)
-    audit.create(
+    background_tasks.add_task(
+        _write_audit,
         actor_user_id=admin.id,
         action="admin.bug.delete",
         target_type="bug_report",
         target_id=bug_id,
-        details=json.dumps({"title": title}),
+        details={"title": title},
         ip_address=_get_client_ip(request),
     )
 
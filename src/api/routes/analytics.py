@@ -1,17 +1,24 @@
 """Analytics and reporting endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Float, Integer, Numeric, String, column, func, and_, or_, case, extract, select, table
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Dict, List, Optional
 from calendar import monthrange
+from functools import lru_cache
 from pydantic import BaseModel
 
-from src.data.database import get_session
-from src.data.models import TransactionModel, CategoryModel, SubcategoryModel, FundModel, FundAccountLinkModel, PostingModel, AccountModel, ScenarioModel, WorkspaceModel
-from src.api.deps import get_workspace_id
+from config.settings import ANALYTICS_MONTHLY_TOTALS_VIEW, REDIS_URL
+from src.data.models import TransactionModel, CategoryModel, SubcategoryModel, FundModel, FundAccountLinkModel, FundAllocationOverrideModel, PostingModel, AccountModel, ScenarioModel, WorkspaceModel
+from src.data.database import get_async_session
+from src.data.repositories import ScenarioRepository, FundRepository, FundAllocationOverrideRepository
+from src.api.deps import Scope, get_scope, get_workspace_id
+from src.api.etag import weak_etag, etag_matches, not_modified
+from src.services.cache_service import RedisJSONCache, TTLMemo
+from src.services.price_service import PriceService
 from src.api.schemas import (
     FundAllocationOverrideCreate,
     FundMonthlyLedgerRow, FundLedgerResponse, AccountTrackerRow,
@@ -24,6 +31,12 @@ import json
 
 router = APIRouter()
 
+# Income allocation JSON bodies, keyed by the ETag of everything they read
+# (see _allocation_fingerprint), so writes never serve a stale table
+ALLOCATION_CACHE_TTL = 60  # seconds
+_allocation_cache = TTLMemo(maxsize=1024, ttl=ALLOCATION_CACHE_TTL)
+_shared_allocation_cache = RedisJSONCache.from_url(REDIS_URL)
+
 
 # ─── Expense Split schemas ───
 
@@ -138,14 +151,50 @@ class MonthlyIncomeSplit(BaseModel):
 
 # ─── Helpers ───
 
-def _get_month_range(year: int, month: int):
-    """Return (start_date, end_date) for a given year/month."""
+def _json_response(model: BaseModel, etag: Optional[str] = None) -> Response:
+    """Serialize a response model straight to JSON bytes (no response_model round trip)"""
+    headers = {"ETag": etag} if etag else None
+    return Response(content=model.model_dump_json(), media_type="application/json", headers=headers)
+
+
+def _version_parts(workspace_id: str, models) -> list:
+    """COUNT(id) and MAX(updated_at) scalar subqueries for each workspace-scoped model."""
+    parts = []
+    for model in models:
+        parts.append(select(func.count(model.id)).where(model.workspace_id == workspace_id).scalar_subquery())
+        parts.append(select(func.max(model.updated_at)).where(model.workspace_id == workspace_id).scalar_subquery())
+    return parts
+
+
+def _split_fingerprint(session: Session, workspace_id: str) -> tuple:
+    """Row counts and last-modified times of every table the split endpoints read.
+
+    One round trip, same scheme as _allocation_fingerprint.
+    """
+    parts = _version_parts(workspace_id, (TransactionModel, CategoryModel, FundModel))
+    # Subcategories are scoped through their category
+    for agg in (func.count(SubcategoryModel.id), func.max(SubcategoryModel.updated_at)):
+        parts.append(
+            select(agg).join(CategoryModel, SubcategoryModel.category_id == CategoryModel.id)
+            .where(CategoryModel.workspace_id == workspace_id).scalar_subquery()
+        )
+    parts += _view_version_parts(session)
+    return tuple(session.execute(select(*parts)).one())
+
+
+@lru_cache(maxsize=1024)
+def _month_bounds(year: int, month: int):
+    """Return the half-open range [start_of_month, start_of_next_month) for a given year/month.
+
+    Filter with ``timestamp >= start`` and ``timestamp < end`` so sub-second
+    timestamps on the last day are not dropped.
+    """
     start = datetime(year, month, 1)
-    _, last_day = monthrange(year, month)
-    end = datetime(year, month, last_day, 23, 59, 59)
+    end = datetime(year + (month == 12), month % 12 + 1, 1)
     return start, end
 
 
+@lru_cache(maxsize=1024)
 def _prev_month(year: int, month: int):
     """Return (year, month) for the previous month."""
     if month == 1:
@@ -170,6 +219,10 @@ def _compute_self_funding_metadata(funds, wc_fund):
         if f.id == wc_fund.id:
             continue
 
+        # Most funds share no account with WC; skip them before touching links
+        if wc_account_ids.isdisjoint(link.account_id for link in f.account_links):
+            continue
+
         overlapping_ids = []
         overlapping_names = []
         self_funding_pct = Decimal(0)
@@ -178,12 +231,12 @@ def _compute_self_funding_metadata(funds, wc_fund):
             if link.account_id in wc_account_ids:
                 overlapping_ids.append(link.account_id)
                 overlapping_names.append(link.account.name)
-                alloc_pct = Decimal(str(
+                # Numeric column: already a Decimal
+                self_funding_pct += (
                     link.allocation_percentage
                     if link.allocation_percentage is not None
-                    else 100
-                ))
-                self_funding_pct += alloc_pct
+                    else Decimal(100)
+                )
 
         if overlapping_ids:
             result[f.id] = {
@@ -197,12 +250,23 @@ def _compute_self_funding_metadata(funds, wc_fund):
     return result
 
 
+def _self_funding_weights(funds, sf_map):
+    """(fund, self_funding_percentage / 10000) for every self-funding non-WC fund.
+
+    K for a month is the sum of each fund's percentage times its weight.
+    """
+    return [
+        (f, sf_map[f.id]["self_funding_percentage"] / Decimal(10000))
+        for f in funds
+        if f.name != "Working Capital" and f.id in sf_map
+    ]
+
+
 def _batch_wc_balance(session, workspace_id, wc_fund, wc_fund_id):
     """Compute WC opening balance and per-month credits/debits from WC-fund-scoped postings.
 
     Returns (opening: Decimal, credits: Dict[(y,m), Decimal], debits: Dict[(y,m), Decimal])
     """
-    from sqlalchemy import extract as sa_extract
 
     wc_account_ids = [link.account_id for link in wc_fund.account_links] if wc_fund else []
     opening = Decimal(0)
@@ -224,83 +288,165 @@ def _batch_wc_balance(session, workspace_id, wc_fund, wc_fund_id):
     ext_filter = [PostingModel.account_id != external_acc.id] if external_acc else []
 
     # Credits: non-transfer tagged to WC fund + transfer dest to WC fund
-    wc_credits_q = session.query(
-        sa_extract('year', TransactionModel.timestamp).label('yr'),
-        sa_extract('month', TransactionModel.timestamp).label('mo'),
-        func.sum(PostingModel.base_amount),
-    ).join(
-        TransactionModel, PostingModel.transaction_id == TransactionModel.id
-    ).filter(
-        TransactionModel.workspace_id == workspace_id,
-        PostingModel.account_id.in_(wc_account_ids),
+    # Debits: non-transfer tagged to WC fund + transfer source from WC fund
+    # Both come from one scan of the WC postings, split with conditional sums
+    not_transfer = or_(TransactionModel.type.is_(None), TransactionModel.type != "transfer")
+    is_transfer = TransactionModel.type == "transfer"
+    is_credit = and_(
         PostingModel.base_amount > 0,
-        *ext_filter,
         or_(
-            and_(or_(TransactionModel.type.is_(None), TransactionModel.type != "transfer"), TransactionModel.fund_id == wc_fund_id),
-            and_(TransactionModel.type == "transfer", TransactionModel.dest_fund_id == wc_fund_id),
+            and_(not_transfer, TransactionModel.fund_id == wc_fund_id),
+            and_(is_transfer, TransactionModel.dest_fund_id == wc_fund_id),
         ),
-    ).group_by(
-        sa_extract('year', TransactionModel.timestamp),
-        sa_extract('month', TransactionModel.timestamp),
-    ).all()
-    for yr, mo, total in wc_credits_q:
-        credits[(int(yr), int(mo))] = Decimal(str(total))
+    )
+    is_debit = and_(
+        PostingModel.base_amount < 0,
+        or_(
+            and_(not_transfer, TransactionModel.fund_id == wc_fund_id),
+            and_(is_transfer, TransactionModel.source_fund_id == wc_fund_id),
+        ),
+    )
 
-    # Debits: non-transfer tagged to WC fund + transfer source from WC fund
-    wc_debits_q = session.query(
-        sa_extract('year', TransactionModel.timestamp).label('yr'),
-        sa_extract('month', TransactionModel.timestamp).label('mo'),
-        func.sum(PostingModel.base_amount),
+    yr = extract('year', TransactionModel.timestamp)
+    mo = extract('month', TransactionModel.timestamp)
+    wc_rows = session.query(
+        yr.label('yr'),
+        mo.label('mo'),
+        func.sum(case((is_credit, PostingModel.base_amount), else_=0)),
+        func.sum(case((is_debit, PostingModel.base_amount), else_=0)),
     ).join(
         TransactionModel, PostingModel.transaction_id == TransactionModel.id
     ).filter(
         TransactionModel.workspace_id == workspace_id,
         PostingModel.account_id.in_(wc_account_ids),
-        PostingModel.base_amount < 0,
         *ext_filter,
         or_(
-            and_(or_(TransactionModel.type.is_(None), TransactionModel.type != "transfer"), TransactionModel.fund_id == wc_fund_id),
-            and_(TransactionModel.type == "transfer", TransactionModel.source_fund_id == wc_fund_id),
+            and_(not_transfer, TransactionModel.fund_id == wc_fund_id),
+            and_(is_transfer, or_(
+                TransactionModel.dest_fund_id == wc_fund_id,
+                TransactionModel.source_fund_id == wc_fund_id,
+            )),
         ),
-    ).group_by(
-        sa_extract('year', TransactionModel.timestamp),
-        sa_extract('month', TransactionModel.timestamp),
-    ).all()
-    for yr, mo, total in wc_debits_q:
-        debits[(int(yr), int(mo))] = abs(Decimal(str(total)))
+    ).group_by(yr, mo).all()
+    for y, m, credit, debit in wc_rows:
+        key = (int(y), int(m))
+        if credit:
+            credits[key] = credit
+        if debit:
+            debits[key] = abs(debit)
 
     return opening, credits, debits
 
 
-def _get_income_for_month(session: Session, workspace_id: str, year: int, month: int, fund_id: str = None) -> Decimal:
-    """Sum of income-category transaction postings for a given month.
-    If fund_id is provided, only includes income assigned to that fund."""
-    start, end = _get_month_range(year, month)
-    query = session.query(
-        func.sum(PostingModel.base_amount)
-    ).join(
-        TransactionModel, PostingModel.transaction_id == TransactionModel.id
-    ).join(
-        CategoryModel, TransactionModel.category_id == CategoryModel.id
-    ).filter(
-        TransactionModel.workspace_id == workspace_id,
-        TransactionModel.category_id.isnot(None),
-        TransactionModel.timestamp >= start,
-        TransactionModel.timestamp <= end,
-        CategoryModel.type == 'income',
-        PostingModel.base_amount > 0
-    )
-    if fund_id is not None:
-        query = query.filter(TransactionModel.fund_id == fund_id)
-    result = query.scalar()
-    return Decimal(str(result)) if result else Decimal(0)
+# ─── Monthly totals view ───
+#
+# mv_monthly_posting_totals (see database._MONTHLY_TOTALS_VIEW) holds
+# per-month posting sums by category, subcategory and fund. When enabled,
+# months that had closed by its last refresh (recorded in _view_refreshes)
+# are read from it; later months are always live.
+
+_monthly_totals = table(
+    "mv_monthly_posting_totals",
+    column("workspace_id", String),
+    column("year", Integer),
+    column("month", Integer),
+    column("category_id", String),
+    column("subcategory_id", String),
+    column("fund_id", String),
+    column("category_type", String),
+    column("sum_pos", Numeric(19, 4)),
+    column("sum_neg", Numeric(19, 4)),
+    column("neg_count", Integer),
+)
 
 
-def _get_expenses_for_month(session: Session, workspace_id: str, year: int, month: int) -> Decimal:
-    """Sum of expense-category transaction postings for a given month (absolute value)."""
-    start, end = _get_month_range(year, month)
-    result = session.query(
-        func.sum(PostingModel.base_amount)
+_view_refreshes = table(
+    "_view_refreshes",
+    column("name", String),
+    column("refreshed_at"),
+)
+
+
+def _uses_monthly_totals_view(session: Session) -> bool:
+    """Whether closed months may be read from mv_monthly_posting_totals."""
+    return ANALYTICS_MONTHLY_TOTALS_VIEW and session.get_bind().dialect.name == "postgresql"
+
+
+def _view_refreshed_at_query():
+    """Start time (naive UTC) of the monthly totals view's last refresh."""
+    return select(_view_refreshes.c.refreshed_at).where(_view_refreshes.c.name == _monthly_totals.name)
+
+
+def _view_version_parts(session: Session) -> list:
+    """Last refresh of the monthly totals view, for fingerprints of endpoints that read it.
+
+    A refresh changes what closed months report, so it must change the ETag.
+    """
+    if not _uses_monthly_totals_view(session):
+        return []
+    return [_view_refreshed_at_query().scalar_subquery()]
+
+
+def _view_cutoff(session: Session, start: datetime, end: datetime) -> datetime:
+    """End of the part of [start, end) served from the monthly totals view.
+
+    Only months that had closed when the view was last refreshed are in it,
+    so a just-closed month stays live until the next refresh. Returns start
+    when the view is not in use or has never been refreshed.
+    """
+    if not _uses_monthly_totals_view(session):
+        return start
+    refreshed_at = session.execute(_view_refreshed_at_query()).scalar()
+    if refreshed_at is None:
+        return start
+    refreshed_month_start, _ = _month_bounds(refreshed_at.year, refreshed_at.month)
+    return max(start, min(end, refreshed_month_start))
+
+
+def _batch_income_expenses(session: Session, workspace_id: str, start: datetime, end: datetime, income_fund_id: str = None):
+    """Monthly income and expense totals for [start, end) in one grouped query.
+
+    Income sums positive income-category postings, expenses the absolute value
+    of negative expense-category postings, keyed by (year, month). If
+    income_fund_id is provided, income only counts that fund.
+    Returns (income: Dict[(y,m), Decimal], expenses: Dict[(y,m), Decimal]);
+    SUM over a Numeric column already comes back as Decimal. Closed months
+    come from mv_monthly_posting_totals when that view is enabled.
+    """
+    rows = []
+    cutoff = _view_cutoff(session, start, end)
+    if cutoff > start:
+        mt = _monthly_totals.c
+        view_income = mt.category_type == 'income'
+        if income_fund_id is not None:
+            view_income = and_(view_income, mt.fund_id == income_fund_id)
+        month_key = mt.year * 12 + mt.month
+        rows += session.execute(select(
+            mt.year,
+            mt.month,
+            func.sum(case((view_income, mt.sum_pos), else_=0)),
+            func.sum(case((mt.category_type == 'expense', mt.sum_neg), else_=0)),
+        ).where(
+            mt.workspace_id == workspace_id,
+            month_key >= start.year * 12 + start.month,
+            month_key < cutoff.year * 12 + cutoff.month,
+        ).group_by(mt.year, mt.month)).all()
+        start = cutoff
+    if start >= end:
+        return _income_expense_maps(rows)
+
+    is_income = and_(CategoryModel.type == 'income', PostingModel.base_amount > 0)
+    if income_fund_id is not None:
+        is_income = and_(is_income, TransactionModel.fund_id == income_fund_id)
+    is_expense = and_(CategoryModel.type == 'expense', PostingModel.base_amount < 0)
+
+    yr = extract('year', TransactionModel.timestamp)
+    mo = extract('month', TransactionModel.timestamp)
+    rows += session.query(
+        yr.label('yr'),
+        mo.label('mo'),
+        func.sum(case((is_income, PostingModel.base_amount), else_=0)),
+        func.sum(case((is_expense, PostingModel.base_amount), else_=0)),
     ).join(
         TransactionModel, PostingModel.transaction_id == TransactionModel.id
     ).join(
@@ -309,168 +455,215 @@ def _get_expenses_for_month(session: Session, workspace_id: str, year: int, mont
         TransactionModel.workspace_id == workspace_id,
         TransactionModel.category_id.isnot(None),
         TransactionModel.timestamp >= start,
-        TransactionModel.timestamp <= end,
-        CategoryModel.type == 'expense',
-        PostingModel.base_amount < 0
-    ).scalar()
-    return abs(Decimal(str(result))) if result else Decimal(0)
+        TransactionModel.timestamp < end,
+        CategoryModel.type.in_(('income', 'expense')),
+    ).group_by(yr, mo).all()
+    return _income_expense_maps(rows)
+
+
+def _income_expense_maps(rows):
+    """Split (year, month, income, expense) rows into the two (y, m) dicts."""
+    income: Dict[tuple, Decimal] = {}
+    expenses: Dict[tuple, Decimal] = {}
+    for y, m, inc, exp in rows:
+        key = (int(y), int(m))
+        if inc:
+            income[key] = inc
+        if exp:
+            expenses[key] = abs(exp)
+    return income, expenses
 
 
 # ─── Endpoints ───
+#
+# Async routes keep their query code in a sync helper and hand it to
+# AsyncSession.run_sync, so the ORM runs on the async driver instead of
+# holding a threadpool worker for the whole request.
+
+def _expense_split_view_rows(session: Session, workspace_id: str, year: int, month: int):
+    """_expense_split's grouped rows for a closed month, read from the monthly totals view."""
+    mt = _monthly_totals.c
+    amount = func.sum(mt.sum_neg)
+    return session.query(
+        mt.category_id,
+        CategoryModel.name,
+        CategoryModel.emoji,
+        mt.subcategory_id,
+        SubcategoryModel.name.label('subcategory_name'),
+        func.sum(mt.neg_count).label('count'),
+        amount.cast(Float).label('total')
+    ).select_from(_monthly_totals).join(
+        CategoryModel, mt.category_id == CategoryModel.id
+    ).outerjoin(
+        SubcategoryModel, mt.subcategory_id == SubcategoryModel.id
+    ).filter(
+        mt.workspace_id == workspace_id,
+        mt.year == year,
+        mt.month == month,
+        mt.category_type == 'expense',
+        mt.neg_count > 0
+    ).group_by(
+        mt.category_id,
+        CategoryModel.name,
+        CategoryModel.emoji,
+        mt.subcategory_id,
+        SubcategoryModel.name
+    ).order_by(
+        func.sum(amount).over(partition_by=mt.category_id),
+        mt.category_id,
+        amount,
+    ).all()
 
-@router.get("/expense-split", response_model=MonthlyExpenseSplit)
-def get_expense_split(
-    year: int,
-    month: int,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
-):
-    """Get monthly expense breakdown by category"""
-    try:
-        start_date, end_date = _get_month_range(year, month)
-
-        query = session.query(
-            TransactionModel.category_id,
-            CategoryModel.name,
-            CategoryModel.emoji,
-            func.count(TransactionModel.id).label('count'),
-            func.sum(PostingModel.base_amount).label('total')
-        ).join(
-            CategoryModel, TransactionModel.category_id == CategoryModel.id
-        ).join(
-            PostingModel, TransactionModel.id == PostingModel.transaction_id
-        ).filter(
-            TransactionModel.workspace_id == workspace_id,
-            TransactionModel.category_id.isnot(None),
-            TransactionModel.timestamp >= start_date,
-            TransactionModel.timestamp <= end_date,
-            CategoryModel.type == 'expense',
-            PostingModel.base_amount < 0
-        ).group_by(
-            TransactionModel.category_id,
-            CategoryModel.name,
-            CategoryModel.emoji
-        )
 
-        results = query.all()
+def _expense_split(session: Session, workspace_id: str, year: int, month: int):
+    try:
+        start_date, end_date = _month_bounds(year, month)
+
+        # One pass at subcategory granularity; category totals are the sums
+        # of their subcategory groups (the groups partition each category)
+        if _view_cutoff(session, start_date, end_date) == end_date:
+            results = _expense_split_view_rows(session, workspace_id, year, month)
+        else:
+            results = session.query(
+                TransactionModel.category_id,
+                CategoryModel.name,
+                CategoryModel.emoji,
+                TransactionModel.subcategory_id,
+                SubcategoryModel.name.label('subcategory_name'),
+                func.count(TransactionModel.id).label('count'),
+                func.sum(PostingModel.base_amount).cast(Float).label('total')
+            ).join(
+                CategoryModel, TransactionModel.category_id == CategoryModel.id
+            ).join(
+                PostingModel, TransactionModel.id == PostingModel.transaction_id
+            ).outerjoin(
+                SubcategoryModel, TransactionModel.subcategory_id == SubcategoryModel.id
+            ).filter(
+                TransactionModel.workspace_id == workspace_id,
+                TransactionModel.category_id.isnot(None),
+                TransactionModel.timestamp >= start_date,
+                TransactionModel.timestamp < end_date,
+                CategoryModel.type == 'expense',
+                PostingModel.base_amount < 0
+            ).group_by(
+                TransactionModel.category_id,
+                CategoryModel.name,
+                CategoryModel.emoji,
+                TransactionModel.subcategory_id,
+                SubcategoryModel.name
+            ).order_by(
+                # Negative sums, so ascending is largest expense first: by the
+                # category's total (window over the groups), then by subcategory
+                func.sum(func.sum(PostingModel.base_amount)).over(partition_by=TransactionModel.category_id),
+                TransactionModel.category_id,
+                func.sum(PostingModel.base_amount),
+            ).all()
 
-        # Subcategory-level breakdown
-        sub_query = session.query(
-            TransactionModel.category_id,
-            TransactionModel.subcategory_id,
-            SubcategoryModel.name.label('subcategory_name'),
-            func.count(TransactionModel.id).label('count'),
-            func.sum(PostingModel.base_amount).label('total')
-        ).join(
-            CategoryModel, TransactionModel.category_id == CategoryModel.id
-        ).join(
-            PostingModel, TransactionModel.id == PostingModel.transaction_id
-        ).outerjoin(
-            SubcategoryModel, TransactionModel.subcategory_id == SubcategoryModel.id
-        ).filter(
-            TransactionModel.workspace_id == workspace_id,
-            TransactionModel.category_id.isnot(None),
-            TransactionModel.timestamp >= start_date,
-            TransactionModel.timestamp <= end_date,
-            CategoryModel.type == 'expense',
-            PostingModel.base_amount < 0
-        ).group_by(
-            TransactionModel.category_id,
-            TransactionModel.subcategory_id,
-            SubcategoryModel.name
-        )
+        # Display-only sums: plain floats, rounded once at the end to the
+        # 4 places base_amount is stored with
+        by_category: Dict[str, CategorySplit] = {}
+        total_expenses = 0.0
 
-        sub_results = sub_query.all()
-        sub_map = {}
-        for cat_id, sub_id, sub_name, count, total in sub_results:
-            if total:
-                amount = abs(Decimal(str(total)))
-                if amount > 0:
-                    if cat_id not in sub_map:
-                        sub_map[cat_id] = []
-                    sub_map[cat_id].append(SubcategorySplit(
-                        subcategory_id=sub_id,
-                        subcategory_name=sub_name or "Uncategorized",
-                        total_amount=amount,
-                        transaction_count=count or 0
-                    ))
+        for category_id, name, emoji, sub_id, sub_name, count, total in results:
+            if not total:
+                continue
+            amount = abs(total)
+            total_expenses += amount
+            category = by_category.get(category_id)
+            if category is None:
+                category = by_category[category_id] = CategorySplit.model_construct(
+                    category_id=category_id,
+                    category_name=name or "Uncategorized",
+                    emoji=emoji or "",
+                    total_amount=0.0,
+                    transaction_count=0,
+                    subcategories=[],
+                )
+            category.total_amount += amount
+            category.transaction_count += count or 0
+            category.subcategories.append(SubcategorySplit.model_construct(
+                subcategory_id=sub_id,
+                subcategory_name=sub_name or "Uncategorized",
+                total_amount=amount,
+                transaction_count=count or 0
+            ))
 
-        categories = []
-        total_expenses = Decimal(0)
-
-        for category_id, name, emoji, count, total in results:
-            if total:
-                amount = abs(Decimal(str(total)))
-                if amount > 0:
-                    total_expenses += amount
-                    subs = sorted(
-                        sub_map.get(category_id, []),
-                        key=lambda x: x.total_amount,
-                        reverse=True
-                    )
-                    categories.append(CategorySplit(
-                        category_id=category_id,
-                        category_name=name or "Uncategorized",
-                        emoji=emoji or "",
-                        total_amount=amount,
-                        transaction_count=count or 0,
-                        subcategories=subs
-                    ))
+        for category in by_category.values():
+            category.total_amount = round(category.total_amount, 4)
 
-        return MonthlyExpenseSplit(
+        # Rows arrive grouped by category, largest category first, so
+        # insertion order is already the response order
+        return MonthlyExpenseSplit.model_construct(
             year=year,
             month=month,
-            total_expenses=total_expenses,
-            categories=sorted(categories, key=lambda x: x.total_amount, reverse=True)
+            total_expenses=round(total_expenses, 4),
+            categories=list(by_category.values())
         )
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/income-allocation", response_model=IncomeAllocationResponse)
-def get_income_allocation(
-    years: int = Query(default=1, ge=1, le=5),
+@router.get("/expense-split", response_model=MonthlyExpenseSplit)
+async def get_expense_split(
+    request: Request,
+    year: int,
+    month: int,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """
-    Get income allocation table for full calendar year(s).
+    """Get monthly expense breakdown by category"""
+    fingerprint = await session.run_sync(_split_fingerprint, workspace_id)
+    etag = weak_etag("expense-split", workspace_id, year, month, *fingerprint)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    result = await session.run_sync(_expense_split, workspace_id, year, month)
+    return _json_response(result, etag)
 
-    For each month, uses the PREVIOUS month's income (one-month lag).
-    Allocated fixed cost comes from the active simulation's monthly expenses.
-    Fund allocation percentages are applied to savings remainder (income - fixed costs).
-    Always shows complete calendar years (Jan-Dec).
-    Current month and previous month are editable; older months are locked.
-    """
+
+def _income_allocation(session: Session, workspace_id: str, years: int):
     try:
-        # Get all active funds for this workspace
-        funds = session.query(FundModel).filter(
+        # Get all active funds for this workspace, with account links and
+        # their accounts (read by the self-funding, WC balance and meta code)
+        funds = session.query(FundModel).options(
+            selectinload(FundModel.account_links).joinedload(FundAccountLinkModel.account)
+        ).filter(
             FundModel.workspace_id == workspace_id,
             FundModel.is_active == True
         ).order_by(FundModel.created_at).all()
 
         # Look up active simulation for budget benchmark
-        from src.data.repositories import ScenarioRepository, FundAllocationOverrideRepository
         scenario_repo = ScenarioRepository(session)
         active_scenario = scenario_repo.read_active(workspace_id)
         budget_benchmark = Decimal(str(active_scenario.monthly_expenses_total)) if active_scenario else Decimal(0)
 
-        # Load all overrides for this workspace, split by type
+        # Rows cover full calendar year(s): Jan-Dec
+        now = datetime.utcnow()
+        current_year = now.year
+        start_year = current_year - years + 1
+        months = [
+            (y, m)
+            for y in range(start_year, current_year + 1)
+            for m in range(1, (now.month if y == current_year else 12) + 1)
+        ]
+
+        # Per-month fund percentages: every month starts from the fund
+        # defaults (Numeric columns load as Decimal) and percentage
+        # overrides in range are scattered over them once, up front
+        default_pct = {f.id: f.allocation_percentage or Decimal(0) for f in funds}
+        pct_by_month = {key: dict(default_pct) for key in months}
+
+        # Load overrides for the displayed years only, split by type
         override_repo = FundAllocationOverrideRepository(session)
-        all_overrides = override_repo.read_by_workspace(workspace_id)
-        pct_override_map = {}
         amount_override_map = {}  # (fund_id, year, month) -> (amount, mode)
-        for o in all_overrides:
-            key = (o.fund_id, o.year, o.month)
+        for o in override_repo.read_by_year_range(workspace_id, start_year, current_year):
             if o.override_amount is not None or o.mode is not None:
                 # Store both amount and mode (either can be None)
-                amount_override_map[key] = (
-                    Decimal(str(o.override_amount)) if o.override_amount is not None else None,
-                    o.mode
-                )
+                amount_override_map[(o.fund_id, o.year, o.month)] = (o.override_amount, o.mode)
             else:
-                pct_override_map[key] = Decimal(str(o.allocation_percentage))
+                month_pcts = pct_by_month.get((o.year, o.month))
+                if month_pcts is not None and o.fund_id in month_pcts:
+                    month_pcts[o.fund_id] = o.allocation_percentage
 
         # Find Working Capital fund ID (only WC income is counted)
         wc_fund = next((f for f in funds if f.name == "Working Capital"), None)
@@ -480,13 +673,13 @@ def get_income_allocation(
         self_funding_map = _compute_self_funding_metadata(funds, wc_fund)
 
         funds_meta = [
-            FundMeta(
+            FundMeta.model_construct(
                 fund_id=f.id,
                 fund_name=f.name,
                 emoji=f.emoji or "",
-                linked_account_names=[acc.name for acc in getattr(f, 'accounts', []) or []],
+                linked_account_names=[link.account.name for link in f.account_links],
                 is_self_funding=f.id in self_funding_map,
-                self_funding_percentage=float(self_funding_map[f.id]["self_funding_percentage"]) if f.id in self_funding_map else 0,
+                self_funding_percentage=float(self_funding_map[f.id]["self_funding_percentage"]) if f.id in self_funding_map else 0.0,
                 overlapping_account_names=self_funding_map[f.id]["overlapping_account_names"] if f.id in self_funding_map else [],
             )
             for f in funds
@@ -524,71 +717,57 @@ def get_income_allocation(
             session, workspace_id, wc_fund, wc_fund_id
         )
 
-        # Build rows for full calendar year(s): Jan-Dec
-        now = datetime.utcnow()
-        current_year = now.year
-        start_year = current_year - years + 1
+        # WC income and expenses for every month in range, one query
+        income_by_month, expenses_by_month = _batch_income_expenses(
+            session, workspace_id,
+            datetime(start_year, 1, 1), _month_bounds(current_year, now.month)[1],
+            income_fund_id=wc_fund_id,
+        )
+
+        sf_k_weights = _self_funding_weights(funds, self_funding_map)
 
         wc_running_balance = wc_opening_balance
         rows = []
-        for y in range(start_year, current_year + 1):
-            end_month = now.month if y == current_year else 12
-            for m in range(1, end_month + 1):
-                # Current month's actual WC income (pure cash basis)
-                current_month_income = _get_income_for_month(session, workspace_id, y, m, fund_id=wc_fund_id)
+        for y, m in months:
+            fund_pct = pct_by_month[(y, m)]
 
-                # This month's actual expenses (fixed cost)
-                actual_fixed_cost = _get_expenses_for_month(session, workspace_id, y, m)
+            # Current month's actual WC income (pure cash basis)
+            current_month_income = income_by_month.get((y, m), Decimal(0))
 
-                # WC fund ledger balance: capture prev month closing (updated at end of loop)
-                wc_prev_closing = wc_running_balance
+            # This month's actual expenses (fixed cost)
+            actual_fixed_cost = expenses_by_month.get((y, m), Decimal(0))
 
-                # Allocated fixed cost from active simulation benchmark
-                allocated_fixed_cost = budget_benchmark
+            # WC fund ledger balance: capture prev month closing (updated at end of loop)
+            wc_prev_closing = wc_running_balance
 
-                # WC credits/debits for this month (also used for running balance below)
-                wc_cr = wc_monthly_credits.get((y, m), Decimal(0))
-                wc_db = wc_monthly_debits.get((y, m), Decimal(0))
+            # Allocated fixed cost from active simulation benchmark
+            allocated_fixed_cost = budget_benchmark
 
-                # Self-funding ratio K for sweep formula
-                K = Decimal(0)
-                for f_k in funds:
-                    if f_k.name == "Working Capital":
-                        continue
-                    sf_k = self_funding_map.get(f_k.id)
-                    if not sf_k:
-                        continue
-                    pct_k = pct_override_map.get((f_k.id, y, m), Decimal(str(f_k.allocation_percentage)))
-                    K += pct_k * Decimal(str(sf_k["self_funding_percentage"])) / Decimal(10000)
-
-                # Determine Working Capital amount (three modes)
-                wc_key = (wc_fund_id, y, m) if wc_fund_id else None
-                apply_self_funding = False
-
-                if wc_key and wc_key in amount_override_map:
-                    override_amount, override_mode = amount_override_map[wc_key]
-
-                    if override_mode == "MODEL":
-                        # Model mode: use benchmark allocation
-                        wc_amount = allocated_fixed_cost
-                        raw_savings = current_month_income - wc_amount
-                        apply_self_funding = False
-
-                    elif override_mode == "OPTIMIZE":
-                        # Explicit optimize mode (same as default)
-                        shortfall = max(Decimal(0), min_wc_balance - wc_prev_closing)
-                        wc_amount = actual_fixed_cost + shortfall
-                        income_based_savings = current_month_income - wc_amount
-                        wc_surplus = max(Decimal(0), wc_prev_closing - min_wc_balance)
-                        raw_savings = income_based_savings + wc_surplus
-                        apply_self_funding = True
-
-                    else:  # None = manual override
-                        wc_amount = override_amount
-                        raw_savings = current_month_income - wc_amount
-                        apply_self_funding = False
-                else:
-                    # Default: Optimize mode
+            # WC credits/debits for this month (also used for running balance below)
+            wc_cr = wc_monthly_credits.get((y, m), Decimal(0))
+            wc_db = wc_monthly_debits.get((y, m), Decimal(0))
+
+            # Self-funding ratio K for sweep formula (feeds savings_remainder,
+            # so it stays Decimal)
+            K = Decimal(0)
+            for f_k, weight in sf_k_weights:
+                K += fund_pct[f_k.id] * weight
+
+            # Determine Working Capital amount (three modes)
+            wc_key = (wc_fund_id, y, m) if wc_fund_id else None
+            apply_self_funding = False
+
+            if wc_key and wc_key in amount_override_map:
+                override_amount, override_mode = amount_override_map[wc_key]
+
+                if override_mode == "MODEL":
+                    # Model mode: use benchmark allocation
+                    wc_amount = allocated_fixed_cost
+                    raw_savings = current_month_income - wc_amount
+                    apply_self_funding = False
+
+                elif override_mode == "OPTIMIZE":
+                    # Explicit optimize mode (same as default)
                     shortfall = max(Decimal(0), min_wc_balance - wc_prev_closing)
                     wc_amount = actual_fixed_cost + shortfall
                     income_based_savings = current_month_income - wc_amount
@@ -596,140 +775,144 @@ def get_income_allocation(
                     raw_savings = income_based_savings + wc_surplus
                     apply_self_funding = True
 
-                # Adjust for self-funding (only in optimize mode)
-                if apply_self_funding:
-                    savings_remainder = max(Decimal(0), raw_savings / (1 + K))
-                else:
-                    savings_remainder = raw_savings
+                else:  # None = manual override
+                    wc_amount = override_amount
+                    raw_savings = current_month_income - wc_amount
+                    apply_self_funding = False
+            else:
+                # Default: Optimize mode
+                shortfall = max(Decimal(0), min_wc_balance - wc_prev_closing)
+                wc_amount = actual_fixed_cost + shortfall
+                income_based_savings = current_month_income - wc_amount
+                wc_surplus = max(Decimal(0), wc_prev_closing - min_wc_balance)
+                raw_savings = income_based_savings + wc_surplus
+                apply_self_funding = True
 
-                # Fixed cost optimization = WC - actual (display-only)
-                fixed_cost_optimization = wc_amount - actual_fixed_cost
+            # Adjust for self-funding (only in optimize mode)
+            if apply_self_funding:
+                savings_remainder = max(Decimal(0), raw_savings / (1 + K))
+            else:
+                savings_remainder = raw_savings
 
-                # Working capital percentages
-                if current_month_income > 0:
-                    working_capital_pct_of_income = float((wc_amount / current_month_income) * 100)
-                    savings_pct_of_income = float((savings_remainder / current_month_income) * 100)
-                else:
-                    working_capital_pct_of_income = 0.0
-                    savings_pct_of_income = 0.0
-
-                # Lock: allow current month and previous month to be editable
-                previous_month = now.month - 1
-                previous_month_year = current_year
-                if previous_month == 0:
-                    previous_month = 12
-                    previous_month_year = current_year - 1
-
-                is_locked = not (
-                    (y == current_year and m == now.month) or  # current month
-                    (y == previous_month_year and m == previous_month)  # previous month
-                )
+            # Fixed cost optimization = WC - actual (display-only)
+            fixed_cost_optimization = wc_amount - actual_fixed_cost
 
-                # Allocate funds from savings remainder
-                fund_allocs = []
-                total_allocated = Decimal(0)
-                for f in funds:
-                    # Working Capital fund: editable with amount override
-                    if f.name == "Working Capital":
-                        if current_month_income > 0:
-                            wc_pct = float((wc_amount / current_month_income) * 100)
-                        else:
-                            wc_pct = 0.0
-
-                        # Calculate alternative amounts for display
-                        model_wc_amount = allocated_fixed_cost
-                        optimize_shortfall = max(Decimal(0), min_wc_balance - wc_prev_closing)
-                        optimize_wc_amount = actual_fixed_cost + optimize_shortfall
-
-                        # Extract mode from override if exists
-                        override_mode = None
-                        if wc_key and wc_key in amount_override_map:
-                            _, override_mode = amount_override_map[wc_key]
-
-                        fund_allocs.append(FundAllocationDetail(
-                            fund_id=f.id,
-                            fund_name=f.name,
-                            emoji=f.emoji or "",
-                            allocation_percentage=wc_pct,
-                            allocated_amount=float(wc_amount),
-                            is_auto=False,
-                            override_amount=float(wc_amount) if (wc_key and wc_key in amount_override_map and override_mode is None) else None,
-                            mode=override_mode,
-                            model_amount=float(model_wc_amount),
-                            optimize_amount=float(optimize_wc_amount),
-                        ))
-                        continue
+            # Working capital percentages (display-only, plain float math)
+            if current_month_income > 0:
+                income_f = float(current_month_income)
+                working_capital_pct_of_income = float(wc_amount) / income_f * 100
+                savings_pct_of_income = float(savings_remainder) / income_f * 100
+            else:
+                working_capital_pct_of_income = 0.0
+                savings_pct_of_income = 0.0
+
+            # Lock: allow current month and previous month to be editable
+            previous_month = now.month - 1
+            previous_month_year = current_year
+            if previous_month == 0:
+                previous_month = 12
+                previous_month_year = current_year - 1
+
+            is_locked = not (
+                (y == current_year and m == now.month) or  # current month
+                (y == previous_month_year and m == previous_month)  # previous month
+            )
 
-                    # Non-WC funds: percentage of savings remainder
-                    override_key = (f.id, y, m)
-                    pct = pct_override_map.get(override_key, Decimal(str(f.allocation_percentage)))
-                    if savings_remainder < 0:
-                        allocated = Decimal(0)
-                    else:
-                        allocated = savings_remainder * pct / 100
-                    total_allocated += allocated
-
-                    # Self-funding detection
-                    sf = self_funding_map.get(f.id)
-                    sf_pct = Decimal(str(sf["self_funding_percentage"])) / 100 if sf else Decimal(0)
-                    sf_amount = float(allocated * sf_pct) if sf else 0
-
-                    fund_allocs.append(FundAllocationDetail(
+            # Allocate funds from savings remainder
+            fund_allocs = []
+            total_allocated = Decimal(0)
+            total_fund_pct = 0.0
+            total_sf_amount = Decimal(0)
+            for f in funds:
+                # Working Capital fund: editable with amount override
+                if f.name == "Working Capital":
+                    wc_pct = working_capital_pct_of_income
+
+                    # Calculate alternative amounts for display
+                    model_wc_amount = allocated_fixed_cost
+                    optimize_shortfall = max(Decimal(0), min_wc_balance - wc_prev_closing)
+                    optimize_wc_amount = actual_fixed_cost + optimize_shortfall
+
+                    # Extract mode from override if exists
+                    override_mode = None
+                    if wc_key and wc_key in amount_override_map:
+                        _, override_mode = amount_override_map[wc_key]
+
+                    fund_allocs.append(FundAllocationDetail.model_construct(
                         fund_id=f.id,
                         fund_name=f.name,
                         emoji=f.emoji or "",
-                        allocation_percentage=pct,
-                        allocated_amount=allocated,
-                        is_self_funding=sf is not None,
-                        self_funding_percentage=float(sf["self_funding_percentage"]) if sf else 0,
-                        self_funding_amount=sf_amount,
-                        overlapping_account_names=sf["overlapping_account_names"] if sf else [],
+                        allocation_percentage=wc_pct,
+                        allocated_amount=float(wc_amount),
+                        is_auto=False,
+                        override_amount=float(wc_amount) if (wc_key and wc_key in amount_override_map and override_mode is None) else None,
+                        mode=override_mode,
+                        model_amount=float(model_wc_amount),
+                        optimize_amount=float(optimize_wc_amount),
                     ))
+                    continue
 
-                # Sum only non-WC fund percentages for 100% validation
-                total_fund_allocation_pct = float(sum(
-                    Decimal(str(fa.allocation_percentage)) for fa in fund_allocs
-                    if fa.fund_name != "Working Capital"
+                # Non-WC funds: percentage of savings remainder
+                pct = fund_pct[f.id]
+                if savings_remainder < 0:
+                    allocated = Decimal(0)
+                else:
+                    allocated = savings_remainder * pct / 100
+                total_allocated += allocated
+                pct_f = float(pct)
+                total_fund_pct += pct_f
+
+                # Self-funding detection
+                sf = self_funding_map.get(f.id)
+                sf_amount = allocated * sf["self_funding_percentage"] / 100 if sf else Decimal(0)
+                total_sf_amount += sf_amount
+
+                fund_allocs.append(FundAllocationDetail.model_construct(
+                    fund_id=f.id,
+                    fund_name=f.name,
+                    emoji=f.emoji or "",
+                    allocation_percentage=pct_f,
+                    allocated_amount=float(allocated),
+                    is_self_funding=sf is not None,
+                    self_funding_percentage=float(sf["self_funding_percentage"]) if sf else 0.0,
+                    self_funding_amount=float(sf_amount),
+                    overlapping_account_names=sf["overlapping_account_names"] if sf else [],
                 ))
 
-                # Total self-funding amount across all funds this month
-                total_self_funding_amount = float(sum(
-                    Decimal(str(fa.self_funding_amount))
-                    for fa in fund_allocs
-                    if fa.is_self_funding
-                ))
+            # Sum only non-WC fund percentages for 100% validation
+            total_fund_allocation_pct = total_fund_pct
 
-                # Self-funding savings ratio K = sum(fund_pct * sf_pct) / 10000
-                # Used by optimizer to solve fixed-point: WC = (A + B - I*K) / (1 - K)
-                self_funding_savings_ratio = float(sum(
-                    Decimal(str(fa.allocation_percentage)) * Decimal(str(fa.self_funding_percentage)) / Decimal(10000)
-                    for fa in fund_allocs
-                    if fa.is_self_funding
-                ))
+            # Total self-funding amount across all funds this month
+            total_self_funding_amount = float(total_sf_amount)
 
-                # Advance WC running balance: closing = opening + credits - sf_deduction - debits
-                wc_running_balance = wc_running_balance + wc_cr - Decimal(str(total_self_funding_amount)) - wc_db
+            # Self-funding savings ratio K = sum(fund_pct * sf_pct) / 10000
+            # (the same sum as K above). Used by optimizer to solve
+            # fixed-point: WC = (A + B - I*K) / (1 - K)
+            self_funding_savings_ratio = float(K)
 
-                rows.append(IncomeAllocationRow(
-                    year=y,
-                    month=m,
-                    current_month_income=current_month_income,
-                    net_income=current_month_income,  # Pure cash basis: use current month
-                    allocated_fixed_cost=allocated_fixed_cost,
-                    actual_fixed_cost=actual_fixed_cost,
-                    fixed_cost_optimization=fixed_cost_optimization,
-                    savings_remainder=savings_remainder,
-                    fund_allocations=fund_allocs,
-                    is_locked=is_locked,
-                    working_capital_pct_of_income=working_capital_pct_of_income,
-                    savings_pct_of_income=savings_pct_of_income,
-                    total_fund_allocation_pct=total_fund_allocation_pct,
-                    total_self_funding_amount=total_self_funding_amount,
-                    self_funding_savings_ratio=self_funding_savings_ratio,
-                    wc_prev_closing_balance=float(wc_prev_closing),
-                ))
+            # Advance WC running balance: closing = opening + credits - sf_deduction - debits
+            wc_running_balance = wc_running_balance + wc_cr - total_sf_amount - wc_db
 
-        return IncomeAllocationResponse(
+            rows.append(IncomeAllocationRow.model_construct(
+                year=y,
+                month=m,
+                current_month_income=float(current_month_income),
+                net_income=float(current_month_income),  # Pure cash basis: use current month
+                allocated_fixed_cost=float(allocated_fixed_cost),
+                actual_fixed_cost=float(actual_fixed_cost),
+                fixed_cost_optimization=float(fixed_cost_optimization),
+                savings_remainder=float(savings_remainder),
+                fund_allocations=fund_allocs,
+                is_locked=is_locked,
+                working_capital_pct_of_income=working_capital_pct_of_income,
+                savings_pct_of_income=savings_pct_of_income,
+                total_fund_allocation_pct=total_fund_allocation_pct,
+                total_self_funding_amount=total_self_funding_amount,
+                self_funding_savings_ratio=self_funding_savings_ratio,
+                wc_prev_closing_balance=float(wc_prev_closing),
+            ))
+
+        return IncomeAllocationResponse.model_construct(
             rows=rows,
             funds_meta=funds_meta,
             active_scenario_name=active_scenario.name if active_scenario else None,
@@ -742,33 +925,98 @@ def get_income_allocation(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-# Keep old endpoint for backward compat
-@router.get("/income-split", response_model=MonthlyIncomeSplit)
-def get_income_split(
-    year: int,
-    month: int,
+def _allocation_fingerprint(session: Session, workspace_id: str) -> tuple:
+    """Row counts and last-modified times of every table income allocation reads.
+
+    One round trip; any insert, update or delete in the workspace changes at
+    least one value.
+    """
+    parts = _version_parts(
+        workspace_id,
+        (TransactionModel, CategoryModel, AccountModel, FundModel, FundAllocationOverrideModel, ScenarioModel),
+    )
+    # Fund-account links carry no timestamps; count + summed percentages
+    for agg in (func.count(FundAccountLinkModel.account_id), func.sum(FundAccountLinkModel.allocation_percentage)):
+        parts.append(
+            select(agg).join(FundModel, FundAccountLinkModel.fund_id == FundModel.id)
+            .where(FundModel.workspace_id == workspace_id).scalar_subquery()
+        )
+    parts.append(select(WorkspaceModel.updated_at).where(WorkspaceModel.id == workspace_id).scalar_subquery())
+    parts += _view_version_parts(session)
+    return tuple(session.execute(select(*parts)).one())
+
+
+@router.get("/income-allocation", response_model=IncomeAllocationResponse)
+async def get_income_allocation(
+    request: Request,
+    years: int = Query(default=1, ge=1, le=5),
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """Get monthly income allocation by fund (legacy single-month view)"""
-    try:
-        start_date, end_date = _get_month_range(year, month)
+    """
+    Get income allocation table for full calendar year(s).
 
-        income_query = session.query(
-            TransactionModel.fund_id,
-            func.sum(PostingModel.base_amount).label('total')
-        ).join(
-            CategoryModel, TransactionModel.category_id == CategoryModel.id
-        ).join(
-            PostingModel, TransactionModel.id == PostingModel.transaction_id
-        ).filter(
-            TransactionModel.workspace_id == workspace_id,
-            TransactionModel.fund_id.isnot(None),
-            TransactionModel.timestamp >= start_date,
-            TransactionModel.timestamp <= end_date,
-            CategoryModel.type == 'income',
-            PostingModel.base_amount > 0
-        ).group_by(TransactionModel.fund_id)
+    For each month, uses the PREVIOUS month's income (one-month lag).
+    Allocated fixed cost comes from the active simulation's monthly expenses.
+    Fund allocation percentages are applied to savings remainder (income - fixed costs).
+    Always shows complete calendar years (Jan-Dec).
+    Current month and previous month are editable; older months are locked.
+    """
+    # Rows depend on the current month too (range end, locked months)
+    now = datetime.utcnow()
+    fingerprint = await session.run_sync(_allocation_fingerprint, workspace_id)
+    etag = weak_etag("income-allocation", workspace_id, years, now.year, now.month, *fingerprint)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    async def compute():
+        redis_key = "income-allocation:" + etag
+        if _shared_allocation_cache is not None:
+            body = await _shared_allocation_cache.get(redis_key)
+            if body is not None:
+                return body
+        result = await session.run_sync(_income_allocation, workspace_id, years)
+        body = result.model_dump_json()
+        if _shared_allocation_cache is not None:
+            await _shared_allocation_cache.set(redis_key, body, ALLOCATION_CACHE_TTL)
+        return body
+
+    body = await _allocation_cache.aget_or_compute(etag, compute)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _income_split(session: Session, workspace_id: str, year: int, month: int):
+    try:
+        start_date, end_date = _month_bounds(year, month)
+
+        if _view_cutoff(session, start_date, end_date) == end_date:
+            mt = _monthly_totals.c
+            income_query = session.query(
+                mt.fund_id,
+                func.sum(mt.sum_pos).cast(Float).label('total')
+            ).select_from(_monthly_totals).filter(
+                mt.workspace_id == workspace_id,
+                mt.fund_id.isnot(None),
+                mt.year == year,
+                mt.month == month,
+                mt.category_type == 'income',
+            ).group_by(mt.fund_id)
+        else:
+            income_query = session.query(
+                TransactionModel.fund_id,
+                func.sum(PostingModel.base_amount).cast(Float).label('total')
+            ).join(
+                CategoryModel, TransactionModel.category_id == CategoryModel.id
+            ).join(
+                PostingModel, TransactionModel.id == PostingModel.transaction_id
+            ).filter(
+                TransactionModel.workspace_id == workspace_id,
+                TransactionModel.fund_id.isnot(None),
+                TransactionModel.timestamp >= start_date,
+                TransactionModel.timestamp < end_date,
+                CategoryModel.type == 'income',
+                PostingModel.base_amount > 0
+            ).group_by(TransactionModel.fund_id)
 
         income_by_fund = {fund_id: total for fund_id, total in income_query.all() if total}
 
@@ -778,26 +1026,24 @@ def get_income_split(
         ).all()
 
         funds = []
-        total_income = Decimal(0)
+        total_income = 0.0
 
         for fund in funds_query:
-            allocated_amount = income_by_fund.get(fund.id, 0)
-            if allocated_amount:
-                amount = Decimal(str(allocated_amount))
-                if amount > 0:
-                    total_income += amount
-                    funds.append(FundAllocation(
-                        fund_id=fund.id,
-                        fund_name=fund.name,
-                        emoji=fund.emoji or "",
-                        allocation_percentage=fund.allocation_percentage,
-                        allocated_amount=amount
-                    ))
+            amount = income_by_fund.get(fund.id, 0.0)
+            if amount > 0:
+                total_income += amount
+                funds.append(FundAllocation(
+                    fund_id=fund.id,
+                    fund_name=fund.name,
+                    emoji=fund.emoji or "",
+                    allocation_percentage=fund.allocation_percentage,
+                    allocated_amount=amount
+                ))
 
         return MonthlyIncomeSplit(
             year=year,
             month=month,
-            total_income=total_income,
+            total_income=round(total_income, 4),
             funds=sorted(funds, key=lambda x: x.allocated_amount, reverse=True)
         )
 
@@ -805,25 +1051,27 @@ def get_income_split(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-# ─── Fund Allocation Override endpoints ───
-
-@router.post("/fund-allocation-overrides")
-def create_or_update_override(
-    override_data: FundAllocationOverrideCreate,
+# Keep old endpoint for backward compat
+@router.get("/income-split", response_model=MonthlyIncomeSplit)
+async def get_income_split(
+    request: Request,
+    year: int,
+    month: int,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """Create or update a fund allocation override for a specific month"""
-    from src.data.repositories import FundRepository, FundAllocationOverrideRepository
-    from src.data.models import FundAllocationOverrideModel
+    """Get monthly income allocation by fund (legacy single-month view)"""
+    fingerprint = await session.run_sync(_split_fingerprint, workspace_id)
+    etag = weak_etag("income-split", workspace_id, year, month, *fingerprint)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    result = await session.run_sync(_income_split, workspace_id, year, month)
+    return _json_response(result, etag)
 
-    # Verify fund exists and belongs to workspace
-    fund_repo = FundRepository(session)
-    fund = fund_repo.read(override_data.fund_id)
 
-    if not fund or fund.workspace_id != workspace_id:
-        raise HTTPException(status_code=404, detail="Fund not found")
+# ─── Fund Allocation Override endpoints ───
 
+def _validate_override(override_data: FundAllocationOverrideCreate) -> None:
     # Validate mode if provided
     if override_data.mode and override_data.mode not in ["MODEL", "OPTIMIZE"]:
         raise HTTPException(status_code=400, detail="Mode must be 'MODEL' or 'OPTIMIZE'")
@@ -848,45 +1096,62 @@ def create_or_update_override(
     if override_data.month < 1 or override_data.month > 12:
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
 
+
+def _upsert_overrides(session: Session, workspace_id: str, overrides: List[FundAllocationOverrideCreate]):
+
+    # Validate every cell before touching the database
+    for override_data in overrides:
+        _validate_override(override_data)
+
+    # Verify all funds exist and belong to workspace (one query)
+    fund_ids = {o.fund_id for o in overrides}
+    owned = set(session.scalars(
+        select(FundModel.id).where(FundModel.id.in_(fund_ids), FundModel.workspace_id == workspace_id)
+    ))
+    if fund_ids - owned:
+        raise HTTPException(status_code=404, detail="Fund not found")
+
     override_repo = FundAllocationOverrideRepository(session)
+    return override_repo.upsert_many(workspace_id, [
+        {
+            "fund_id": o.fund_id,
+            "year": o.year,
+            "month": o.month,
+            "allocation_percentage": o.allocation_percentage or 0,
+            "override_amount": o.override_amount,
+            "mode": o.mode,
+        }
+        for o in overrides
+    ])
 
-    # Check if override already exists
-    existing = override_repo.read_by_fund_and_period(
-        workspace_id,
-        override_data.fund_id,
-        override_data.year,
-        override_data.month
-    )
 
-    if existing:
-        # Update existing
-        existing.allocation_percentage = override_data.allocation_percentage or 0
-        existing.override_amount = override_data.override_amount
-        existing.mode = override_data.mode
-        return override_repo.update(existing)
-    else:
-        # Create new
-        override = FundAllocationOverrideModel(
-            workspace_id=workspace_id,
-            fund_id=override_data.fund_id,
-            year=override_data.year,
-            month=override_data.month,
-            allocation_percentage=override_data.allocation_percentage or 0,
-            override_amount=override_data.override_amount,
-            mode=override_data.mode,
-        )
-        return override_repo.create(override)
+def _upsert_override(session: Session, workspace_id: str, override_data: FundAllocationOverrideCreate):
+    return _upsert_overrides(session, workspace_id, [override_data])[0]
 
 
-@router.get("/fund-allocation-overrides")
-def list_overrides(
-    year: Optional[int] = None,
-    month: Optional[int] = None,
+@router.post("/fund-allocation-overrides")
+async def create_or_update_override(
+    override_data: FundAllocationOverrideCreate,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """List all fund allocation overrides, optionally filtered by period"""
-    from src.data.repositories import FundAllocationOverrideRepository
+    """Create or update a fund allocation override for a specific month"""
+    return await session.run_sync(_upsert_override, workspace_id, override_data)
+
+
+@router.post("/fund-allocation-overrides/batch")
+async def create_or_update_overrides(
+    overrides: List[FundAllocationOverrideCreate],
+    workspace_id: str = Depends(get_workspace_id),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """Create or update many month x fund overrides in a single transaction"""
+    if not overrides:
+        return []
+    return await session.run_sync(_upsert_overrides, workspace_id, overrides)
+
+
+def _list_overrides(session: Session, workspace_id: str, year: Optional[int], month: Optional[int]):
 
     override_repo = FundAllocationOverrideRepository(session)
 
@@ -898,16 +1163,18 @@ def list_overrides(
     return overrides
 
 
-@router.delete("/fund-allocation-overrides/{fund_id}/{year}/{month}")
-def delete_override(
-    fund_id: str,
-    year: int,
-    month: int,
+@router.get("/fund-allocation-overrides")
+async def list_overrides(
+    year: Optional[int] = None,
+    month: Optional[int] = None,
     workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """Delete a fund allocation override (revert to fund default)"""
-    from src.data.repositories import FundRepository, FundAllocationOverrideRepository
+    """List all fund allocation overrides, optionally filtered by period"""
+    return await session.run_sync(_list_overrides, workspace_id, year, month)
+
+
+def _delete_override(session: Session, workspace_id: str, fund_id: str, year: int, month: int):
 
     # Verify fund belongs to workspace
     fund_repo = FundRepository(session)
@@ -922,11 +1189,23 @@ def delete_override(
     return {"message": "Override deleted"}
 
 
+@router.delete("/fund-allocation-overrides/{fund_id}/{year}/{month}")
+async def delete_override(
+    fund_id: str,
+    year: int,
+    month: int,
+    workspace_id: str = Depends(get_workspace_id),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """Delete a fund allocation override (revert to fund default)"""
+    return await session.run_sync(_delete_override, workspace_id, fund_id, year, month)
+
+
 # ─── Fund Tracker helpers ───
 
 def _get_fund_income_for_month(session: Session, workspace_id: str, fund_id: str, year: int, month: int) -> Decimal:
     """Sum of income-category transaction postings tagged to a specific fund for a given month."""
-    start, end = _get_month_range(year, month)
+    start, end = _month_bounds(year, month)
     result = session.query(
         func.sum(PostingModel.base_amount)
     ).join(
@@ -938,7 +1217,7 @@ def _get_fund_income_for_month(session: Session, workspace_id: str, fund_id: str
         TransactionModel.fund_id == fund_id,
         TransactionModel.category_id.isnot(None),
         TransactionModel.timestamp >= start,
-        TransactionModel.timestamp <= end,
+        TransactionModel.timestamp < end,
         CategoryModel.type == 'income',
         PostingModel.base_amount > 0
     ).scalar()
@@ -970,12 +1249,7 @@ def _compute_fund_contribution(
     if savings_remainder < 0:
         return Decimal(0)
 
-    override_key = (fund.id, year, month)
-    if override_key in override_map:
-        pct = override_map[override_key]
-    else:
-        pct = Decimal(str(fund.allocation_percentage))
-
+    pct = override_map.get((fund.id, year, month), fund.allocation_percentage)
     return savings_remainder * pct / 100
 
 
@@ -984,20 +1258,18 @@ def _compute_fund_contribution(
 @router.get("/fund-tracker", response_model=FundTrackerResponse)
 def get_fund_tracker(
     years: int = Query(default=1, ge=1, le=5),
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """
     Get fund & account tracker data with monthly ledger per fund
     and account-level expected vs actual balances.
     """
+    workspace_id, session = scope
     try:
-        from src.data.repositories import ScenarioRepository, FundAllocationOverrideRepository
-        from sqlalchemy.orm import joinedload
 
         # Load all active funds with account links
         funds = session.query(FundModel).options(
-            joinedload(FundModel.account_links).joinedload(FundAccountLinkModel.account)
+            selectinload(FundModel.account_links).joinedload(FundAccountLinkModel.account)
         ).filter(
             FundModel.workspace_id == workspace_id,
             FundModel.is_active == True
@@ -1022,21 +1294,24 @@ def get_fund_tracker(
         active_scenario = scenario_repo.read_active(workspace_id)
         budget_benchmark = Decimal(str(active_scenario.monthly_expenses_total)) if active_scenario else Decimal(0)
 
-        # Load overrides (percentage for non-WC funds, amount/mode for WC)
+        # Time range
+        now = datetime.utcnow()
+        current_year = now.year
+        start_year = current_year - years + 1
+
+        # Load overrides for the tracked years (percentage for non-WC funds,
+        # amount/mode for WC); Numeric columns already load as Decimal
         override_repo = FundAllocationOverrideRepository(session)
-        all_overrides = override_repo.read_by_workspace(workspace_id)
+        all_overrides = override_repo.read_by_year_range(workspace_id, start_year, current_year)
         override_map = {}
         amount_override_map = {}  # (fund_id, year, month) -> (amount, mode)
         for o in all_overrides:
             key = (o.fund_id, o.year, o.month)
             if o.override_amount is not None or o.mode is not None:
                 # Store both amount and mode
-                amount_override_map[key] = (
-                    Decimal(str(o.override_amount)) if o.override_amount is not None else None,
-                    o.mode
-                )
+                amount_override_map[key] = (o.override_amount, o.mode)
             else:
-                override_map[key] = Decimal(str(o.allocation_percentage))
+                override_map[key] = o.allocation_percentage
 
         # Find Working Capital fund ID for savings remainder calculation
         wc_fund = next((f for f in funds if f.name == "Working Capital"), None)
@@ -1045,11 +1320,6 @@ def get_fund_tracker(
         # Detect self-funding funds
         sf_map = _compute_self_funding_metadata(funds, wc_fund)
 
-        # Time range
-        now = datetime.utcnow()
-        current_year = now.year
-        start_year = current_year - years + 1
-
         # Build month list
         months_list = []
         for y in range(start_year, current_year + 1):
@@ -1057,8 +1327,13 @@ def get_fund_tracker(
             for m in range(1, end_month + 1):
                 months_list.append((y, m))
 
+        # Workspace income and expenses for every month in range, one query
+        income_by_month, expenses_by_month = _batch_income_expenses(
+            session, workspace_id,
+            datetime(start_year, 1, 1), _month_bounds(current_year, now.month)[1],
+        )
+
         # ── Batch account credit/debit sums (shared by fund & account ledgers) ──
-        from sqlalchemy import extract
         acct_ext_filter = [PostingModel.account_id != external_account_id] if external_account_id else []
         monthly_credits_q = session.query(
             PostingModel.account_id,
@@ -1114,21 +1389,17 @@ def get_fund_tracker(
         monthly_sweep_savings: Dict[tuple, Decimal] = {}
         monthly_sweep_wc_amount: Dict[tuple, Decimal] = {}
         wc_sweep_running = wc_opening
+        # Per-fund terms of K that don't change month to month
+        sf_k_weights = _self_funding_weights(funds, sf_map)
         for y, m in months_list:
             # K for this month
             K = Decimal(0)
-            for f_k in funds:
-                if f_k.name == "Working Capital":
-                    continue
-                sf_k = sf_map.get(f_k.id)
-                if not sf_k:
-                    continue
-                pct_k = override_map.get((f_k.id, y, m), Decimal(str(f_k.allocation_percentage)))
-                K += pct_k * Decimal(str(sf_k["self_funding_percentage"])) / Decimal(10000)
+            for f_k, weight in sf_k_weights:
+                K += override_map.get((f_k.id, y, m), f_k.allocation_percentage) * weight
 
             # Pure cash basis: use current month income
-            net_inc = _get_income_for_month(session, workspace_id, y, m)
-            actual_costs = _get_expenses_for_month(session, workspace_id, y, m)
+            net_inc = income_by_month.get((y, m), Decimal(0))
+            actual_costs = expenses_by_month.get((y, m), Decimal(0))
             wc_key = (wc_fund_id, y, m) if wc_fund_id else None
             apply_self_funding = False
 
@@ -1218,11 +1489,11 @@ def get_fund_tracker(
                     fund_current_month_contribution[f.id] = contribution
 
                 # Actual credits & debits: per-fund transaction-level queries
-                start, end = _get_month_range(y, m)
+                start, end = _month_bounds(y, m)
                 common_filters = [
                     TransactionModel.workspace_id == workspace_id,
                     TransactionModel.timestamp >= start,
-                    TransactionModel.timestamp <= end,
+                    TransactionModel.timestamp < end,
                 ]
                 ext_filter = [PostingModel.account_id != external_account_id] if external_account_id else []
 
@@ -1284,7 +1555,7 @@ def get_fund_tracker(
                     TransactionModel.fund_id == f.id,
                     or_(TransactionModel.type.is_(None), TransactionModel.type != "transfer"),
                     TransactionModel.timestamp >= start,
-                    TransactionModel.timestamp <= end,
+                    TransactionModel.timestamp < end,
                 ]
                 charge_q = session.query(
                     CategoryModel.name,
@@ -1339,15 +1610,12 @@ def get_fund_tracker(
                 if f.name == "Working Capital":
                     # Compute self-funding deduction: contributions earmarked for self-funding funds
                     sf_deduction = Decimal(0)
-                    for sf_fund_id, sf_info_data in sf_map.items():
-                        sf_fund_obj = next((sf for sf in funds if sf.id == sf_fund_id), None)
-                        if sf_fund_obj:
-                            sf_contrib = _compute_fund_contribution(
-                                sf_fund_obj, savings_remainder, budget_benchmark,
-                                override_map, y, m, amount_override_map=amount_override_map,
-                            )
-                            sf_pct = Decimal(str(sf_info_data["self_funding_percentage"])) / 100
-                            sf_deduction += sf_contrib * sf_pct
+                    for sf_fund_obj, _ in sf_k_weights:
+                        sf_contrib = _compute_fund_contribution(
+                            sf_fund_obj, savings_remainder, budget_benchmark,
+                            override_map, y, m, amount_override_map=amount_override_map,
+                        )
+                        sf_deduction += sf_contrib * sf_map[sf_fund_obj.id]["self_funding_percentage"] / 100
                     self_funding_credits = sf_deduction
                     closing = opening + actual_credits - sf_deduction - actual_debits
                 else:
@@ -1403,7 +1671,7 @@ def get_fund_tracker(
         # ── Account summaries ──
         # Batch queries: 2 grouped queries instead of 2 per account
         prev_y, prev_m = _prev_month(now.year, now.month)
-        _, prev_month_end = _get_month_range(prev_y, prev_m)
+        _, prev_month_end = _month_bounds(prev_y, prev_m)
 
         # All-time posting sums grouped by account (single query) — base currency
         alltime_sums = dict(
@@ -1429,7 +1697,7 @@ def get_fund_tracker(
             ).join(
                 TransactionModel, PostingModel.transaction_id == TransactionModel.id
             ).filter(
-                TransactionModel.timestamp <= prev_month_end,
+                TransactionModel.timestamp < prev_month_end,
             ).group_by(PostingModel.account_id).all()
         )
 
@@ -1440,7 +1708,6 @@ def get_fund_tracker(
         base_currency = workspace.base_currency if workspace else "SGD"
 
         # Fetch current FX rates for all unique account currencies
-        from src.services.price_service import PriceService
         price_service = PriceService()
         unique_currencies = {acc.account_currency for acc in all_accounts if acc.account_currency != base_currency}
         fx_rates = {}
@@ -1577,7 +1844,7 @@ def get_fund_tracker(
         ytd_wc_surplus = Decimal(0)
         for y, m in months_list:
             if y == current_year:
-                actual_expenses = _get_expenses_for_month(session, workspace_id, y, m)
+                actual_expenses = expenses_by_month.get((y, m), Decimal(0))
                 ytd_wc_surplus += budget_benchmark - actual_expenses
 
         # ── Unallocated remainder: savings not assigned to any fund ──
@@ -1586,7 +1853,7 @@ def get_fund_tracker(
         for y, m in months_list:
             if y == current_year:
                 # Pure cash basis: use current month income
-                net_income = _get_income_for_month(session, workspace_id, y, m)
+                net_income = income_by_month.get((y, m), Decimal(0))
                 savings_rem = net_income - budget_benchmark
                 month_allocated = Decimal(0)
                 for f in funds:
@@ -1696,16 +1963,14 @@ def get_fund_tracker(
 @router.get("/net-worth", response_model=NetWorthResponse)
 def get_net_worth(
     years: int = Query(default=1, ge=1, le=5),
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """
     Get portfolio / net worth view with mark-to-market FX valuations
     and historical net worth progression.
     """
+    workspace_id, session = scope
     try:
-        from src.services.price_service import PriceService
-        from datetime import date
 
         price_service = PriceService()
 
@@ -1843,7 +2108,7 @@ def get_net_worth(
         history = []
         for y, m in history_months:
             _, last_day = monthrange(y, m)
-            month_end = datetime(y, m, last_day, 23, 59, 59)
+            _, month_end = _month_bounds(y, m)
 
             # Native balances at month-end per account
             month_native_sums = dict(
@@ -1853,7 +2118,7 @@ def get_net_worth(
                 ).join(
                     TransactionModel, PostingModel.transaction_id == TransactionModel.id
                 ).filter(
-                    TransactionModel.timestamp <= month_end,
+                    TransactionModel.timestamp < month_end,
                 ).group_by(PostingModel.account_id).all()
             )
 
@@ -1953,20 +2218,18 @@ class MonthlyDashboardResponse(BaseModel):
 def get_monthly_dashboard(
     year: int,
     month: int,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session),
+    scope: Scope = Depends(get_scope),
 ):
     """
     Get monthly dashboard data: per-fund spending vs budget by category,
     plus fund extraction (allocation split) for the month.
     """
+    workspace_id, session = scope
     try:
-        from src.data.repositories import ScenarioRepository, FundAllocationOverrideRepository
-        from sqlalchemy.orm import joinedload
 
         # ── Load funds with account links (needed for balance computation) ──
         funds = session.query(FundModel).options(
-            joinedload(FundModel.account_links).joinedload(FundAccountLinkModel.account)
+            selectinload(FundModel.account_links).joinedload(FundAccountLinkModel.account)
         ).filter(
             FundModel.workspace_id == workspace_id,
             FundModel.is_active == True,
@@ -1989,18 +2252,15 @@ def get_monthly_dashboard(
 
         # ── Overrides for fund allocation ──
         override_repo = FundAllocationOverrideRepository(session)
-        all_overrides = override_repo.read_by_workspace(workspace_id)
+        all_overrides = override_repo.read_by_year_range(workspace_id, year, year)
         pct_override_map = {}
         amount_override_map = {}  # (fund_id, year, month) -> (amount, mode)
         for o in all_overrides:
             key = (o.fund_id, o.year, o.month)
             if o.override_amount is not None or o.mode is not None:
-                amount_override_map[key] = (
-                    Decimal(str(o.override_amount)) if o.override_amount is not None else None,
-                    o.mode
-                )
+                amount_override_map[key] = (o.override_amount, o.mode)
             else:
-                pct_override_map[key] = Decimal(str(o.allocation_percentage))
+                pct_override_map[key] = o.allocation_percentage
 
         # ── WC fund and balance for sweep ──
         wc_fund = next((f for f in funds if f.name == "Working Capital"), None)
@@ -2015,9 +2275,12 @@ def get_monthly_dashboard(
 
         # ── Precompute monthly incomes for all months Jan..selected month ──
         # Pure cash basis: use current month income (avoids redundant queries per fund)
-        monthly_incomes: Dict[int, Decimal] = {}
-        for m in range(1, month + 1):
-            monthly_incomes[m] = _get_income_for_month(session, workspace_id, year, m)
+        income_by_month, expenses_by_month = _batch_income_expenses(
+            session, workspace_id, datetime(year, 1, 1), _month_bounds(year, month)[1],
+        )
+        monthly_incomes: Dict[int, Decimal] = {
+            m: income_by_month.get((year, m), Decimal(0)) for m in range(1, month + 1)
+        }
 
         allocated_fixed_cost = budget_benchmark
 
@@ -2025,20 +2288,15 @@ def get_monthly_dashboard(
         monthly_sweep_savings: Dict[int, Decimal] = {}
         monthly_sweep_wc_amount: Dict[int, Decimal] = {}
         wc_sweep_running = wc_opening
+        sf_k_weights = _self_funding_weights(funds, sf_map)
         for m_s in range(1, month + 1):
             K = Decimal(0)
-            for f_k in funds:
-                if f_k.name == "Working Capital":
-                    continue
-                sf_k = sf_map.get(f_k.id)
-                if not sf_k:
-                    continue
-                pct_k = pct_override_map.get((f_k.id, year, m_s), Decimal(str(f_k.allocation_percentage)))
-                K += pct_k * Decimal(str(sf_k["self_funding_percentage"])) / Decimal(10000)
+            for f_k, weight in sf_k_weights:
+                K += pct_override_map.get((f_k.id, year, m_s), f_k.allocation_percentage) * weight
 
             wc_key = (wc_fund_id, year, m_s) if wc_fund_id else None
             net_inc = monthly_incomes[m_s]
-            actual_costs = _get_expenses_for_month(session, workspace_id, year, m_s)
+            actual_costs = expenses_by_month.get((year, m_s), Decimal(0))
             apply_self_funding = False
 
             if wc_key and wc_key in amount_override_map:
@@ -2095,7 +2353,7 @@ def get_monthly_dashboard(
         ).first()
         external_account_id = external_acc.id if external_acc else None
 
-        start, end = _get_month_range(year, month)
+        start, end = _month_bounds(year, month)
 
         # ── Workspace currency ──
         currency = ws.base_currency if ws else "SGD"
@@ -2136,7 +2394,7 @@ def get_monthly_dashboard(
                 if not is_wc:
                     fund_balance += _get_fund_income_for_month(session, workspace_id, f.id, year, m)
                 # Subtract actual debits for prior months (transfer-aware)
-                m_start, m_end = _get_month_range(year, m)
+                m_start, m_end = _month_bounds(year, m)
                 ext_filt = [PostingModel.account_id != external_account_id] if external_account_id else []
                 # Non-transfer debits
                 prior_debits_nt = session.query(
@@ -2148,7 +2406,7 @@ def get_monthly_dashboard(
                     or_(TransactionModel.type.is_(None), TransactionModel.type != "transfer"),
                     TransactionModel.fund_id == f.id,
                     TransactionModel.timestamp >= m_start,
-                    TransactionModel.timestamp <= m_end,
+                    TransactionModel.timestamp < m_end,
                     PostingModel.base_amount < 0,
                     *ext_filt,
                 ).scalar() or Decimal(0)
@@ -2162,7 +2420,7 @@ def get_monthly_dashboard(
                     TransactionModel.type == "transfer",
                     TransactionModel.source_fund_id == f.id,
                     TransactionModel.timestamp >= m_start,
-                    TransactionModel.timestamp <= m_end,
+                    TransactionModel.timestamp < m_end,
                     PostingModel.base_amount < 0,
                     *ext_filt,
                 ).scalar() or Decimal(0)
@@ -2176,7 +2434,7 @@ def get_monthly_dashboard(
                     TransactionModel.type == "transfer",
                     TransactionModel.dest_fund_id == f.id,
                     TransactionModel.timestamp >= m_start,
-                    TransactionModel.timestamp <= m_end,
+                    TransactionModel.timestamp < m_end,
                     PostingModel.base_amount > 0,
                     *ext_filt,
                 ).scalar() or Decimal(0)
@@ -2190,7 +2448,7 @@ def get_monthly_dashboard(
                 TransactionModel.fund_id == f.id,
                 or_(TransactionModel.type.is_(None), TransactionModel.type != "transfer"),
                 TransactionModel.timestamp >= start,
-                TransactionModel.timestamp <= end,
+                TransactionModel.timestamp < end,
             ]
             ext_filter = [PostingModel.account_id != external_account_id] if external_account_id else []
 
@@ -1,24 +1,28 @@
 """Authentication endpoints"""
 
 import os
-import json
 from datetime import datetime, date
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from config.settings import JWT_SECRET
 from src.data.database import get_session
 from src.data.repositories import UserRepository, WorkspaceRepository, FundRepository, CategoryRepository, PaymentMethodRepository
 from src.data.models import UserModel, WorkspaceModel, FundModel, CategoryModel, PaymentMethodModel
-from src.services.auth_service import AuthService
+from src.services.auth_service import AuthService, JWT_ALGORITHM, JWT_PRIVATE_KEY, JWT_PUBLIC_KEY
 from src.api.deps import get_user_id
 
 router = APIRouter()
 
-JWT_SECRET = os.environ.get("JWT_SECRET", "dev-secret-key-change-in-production")
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID", "")
-auth_service = AuthService(secret_key=JWT_SECRET)
+auth_service = AuthService(
+    secret_key=JWT_SECRET,
+    algorithm=JWT_ALGORITHM,
+    private_key=JWT_PRIVATE_KEY,
+    public_key=JWT_PUBLIC_KEY,
+)
 
 CURRENT_TOS_VERSION = "1.0"
 
@@ -255,9 +259,9 @@ def _build_user_response(user, workspace_id: str) -> UserResponse:
         last_name=user.last_name or "",
         workspace_id=workspace_id,
         date_of_birth=user.date_of_birth,
-        nationalities=json.loads(user.nationalities or '[]'),
-        tax_residencies=json.loads(user.tax_residencies or '[]'),
-        countries_of_interest=json.loads(user.countries_of_interest or '[]'),
+        nationalities=user.nationalities or [],
+        tax_residencies=user.tax_residencies or [],
+        countries_of_interest=user.countries_of_interest or [],
         phone_country_code=user.phone_country_code,
         phone_number=user.phone_number,
         address_line1=user.address_line1,
@@ -308,9 +312,9 @@ def signup(
         last_name=req.last_name,
         display_name=f"{req.first_name} {req.last_name}",
         date_of_birth=req.date_of_birth,
-        nationalities=json.dumps(req.nationalities),
-        tax_residencies=json.dumps(req.tax_residencies),
-        countries_of_interest=json.dumps(req.countries_of_interest),
+        nationalities=req.nationalities,
+        tax_residencies=req.tax_residencies,
+        countries_of_interest=req.countries_of_interest,
         phone_country_code=req.phone_country_code,
         phone_number=req.phone_number,
         address_line1=req.address_line1,
@@ -494,9 +498,9 @@ def complete_profile(
         user.last_name = req.last_name
     user.display_name = f"{user.first_name or ''} {user.last_name or ''}".strip()
     user.date_of_birth = req.date_of_birth
-    user.nationalities = json.dumps(req.nationalities)
-    user.tax_residencies = json.dumps(req.tax_residencies)
-    user.countries_of_interest = json.dumps(req.countries_of_interest)
+    user.nationalities = req.nationalities
+    user.tax_residencies = req.tax_residencies
+    user.countries_of_interest = req.countries_of_interest
     user.phone_country_code = req.phone_country_code
     user.phone_number = req.phone_number
     user.address_line1 = req.address_line1
@@ -0,0 +1,83 @@
+"""Batch endpoint — dispatch several API calls in one round-trip"""
+
+import asyncio
+import posixpath
+import secrets
+from typing import Optional
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from src.api.deps import get_user_id
+from src.api.schemas import BatchRequest, BatchResponse, BatchSubRequest
+
+router = APIRouter()
+
+_ALLOWED_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+_BATCH_PATH = "/api/v1/batch"
+
+# Every sub-request carries this header with a per-process secret value.
+# batch() refuses to run when it is present, so nesting is rejected however
+# the sub-request URL is spelled; clients can't know the value to forge it.
+_BATCH_MARKER_HEADER = "x-ledgera-batch-depth"
+_BATCH_MARKER = secrets.token_hex(16)
+
+
+def _normalized_path(url: str) -> Optional[str]:
+    """Percent-decoded, dot-segment-free path of a sub-request URL (what Starlette routes on).
+
+    None if the URL can't be parsed.
+    """
+    try:
+        path = httpx.URL(url).path
+    except httpx.InvalidURL:
+        return None
+    return posixpath.normpath(path) if path else "/"
+
+
+async def _dispatch(client: httpx.AsyncClient, sub: BatchSubRequest, auth_header: Optional[str]) -> dict:
+    """Run one sub-request through the app and shape its result."""
+    headers = {k: v for k, v in sub.headers.items() if k.lower() != _BATCH_MARKER_HEADER}
+    if auth_header and not any(k.lower() == "authorization" for k in headers):
+        headers["Authorization"] = auth_header
+    headers[_BATCH_MARKER_HEADER] = _BATCH_MARKER
+
+    kwargs = {"headers": headers}
+    if sub.body is not None:
+        kwargs["json"] = sub.body
+
+    response = await client.request(sub.method.upper(), sub.url, **kwargs)
+    try:
+        body = response.json()
+    except ValueError:
+        body = response.text or None
+    return {"id": sub.id, "status": response.status_code, "body": body}
+
+
+@router.post("/batch", response_model=BatchResponse, dependencies=[Depends(get_user_id)])
+async def batch(payload: BatchRequest, request: Request):
+    """
+    Execute several API requests in parallel, in-process.
+
+    Each sub-request runs through the full middleware stack with the caller's
+    Authorization header (unless it provides its own), so auth and workspace
+    scoping behave exactly as for standalone calls.
+    """
+    if secrets.compare_digest(request.headers.get(_BATCH_MARKER_HEADER, ""), _BATCH_MARKER):
+        raise HTTPException(status_code=400, detail="Batch requests cannot be nested")
+
+    for sub in payload.requests:
+        if sub.method.upper() not in _ALLOWED_METHODS:
+            raise HTTPException(status_code=400, detail=f"Unsupported method in request {sub.id}")
+        path = _normalized_path(sub.url) if sub.url.startswith("/") else None
+        if path is None or path.rstrip("/") == _BATCH_PATH:
+            raise HTTPException(status_code=400, detail=f"Invalid url in request {sub.id}")
+
+    auth_header = request.headers.get("Authorization")
+    transport = httpx.ASGITransport(app=request.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://batch") as client:
+        results = await asyncio.gather(
+            *(_dispatch(client, sub, auth_header) for sub in payload.requests)
+        )
+
+    return {"responses": results}
@@ -1,9 +1,7 @@
 """Category, Subcategory, and Fund endpoints"""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from src.data.database import get_session
 from src.data.repositories import CategoryRepository, SubcategoryRepository, FundRepository
 from src.data.models import CategoryModel, SubcategoryModel, FundModel
 from src.api.schemas import (
@@ -11,7 +9,7 @@ from src.api.schemas import (
     SubcategoryCreate, SubcategoryResponse,
     FundCreate, FundResponse
 )
-from src.api.deps import get_workspace_id
+from src.api.deps import Scope, get_scope
 
 router = APIRouter()
 
@@ -23,10 +21,10 @@ router = APIRouter()
 @router.post("", response_model=CategoryResponse)
 def create_category(
     category: CategoryCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Create a new category in the current workspace"""
+    workspace_id, session = scope
     db_category = CategoryModel(
         workspace_id=workspace_id,
         name=category.name,
@@ -43,11 +41,11 @@ def create_category(
 
 @router.get("", response_model=list[CategoryResponse])
 def list_categories(
-    workspace_id: str = Depends(get_workspace_id),
+    scope: Scope = Depends(get_scope),
     category_type: str = None,
-    session: Session = Depends(get_session)
 ):
     """List all categories in the current workspace"""
+    workspace_id, session = scope
     repo = CategoryRepository(session)
 
     if category_type:
@@ -65,10 +63,10 @@ def list_categories(
 @router.post("/subcategories", response_model=SubcategoryResponse)
 def create_subcategory(
     subcategory: SubcategoryCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Create a new subcategory"""
+    workspace_id, session = scope
     # Verify category exists and belongs to workspace
     cat_repo = CategoryRepository(session)
     category = cat_repo.read(subcategory.category_id)
@@ -91,10 +89,10 @@ def create_subcategory(
 @router.get("/subcategories", response_model=list[SubcategoryResponse])
 def list_subcategories(
     category_id: str = None,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """List subcategories (optionally filter by category)"""
+    workspace_id, session = scope
     repo = SubcategoryRepository(session)
     
     if category_id:
@@ -120,10 +118,10 @@ def list_subcategories(
 @router.get("/subcategories/{subcategory_id}", response_model=SubcategoryResponse)
 def get_subcategory(
     subcategory_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Get subcategory by ID"""
+    workspace_id, session = scope
     repo = SubcategoryRepository(session)
     subcategory = repo.read(subcategory_id)
     
@@ -143,10 +141,10 @@ def get_subcategory(
 def update_subcategory(
     subcategory_id: str,
     subcategory_data: SubcategoryCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update subcategory"""
+    workspace_id, session = scope
     repo = SubcategoryRepository(session)
     subcategory = repo.read(subcategory_id)
     
@@ -175,10 +173,10 @@ def update_subcategory(
 @router.delete("/subcategories/{subcategory_id}")
 def delete_subcategory(
     subcategory_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Delete subcategory"""
+    workspace_id, session = scope
     repo = SubcategoryRepository(session)
     subcategory = repo.read(subcategory_id)
     
@@ -226,10 +224,10 @@ def _build_fund_response(fund: FundModel) -> dict:
 @router.post("/funds", response_model=FundResponse)
 def create_fund(
     fund: FundCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Create a new fund in the current workspace"""
+    workspace_id, session = scope
     db_fund = FundModel(
         workspace_id=workspace_id,
         name=fund.name,
@@ -256,10 +254,10 @@ def create_fund(
 
 @router.get("/funds", response_model=list[FundResponse])
 def list_funds(
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """List all active funds in the current workspace"""
+    workspace_id, session = scope
     repo = FundRepository(session)
     funds = repo.read_by_workspace(workspace_id)
 
@@ -269,10 +267,10 @@ def list_funds(
 @router.get("/funds/{fund_id}", response_model=FundResponse)
 def get_fund(
     fund_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Get fund by ID"""
+    workspace_id, session = scope
     repo = FundRepository(session)
     fund = repo.read(fund_id)
 
@@ -286,10 +284,10 @@ def get_fund(
 def update_fund(
     fund_id: str,
     fund_data: FundCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update fund"""
+    workspace_id, session = scope
     repo = FundRepository(session)
     fund = repo.read(fund_id)
 
@@ -317,10 +315,10 @@ def update_fund(
 @router.delete("/funds/{fund_id}")
 def delete_fund(
     fund_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Delete fund"""
+    workspace_id, session = scope
     repo = FundRepository(session)
     fund = repo.read(fund_id)
 
@@ -341,10 +339,10 @@ def delete_fund(
 @router.get("/{category_id}", response_model=CategoryResponse)
 def get_category(
     category_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Get category by ID"""
+    workspace_id, session = scope
     repo = CategoryRepository(session)
     category = repo.read(category_id)
 
@@ -358,10 +356,10 @@ def get_category(
 def update_category(
     category_id: str,
     category_data: CategoryCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update category"""
+    workspace_id, session = scope
     repo = CategoryRepository(session)
     category = repo.read(category_id)
 
@@ -380,10 +378,10 @@ def update_category(
 @router.delete("/{category_id}")
 def delete_category(
     category_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Delete category"""
+    workspace_id, session = scope
     repo = CategoryRepository(session)
     category = repo.read(category_id)
 
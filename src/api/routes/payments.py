@@ -3,13 +3,11 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 
-from src.data.database import get_session
 from src.data.repositories import CardRepository, PaymentMethodRepository, AccountRepository
 from src.data.models import CardModel, PaymentMethodModel
 from src.api.schemas import CardCreate, CardResponse, PaymentMethodCreate, PaymentMethodResponse
-from src.api.deps import get_workspace_id
+from src.api.deps import Scope, get_scope
 
 router = APIRouter()
 
@@ -53,10 +51,10 @@ def _serialize_pm(pm: PaymentMethodModel) -> dict:
 
 @router.get("/cards")
 def get_cards(
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """List all active cards for the workspace."""
+    workspace_id, session = scope
     repo = CardRepository(session)
     cards = repo.read_by_workspace(workspace_id)
     return [_serialize_card(c) for c in cards]
@@ -65,10 +63,10 @@ def get_cards(
 @router.post("/cards")
 def create_card(
     card: CardCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Create a new card and auto-create its payment method."""
+    workspace_id, session = scope
     # Validate account exists in workspace
     account_repo = AccountRepository(session)
     account = account_repo.read_for_workspace(card.account_id, workspace_id)
@@ -116,10 +114,10 @@ def create_card(
 def update_card(
     card_id: str,
     card: CardCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update a card and sync its payment method."""
+    workspace_id, session = scope
     card_repo = CardRepository(session)
     db_card = card_repo.read(card_id)
 
@@ -158,10 +156,10 @@ def update_card(
 @router.delete("/cards/{card_id}")
 def delete_card(
     card_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Soft-delete a card and its payment method."""
+    workspace_id, session = scope
     card_repo = CardRepository(session)
     db_card = card_repo.read(card_id)
 
@@ -186,10 +184,10 @@ def delete_card(
 
 @router.get("/methods")
 def get_payment_methods(
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """List all payment methods for the workspace."""
+    workspace_id, session = scope
     repo = PaymentMethodRepository(session)
     methods = repo.read_by_workspace(workspace_id)
     return [_serialize_pm(pm) for pm in methods]
@@ -198,10 +196,10 @@ def get_payment_methods(
 @router.post("/methods")
 def create_payment_method(
     pm: PaymentMethodCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Create a custom payment method."""
+    workspace_id, session = scope
     if pm.method_type not in ("digital_wallet", "custom"):
         raise HTTPException(
             status_code=400,
@@ -232,10 +230,10 @@ def create_payment_method(
 def update_payment_method(
     method_id: str,
     pm: PaymentMethodCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update a payment method (non-system, non-card)."""
+    workspace_id, session = scope
     repo = PaymentMethodRepository(session)
     db_pm = repo.read(method_id)
 
@@ -267,10 +265,10 @@ def update_payment_method(
 @router.delete("/methods/{method_id}")
 def delete_payment_method(
     method_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Delete a payment method (soft-delete). Cannot delete system methods."""
+    workspace_id, session = scope
     repo = PaymentMethodRepository(session)
     db_pm = repo.read(method_id)
 
@@ -14,7 +14,7 @@ from src.api.schemas import (
     MonthlyProjectionResponse,
     ScenarioCreate, ScenarioResponse, ScenarioListItem,
 )
-from src.api.deps import get_workspace_id
+from src.api.deps import Scope, get_scope
 
 router = APIRouter()
 
@@ -144,10 +144,10 @@ def create_forecast(
 @router.post("/scenarios", response_model=ScenarioResponse)
 def save_scenario(
     data: ScenarioCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Save a projection as a named simulation"""
+    workspace_id, session = scope
     repo = ScenarioRepository(session)
 
     if data.is_active:
@@ -177,10 +177,10 @@ def save_scenario(
 
 @router.get("/scenarios")
 def list_scenarios(
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """List all saved simulations for workspace"""
+    workspace_id, session = scope
     repo = ScenarioRepository(session)
     scenarios = repo.read_by_workspace(workspace_id)
     return [
@@ -199,10 +199,10 @@ def list_scenarios(
 
 @router.get("/scenarios/active")
 def get_active_scenario(
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Get the currently active simulation"""
+    workspace_id, session = scope
     repo = ScenarioRepository(session)
     scenario = repo.read_active(workspace_id)
     if not scenario:
@@ -222,10 +222,10 @@ def get_active_scenario(
 @router.get("/scenarios/{scenario_id}", response_model=ScenarioResponse)
 def get_scenario(
     scenario_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Get a saved simulation with full assumptions"""
+    workspace_id, session = scope
     repo = ScenarioRepository(session)
     scenario = repo.read(scenario_id)
     if not scenario or scenario.workspace_id != workspace_id:
@@ -246,10 +246,10 @@ def get_scenario(
 def update_scenario(
     scenario_id: str,
     data: ScenarioCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update a saved simulation"""
+    workspace_id, session = scope
     repo = ScenarioRepository(session)
     scenario = repo.read(scenario_id)
     if not scenario or scenario.workspace_id != workspace_id:
@@ -280,10 +280,10 @@ def update_scenario(
 @router.patch("/scenarios/{scenario_id}/activate")
 def activate_scenario(
     scenario_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Set a simulation as the active budget benchmark"""
+    workspace_id, session = scope
     repo = ScenarioRepository(session)
     scenario = repo.read(scenario_id)
     if not scenario or scenario.workspace_id != workspace_id:
@@ -311,10 +311,10 @@ def activate_scenario(
 @router.delete("/scenarios/{scenario_id}")
 def delete_scenario(
     scenario_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Delete a saved simulation"""
+    workspace_id, session = scope
     repo = ScenarioRepository(session)
     scenario = repo.read(scenario_id)
     if not scenario or scenario.workspace_id != workspace_id:
@@ -5,9 +5,7 @@ from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 
-from src.data.database import get_session
 from src.data.repositories import RecurringTransactionRepository, TransactionRepository, AccountRepository
 from src.data.models import RecurringTransactionModel, TransactionModel, PostingModel, AccountModel, CategoryModel
 from src.api.schemas import (
@@ -16,7 +14,7 @@ from src.api.schemas import (
     ConfirmRecurringRequest,
     SkipRecurringRequest,
 )
-from src.api.deps import get_workspace_id
+from src.api.deps import Scope, get_scope
 
 router = APIRouter()
 
@@ -152,10 +150,10 @@ def _serialize_tx(tx: TransactionModel) -> dict:
 
 @router.get("")
 def list_recurring(
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """List all recurring transaction templates."""
+    workspace_id, session = scope
     repo = RecurringTransactionRepository(session)
     templates = repo.read_by_workspace(workspace_id)
     return [_serialize_recurring(t) for t in templates]
@@ -164,10 +162,10 @@ def list_recurring(
 @router.post("")
 def create_recurring(
     data: RecurringTransactionCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Create a new recurring transaction template."""
+    workspace_id, session = scope
     if data.transaction_type not in VALID_TYPES:
         raise HTTPException(status_code=400, detail=f"transaction_type must be one of: {VALID_TYPES}")
 
@@ -219,10 +217,10 @@ def create_recurring(
 
 @router.get("/pending")
 def get_pending(
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Get all pending recurring instances (computed on-the-fly)."""
+    workspace_id, session = scope
     repo = RecurringTransactionRepository(session)
     now = datetime.utcnow()
     templates = repo.read_pending(workspace_id, now)
@@ -239,10 +237,10 @@ def get_pending(
 def update_recurring(
     recurring_id: str,
     data: RecurringTransactionUpdate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update a recurring transaction template."""
+    workspace_id, session = scope
     repo = RecurringTransactionRepository(session)
     template = repo.read(recurring_id)
 
@@ -275,10 +273,10 @@ def update_recurring(
 @router.delete("/{recurring_id}")
 def delete_recurring(
     recurring_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Delete a recurring transaction template."""
+    workspace_id, session = scope
     repo = RecurringTransactionRepository(session)
     template = repo.read(recurring_id)
 
@@ -294,10 +292,10 @@ def delete_recurring(
 def confirm_recurring(
     recurring_id: str,
     body: ConfirmRecurringRequest,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Confirm a pending recurring instance -- creates a real transaction."""
+    workspace_id, session = scope
     repo = RecurringTransactionRepository(session)
     template = repo.read(recurring_id)
 
@@ -467,10 +465,10 @@ def confirm_recurring(
 def skip_recurring(
     recurring_id: str,
     body: SkipRecurringRequest,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Skip a pending recurring instance without creating a transaction."""
+    workspace_id, session = scope
     repo = RecurringTransactionRepository(session)
     template = repo.read(recurring_id)
 
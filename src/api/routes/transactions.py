@@ -10,23 +10,22 @@ from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from src.data.database import get_session
 from src.data.repositories import TransactionRepository, AccountRepository
 from src.data.models import TransactionModel, PostingModel, FundAccountLinkModel, FundModel, AccountModel, CategoryModel
 from src.api.schemas import TransactionCreate, TransferCreate, FileHeadersResponse, ParsedTransaction, FileParseResult
-from src.api.deps import get_workspace_id
+from src.api.deps import Scope, get_scope, get_workspace_id
 
 router = APIRouter()
 
 
 @router.get("")
 def get_all_transactions(
-    workspace_id: str = Depends(get_workspace_id),
+    scope: Scope = Depends(get_scope),
     start_date: datetime = None,
     end_date: datetime = None,
-    session: Session = Depends(get_session)
 ):
     """Get all transactions for the workspace (no duplicates)"""
+    workspace_id, session = scope
     query = session.query(TransactionModel).filter(
         TransactionModel.workspace_id == workspace_id
     )
@@ -71,10 +70,10 @@ def _serialize_tx(tx: TransactionModel) -> dict:
 @router.post("")
 def create_transaction(
     tx: TransactionCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Create a new transaction with double-entry postings"""
+    workspace_id, session = scope
     account_repo = AccountRepository(session)
 
     # Verify all accounts exist and belong to this workspace
@@ -144,10 +143,10 @@ def _auto_detect_fund(session: Session, account_id: str, workspace_id: str) -> O
 @router.post("/transfer")
 def create_transfer(
     transfer: TransferCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Create a transfer transaction between two accounts with fund tracking"""
+    workspace_id, session = scope
     account_repo = AccountRepository(session)
 
     # Validate accounts exist in workspace
@@ -285,10 +284,10 @@ def create_transfer(
 @router.get("/{transaction_id}")
 def get_transaction(
     transaction_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Get transaction by ID"""
+    workspace_id, session = scope
     repo = TransactionRepository(session)
     tx = repo.read(transaction_id)
 
@@ -302,10 +301,10 @@ def get_transaction(
 def update_transaction(
     transaction_id: str,
     tx_update: TransactionCreate,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update an existing transaction"""
+    workspace_id, session = scope
     repo = TransactionRepository(session)
     tx = repo.read(transaction_id)
 
@@ -366,10 +365,10 @@ def update_transaction(
 @router.delete("/{transaction_id}")
 def delete_transaction(
     transaction_id: str,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Delete a transaction (scoped to workspace)"""
+    workspace_id, session = scope
     repo = TransactionRepository(session)
     tx = repo.read(transaction_id)
 
@@ -383,12 +382,12 @@ def delete_transaction(
 @router.get("/account/{account_id}")
 def get_account_transactions(
     account_id: str,
-    workspace_id: str = Depends(get_workspace_id),
+    scope: Scope = Depends(get_scope),
     start_date: datetime = None,
     end_date: datetime = None,
-    session: Session = Depends(get_session)
 ):
     """Get transactions for an account"""
+    workspace_id, session = scope
     # Verify account belongs to workspace
     account_repo = AccountRepository(session)
     account = account_repo.read_for_workspace(account_id, workspace_id)
@@ -515,12 +514,12 @@ async def parse_file(
     column_mapping: str = Form(...),  # JSON string
     file_type: str = Form(...),
     sheet_name: Optional[str] = Form(None),
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """
     Parse CSV or XLSX file using user-confirmed column mapping and return parsed transactions.
     """
+    workspace_id, session = scope
     import json
 
     try:
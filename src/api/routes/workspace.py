@@ -1,13 +1,11 @@
 """Workspace endpoints"""
 
 from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional
 
-from src.data.database import get_session
 from src.data.repositories import WorkspaceRepository
-from src.api.deps import get_workspace_id
+from src.api.deps import Scope, get_scope
 
 router = APIRouter()
 
@@ -28,10 +26,10 @@ class WorkspaceUpdateRequest(BaseModel):
 
 @router.get("/workspace", response_model=WorkspaceResponse)
 def read_workspace(
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Get current workspace metadata."""
+    workspace_id, session = scope
     workspace_repo = WorkspaceRepository(session)
     workspace = workspace_repo.read(workspace_id)
 
@@ -53,10 +51,10 @@ def read_workspace(
 @router.patch("/workspace", response_model=WorkspaceResponse)
 def update_workspace(
     req: WorkspaceUpdateRequest,
-    workspace_id: str = Depends(get_workspace_id),
-    session: Session = Depends(get_session)
+    scope: Scope = Depends(get_scope),
 ):
     """Update workspace settings."""
+    workspace_id, session = scope
     workspace_repo = WorkspaceRepository(session)
     workspace = workspace_repo.read(workspace_id)
 
@@ -1,7 +1,7 @@
 """Pydantic schemas for API"""
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 from decimal import Decimal
 from datetime import datetime
 from uuid import UUID
@@ -674,3 +674,31 @@ class FileParseResult(BaseModel):
     parsed_transactions: List[ParsedTransaction]
     account_id: str
     account_name: str
+
+
+# ─── Batch schemas ───
+
+class BatchSubRequest(BaseModel):
+    """A single request inside a batch"""
+    id: str
+    url: str  # Path relative to the API root, e.g. "/api/v1/accounts"
+    method: str = "GET"
+    body: Optional[Any] = None
+    headers: Dict[str, str] = {}
+
+
+class BatchRequest(BaseModel):
+    """Batch of requests dispatched in-process"""
+    requests: List[BatchSubRequest] = Field(..., max_length=20)
+
+
+class BatchSubResponse(BaseModel):
+    """Result of a single batched request"""
+    id: str
+    status: int
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    """Results in the same order as the submitted requests"""
+    responses: List[BatchSubResponse]
@@ -2,13 +2,14 @@
 
 from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct, case, String
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import Row, func, distinct, case, delete, select, update, String
 from sqlalchemy.sql import expression
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.types import Date as DateType
 
 from sqlalchemy import text
+from .pagination import before_cursor, encode_cursor
 from .models import (
     UserModel, WorkspaceModel, TransactionModel,
     AccountModel, ScenarioModel, FundModel, RecurringTransactionModel,
@@ -46,6 +47,16 @@ def _td_pg(element, compiler, **kw):
     return f"({compiler.process(element.clauses)})::date"
 
 
+# Columns the admin user listing needs (read as Core rows, no ORM instances)
+_USER_LIST_COLUMNS = (
+    UserModel.id, UserModel.email, UserModel.first_name, UserModel.last_name,
+    UserModel.auth_provider, UserModel.profile_completed, UserModel.is_admin,
+    UserModel.is_disabled, UserModel.email_verified, UserModel.phone_verified,
+    UserModel.address_country, UserModel.created_at, UserModel.last_login_at,
+    UserModel.login_count,
+)
+
+
 class AdminRepository:
     """Cross-tenant repository for admin analytics and user management"""
 
@@ -62,73 +73,123 @@ class AdminRepository:
         is_disabled: Optional[bool] = None,
         offset: int = 0,
         limit: int = 50,
-    ) -> Tuple[List[UserModel], int]:
-        """List all users with search/filter, returns (users, total_count)"""
-        query = self.session.query(UserModel)
-
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Tuple[List[Row], Optional[int], Optional[str]]:
+        """
+        List all users with search/filter, returns (users, total_count, next_cursor).
+
+        Users are plain rows of _USER_LIST_COLUMNS, not ORM instances.
+        Pages are ordered newest first. Pass the previous page's next_cursor to
+        continue with an index seek; offset is only used when no cursor is given.
+        total_count is None unless include_total is set (it costs a COUNT scan);
+        for unfiltered listings on large PostgreSQL tables it is an estimate.
+        """
+        filters = []
         if search:
             like_pattern = f"%{search}%"
-            query = query.filter(
+            filters.append(
                 (UserModel.email.ilike(like_pattern)) |
                 (UserModel.first_name.ilike(like_pattern)) |
                 (UserModel.last_name.ilike(like_pattern))
             )
         if auth_provider:
-            query = query.filter(UserModel.auth_provider == auth_provider)
+            filters.append(UserModel.auth_provider == auth_provider)
         if is_admin is not None:
-            query = query.filter(UserModel.is_admin == is_admin)
+            filters.append(UserModel.is_admin == is_admin)
         if is_disabled is not None:
-            query = query.filter(UserModel.is_disabled == is_disabled)
-
-        total = query.count()
-        users = query.order_by(UserModel.created_at.desc()).offset(offset).limit(limit).all()
-        return users, total
+            filters.append(UserModel.is_disabled == is_disabled)
+
+        total = None
+        if include_total:
+            total = None if filters else self._estimated_count("users")
+            if total is None:
+                total = self.session.execute(
+                    select(func.count()).select_from(UserModel).where(*filters)
+                ).scalar()
+
+        stmt = select(*_USER_LIST_COLUMNS).where(*filters).order_by(
+            UserModel.created_at.desc(), UserModel.id.desc()
+        )
+        if cursor:
+            stmt = stmt.where(before_cursor(UserModel.created_at, UserModel.id, cursor))
+        elif offset:
+            stmt = stmt.offset(offset)
+
+        users = self.session.execute(stmt.limit(limit + 1)).all()
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+        return users, total, next_cursor
+
+    def _estimated_count(self, table_name: str, threshold: int = 100_000) -> Optional[int]:
+        """
+        Planner row estimate from pg_class, or None when unavailable or small.
+
+        Only used for unfiltered counts; below the threshold an exact COUNT is
+        cheap enough and preferable.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return None
+        estimate = self.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :t"),
+            {"t": table_name},
+        ).scalar()
+        if estimate is None or estimate < threshold:
+            return None
+        return int(estimate)
 
     def get_user_detail(self, user_id: str) -> Optional[UserModel]:
         """Get a single user by ID"""
         return self.session.query(UserModel).filter(UserModel.id == user_id).first()
 
-    def disable_user(self, user_id: str) -> Optional[UserModel]:
-        """Disable a user account"""
-        user = self.get_user_detail(user_id)
-        if user:
-            user.is_disabled = True
-            user.updated_at = datetime.utcnow()
-            self.session.commit()
-        return user
+    def _update_user(self, user_id: str, actor_id: Optional[str] = None, **values) -> Optional[str]:
+        """
+        UPDATE one user's flags; returns their email, or None if no row matched.
+
+        With actor_id the statement also requires id <> actor_id, so an admin
+        can't apply the change to themselves.
+        """
+        stmt = update(UserModel).where(UserModel.id == user_id)
+        if actor_id is not None:
+            stmt = stmt.where(UserModel.id != actor_id)
+        email = self.session.execute(
+            stmt
+            .values(updated_at=datetime.utcnow(), **values)
+            .returning(UserModel.email)
+        ).scalar()
+        self.session.commit()
+        return email
+
+    def disable_user(self, user_id: str, actor_id: Optional[str] = None) -> Optional[str]:
+        """Disable a user account (never the actor's own)"""
+        return self._update_user(user_id, actor_id, is_disabled=True)
 
-    def enable_user(self, user_id: str) -> Optional[UserModel]:
+    def enable_user(self, user_id: str) -> Optional[str]:
         """Enable a user account"""
-        user = self.get_user_detail(user_id)
-        if user:
-            user.is_disabled = False
-            user.updated_at = datetime.utcnow()
-            self.session.commit()
-        return user
-
-    def promote_to_admin(self, user_id: str) -> Optional[UserModel]:
+        return self._update_user(user_id, is_disabled=False)
+
+    def promote_to_admin(self, user_id: str) -> Optional[str]:
         """Promote a user to admin"""
-        user = self.get_user_detail(user_id)
-        if user:
-            user.is_admin = True
-            user.updated_at = datetime.utcnow()
-            self.session.commit()
-        return user
-
-    def demote_from_admin(self, user_id: str) -> Optional[UserModel]:
-        """Remove admin role from a user"""
-        user = self.get_user_detail(user_id)
-        if user:
-            user.is_admin = False
-            user.updated_at = datetime.utcnow()
-            self.session.commit()
-        return user
-
-    def delete_user(self, user_id: str) -> bool:
-        """Permanently delete a user and all their data (workspaces, transactions, etc.)"""
-        user = self.get_user_detail(user_id)
-        if not user:
-            return False
+        return self._update_user(user_id, is_admin=True)
+
+    def demote_from_admin(self, user_id: str, actor_id: Optional[str] = None) -> Optional[str]:
+        """Remove admin role from a user (never the actor's own)"""
+        return self._update_user(user_id, actor_id, is_admin=False)
+
+    def delete_user(
+        self, user_id: str, actor_id: Optional[str] = None
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Permanently delete a user and all their data (workspaces, transactions, etc.)
+
+        Returns (email, firebase_uid) of the deleted user, or None if not found
+        or if user_id is the actor's own id.
+        """
+        if user_id == actor_id:
+            # The final DELETE would match nothing; skip the cascade entirely
+            return None
 
         # Get all workspace IDs owned by this user
         workspace_ids = [
@@ -217,9 +278,16 @@ class AdminRepository:
         ), {"uid": user_id})
 
         # Delete the user
-        self.session.delete(user)
+        deleted = self.session.execute(
+            delete(UserModel)
+            .where(UserModel.id == user_id, UserModel.id != actor_id)
+            .returning(UserModel.email, UserModel.firebase_uid)
+        ).first()
+        if deleted is None:
+            self.session.rollback()
+            return None
         self.session.commit()
-        return True
+        return deleted.email, deleted.firebase_uid
 
     # ── System Overview ──
 
@@ -240,8 +308,27 @@ class AdminRepository:
 
     # ── Growth Metrics ──
 
+    # On PostgreSQL the closed buckets come from the mv_* materialized views
+    # (see database._GROWTH_VIEWS, refreshed periodically); only the current
+    # bucket is counted live.
+
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _daily_from_view(self, view: str, column: str, days: int) -> List[dict]:
+        today = datetime.utcnow().date()
+        results = self.session.execute(text(
+            f"SELECT day, count FROM {view} WHERE day >= :cutoff AND day < :today "
+            f"UNION ALL "
+            f"SELECT CAST(:today AS date), COUNT(*) FROM users WHERE {column} >= :today "
+            f"ORDER BY day"
+        ), {"cutoff": today - timedelta(days=days), "today": today}).all()
+        return [{"date": str(r.day), "count": r.count} for r in results if r.count]
+
     def get_signups_by_period(self, days: int = 90) -> List[dict]:
         """Daily signup counts for the last N days"""
+        if self._is_postgres():
+            return self._daily_from_view("mv_daily_signups", "created_at", days)
         cutoff = datetime.utcnow() - timedelta(days=days)
         results = self.session.query(
             _to_date(UserModel.created_at).label('date'),
@@ -257,6 +344,8 @@ class AdminRepository:
 
     def get_dau(self, days: int = 30) -> List[dict]:
         """Daily active users (users who logged in) for last N days"""
+        if self._is_postgres():
+            return self._daily_from_view("mv_dau", "last_login_at", days)
         cutoff = datetime.utcnow() - timedelta(days=days)
         results = self.session.query(
             _to_date(UserModel.last_login_at).label('date'),
@@ -274,6 +363,19 @@ class AdminRepository:
     def get_mau(self, months: int = 12) -> List[dict]:
         """Monthly active users for the last N months"""
         cutoff = datetime.utcnow() - timedelta(days=months * 31)
+        if self._is_postgres():
+            month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            results = self.session.execute(text(
+                "SELECT month, count FROM mv_mau WHERE month >= :cutoff AND month < :current "
+                "UNION ALL "
+                "SELECT :current, COUNT(*) FROM users WHERE last_login_at >= :month_start "
+                "ORDER BY month"
+            ), {
+                "cutoff": cutoff.strftime("%Y-%m"),
+                "current": month_start.strftime("%Y-%m"),
+                "month_start": month_start,
+            }).all()
+            return [{"month": r.month, "count": r.count} for r in results if r.count]
         results = self.session.query(
             _year_month(UserModel.last_login_at).label('month'),
             func.count(distinct(UserModel.id)).label('count')
@@ -357,7 +459,22 @@ class AdminRepository:
     def get_retention_cohorts(self, months: int = 6) -> List[dict]:
         """Monthly cohort retention: signup month vs last_login_at"""
         cutoff = datetime.utcnow() - timedelta(days=months * 31)
-        results = self.session.query(
+        if self._is_postgres():
+            results = self.session.execute(text(
+                "SELECT cohort, total, retained FROM mv_retention_cohorts "
+                "WHERE cohort >= :cutoff ORDER BY cohort"
+            ), {"cutoff": cutoff.strftime("%Y-%m")}).all()
+        else:
+            results = self._retention_rows(cutoff)
+        return [{
+            "cohort": r.cohort,
+            "total": r.total,
+            "retained": r.retained,
+            "retention_rate": round(r.retained / r.total * 100, 1) if r.total > 0 else 0,
+        } for r in results]
+
+    def _retention_rows(self, cutoff: datetime):
+        return self.session.query(
             _year_month(UserModel.created_at).label('cohort'),
             func.count(UserModel.id).label('total'),
             func.count(case(
@@ -370,12 +487,6 @@ class AdminRepository:
         ).order_by(
             _year_month(UserModel.created_at)
         ).all()
-        return [{
-            "cohort": r.cohort,
-            "total": r.total,
-            "retained": r.retained,
-            "retention_rate": round(r.retained / r.total * 100, 1) if r.total > 0 else 0,
-        } for r in results]
 
     # ── Marketing / Conversion Funnel ──
 
@@ -444,21 +555,44 @@ class AdminRepository:
         workspaces = self.session.query(WorkspaceModel).filter(
             WorkspaceModel.owner_user_id == user_id
         ).all()
+        return {"workspaces": self._workspace_stats(workspaces)}
+
+    def get_user_detail_with_stats(self, user_id: str) -> Optional[Tuple[UserModel, List[dict]]]:
+        """
+        User plus per-workspace stats in three queries total: the user with
+        workspaces eager-loaded, then one grouped count each for transactions
+        and accounts. raiseload guards against lazy loads creeping back in.
+        """
+        user = self.session.query(UserModel).options(
+            selectinload(UserModel.workspaces),
+            raiseload("*"),
+        ).filter(UserModel.id == user_id).first()
+        if not user:
+            return None
+        return user, self._workspace_stats(user.workspaces)
+
+    def _workspace_stats(self, workspaces: List[WorkspaceModel]) -> List[dict]:
+        """Transaction/account counts for the given workspaces via grouped queries"""
+        ws_ids = [ws.id for ws in workspaces]
+        if not ws_ids:
+            return []
 
-        stats = []
-        for ws in workspaces:
-            txn_count = self.session.query(func.count(TransactionModel.id)).filter(
-                TransactionModel.workspace_id == ws.id
-            ).scalar() or 0
-            acc_count = self.session.query(func.count(AccountModel.id)).filter(
-                AccountModel.workspace_id == ws.id
-            ).scalar() or 0
-            stats.append({
-                "workspace_id": ws.id,
-                "workspace_name": ws.name,
-                "base_currency": ws.base_currency,
-                "transaction_count": txn_count,
-                "account_count": acc_count,
-                "created_at": ws.created_at.isoformat() if ws.created_at else None,
-            })
-        return {"workspaces": stats}
+        txn_counts = dict(self.session.query(
+            TransactionModel.workspace_id, func.count(TransactionModel.id)
+        ).filter(
+            TransactionModel.workspace_id.in_(ws_ids)
+        ).group_by(TransactionModel.workspace_id).all())
+        acc_counts = dict(self.session.query(
+            AccountModel.workspace_id, func.count(AccountModel.id)
+        ).filter(
+            AccountModel.workspace_id.in_(ws_ids)
+        ).group_by(AccountModel.workspace_id).all())
+
+        return [{
+            "workspace_id": ws.id,
+            "workspace_name": ws.name,
+            "base_currency": ws.base_currency,
+            "transaction_count": txn_counts.get(ws.id, 0),
+            "account_count": acc_counts.get(ws.id, 0),
+            "created_at": ws.created_at.isoformat() if ws.created_at else None,
+        } for ws in workspaces]
@@ -1,11 +1,11 @@
 """Repository for audit log operations"""
 
-import json
 from typing import List, Tuple, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 
 from .models import AuditLogModel
+from .pagination import before_cursor, encode_cursor
 
 
 class AuditLogRepository:
@@ -20,7 +20,7 @@ class AuditLogRepository:
         action: str,
         target_type: Optional[str] = None,
         target_id: Optional[str] = None,
-        details: Optional[str] = None,
+        details: Optional[dict] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
     ) -> AuditLogModel:
@@ -30,7 +30,7 @@ class AuditLogRepository:
             action=action,
             target_type=target_type,
             target_id=target_id,
-            details=details if isinstance(details, str) else json.dumps(details) if details else None,
+            details=details or None,
             ip_address=ip_address,
             user_agent=user_agent,
         )
@@ -47,8 +47,16 @@ class AuditLogRepository:
         days: int = 30,
         offset: int = 0,
         limit: int = 100,
-    ) -> Tuple[List[AuditLogModel], int]:
-        """Query audit logs with filters, returns (logs, total_count)"""
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Tuple[List[AuditLogModel], Optional[int], Optional[str]]:
+        """
+        Query audit logs with filters, returns (logs, total_count, next_cursor).
+
+        Pass the previous page's next_cursor to continue with an index seek;
+        offset is only used when no cursor is given. total_count is None
+        unless include_total is set, since it costs a COUNT over the filter.
+        """
         query = self.session.query(AuditLogModel)
         cutoff = datetime.utcnow() - timedelta(days=days)
         query = query.filter(AuditLogModel.created_at >= cutoff)
@@ -62,6 +70,17 @@ class AuditLogRepository:
         if target_id:
             query = query.filter(AuditLogModel.target_id == target_id)
 
-        total = query.count()
-        logs = query.order_by(AuditLogModel.created_at.desc()).offset(offset).limit(limit).all()
-        return logs, total
+        total = query.count() if include_total else None
+
+        query = query.order_by(AuditLogModel.created_at.desc(), AuditLogModel.id.desc())
+        if cursor:
+            query = query.filter(before_cursor(AuditLogModel.created_at, AuditLogModel.id, cursor))
+        elif offset:
+            query = query.offset(offset)
+
+        logs = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_cursor(logs[-1].created_at, logs[-1].id)
+        return logs, total, next_cursor
@@ -2,9 +2,11 @@
 
 from typing import List, Tuple, Optional
 from datetime import datetime
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 
 from .models import BugReportModel, BugReportMediaModel
+from .pagination import before_cursor, encode_cursor
 
 
 class BugReportRepository:
@@ -68,20 +70,41 @@ class BugReportRepository:
         status_filter: Optional[str] = None,
         offset: int = 0,
         limit: int = 50,
-    ) -> Tuple[List[BugReportModel], int]:
-        query = self.session.query(BugReportModel).options(
-            joinedload(BugReportModel.media)
-        )
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Tuple[BugReportModel, int]], int, Optional[str]]:
+        """
+        Newest reports first, returns ([(report, media_count)], total_count, next_cursor).
+
+        Media is counted in SQL rather than loaded. Pass the previous page's
+        next_cursor to continue with an index seek; offset is only used when
+        no cursor is given.
+        """
+        filters = []
         if status_filter and status_filter != 'all':
-            query = query.filter(BugReportModel.status == status_filter)
-        total = query.count()
-        reports = (
-            query.order_by(BugReportModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+            filters.append(BugReportModel.status == status_filter)
+        total = self.session.query(func.count(BugReportModel.id)).filter(*filters).scalar() or 0
+
+        media_count = (
+            select(func.count(BugReportMediaModel.id))
+            .where(BugReportMediaModel.bug_report_id == BugReportModel.id)
+            .correlate(BugReportModel)
+            .scalar_subquery()
         )
-        return reports, total
+        query = self.session.query(BugReportModel, media_count).filter(*filters)
+
+        query = query.order_by(BugReportModel.created_at.desc(), BugReportModel.id.desc())
+        if cursor:
+            query = query.filter(before_cursor(BugReportModel.created_at, BugReportModel.id, cursor))
+        elif offset:
+            query = query.offset(offset)
+
+        rows = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1][0]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return [(report, count) for report, count in rows], total, next_cursor
 
     def get_by_id(self, report_id: str) -> Optional[BugReportModel]:
         return (
@@ -98,6 +121,27 @@ class BugReportRepository:
             .first()
         )
 
+    def get_media_meta(self, media_id: str):
+        """Media row without the BLOB (id, bug_report_id, filename, content_type, file_size)."""
+        return (
+            self.session.query(
+                BugReportMediaModel.id,
+                BugReportMediaModel.bug_report_id,
+                BugReportMediaModel.filename,
+                BugReportMediaModel.content_type,
+                BugReportMediaModel.file_size,
+            )
+            .filter(BugReportMediaModel.id == media_id)
+            .first()
+        )
+
+    def get_media_data(self, media_id: str) -> Optional[bytes]:
+        return (
+            self.session.query(BugReportMediaModel.file_data)
+            .filter(BugReportMediaModel.id == media_id)
+            .scalar()
+        )
+
     def update_status(
         self,
         report_id: str,
@@ -1,19 +1,40 @@
 """Database connection and session management"""
 
+import logging
 import os
+from datetime import datetime
 from sqlalchemy import create_engine, text, inspect
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from config.settings import ANALYTICS_MONTHLY_TOTALS_VIEW
 from .models import Base
 
-# Global session factory
-_SessionLocal = None
+logger = logging.getLogger(__name__)
+
+# Global session factory, bound to an engine by init_db().
+# Usable directly as a context manager: ``with SessionLocal() as db: ...``
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+_engine = None
+
+# Async counterpart for routes migrated to async SQLAlchemy
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+_async_engine = None
+
+
+def _to_async_url(database_url: str) -> str:
+    """Map a sync database URL onto its async driver (asyncpg / aiosqlite)."""
+    if database_url.startswith("postgresql://"):
+        return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if database_url.startswith("sqlite://"):
+        return database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return database_url
 
 
 def init_db(database_url: str, echo: bool = False) -> None:
     """Initialize database connection"""
-    global _SessionLocal
+    global _engine, _async_engine
 
     # Railway/Heroku may provide postgres:// but SQLAlchemy 2.0 requires postgresql://
     if database_url.startswith("postgres://"):
@@ -27,9 +48,20 @@ def init_db(database_url: str, echo: bool = False) -> None:
             pool_size=10,
             max_overflow=20,
         )
+        async_engine = create_async_engine(
+            _to_async_url(database_url),
+            echo=echo,
+            pool_pre_ping=True,
+            pool_size=10,
+            max_overflow=20,
+        )
     else:
         engine = create_engine(database_url, echo=echo)
-    _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        async_engine = create_async_engine(_to_async_url(database_url), echo=echo)
+    SessionLocal.configure(bind=engine)
+    _engine = engine
+    AsyncSessionLocal.configure(bind=async_engine)
+    _async_engine = async_engine
 
     # Create tables
     Base.metadata.create_all(bind=engine)
@@ -38,6 +70,120 @@ def init_db(database_url: str, echo: bool = False) -> None:
     _run_migrations(engine)
 
 
+def warm_connection_pool(n: int = 5) -> None:
+    """Open up to n pooled connections at startup so early requests skip connect cost."""
+    if _engine is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+
+    # Connections must be held simultaneously, otherwise the pool hands the
+    # same one back each time. Never exceed the pool's steady-state size.
+    pool_size = getattr(_engine.pool, "size", None)
+    if callable(pool_size):
+        n = min(n, pool_size())
+
+    conns = []
+    try:
+        for _ in range(n):
+            conn = _engine.connect()
+            conn.execute(text("SELECT 1"))
+            conns.append(conn)
+    finally:
+        for conn in conns:
+            conn.close()
+
+
+# Materialized views behind the admin growth/retention charts: (name, SELECT, unique key)
+_GROWTH_VIEWS = (
+    (
+        "mv_daily_signups",
+        "SELECT created_at::date AS day, COUNT(*) AS count "
+        "FROM users GROUP BY created_at::date",
+        "day",
+    ),
+    (
+        "mv_dau",
+        "SELECT last_login_at::date AS day, COUNT(*) AS count "
+        "FROM users WHERE last_login_at IS NOT NULL GROUP BY last_login_at::date",
+        "day",
+    ),
+    (
+        "mv_mau",
+        "SELECT to_char(last_login_at, 'YYYY-MM') AS month, COUNT(DISTINCT id) AS count "
+        "FROM users WHERE last_login_at IS NOT NULL GROUP BY to_char(last_login_at, 'YYYY-MM')",
+        "month",
+    ),
+    (
+        "mv_retention_cohorts",
+        "SELECT to_char(created_at, 'YYYY-MM') AS cohort, COUNT(*) AS total, "
+        "COUNT(last_login_at) AS retained "
+        "FROM users GROUP BY to_char(created_at, 'YYYY-MM')",
+        "cohort",
+    ),
+)
+
+
+# Per-month posting totals behind the analytics endpoints (PostgreSQL only,
+# opt-in via ANALYTICS_MONTHLY_TOTALS_VIEW). Only months that had closed by
+# its last refresh are read from it; later months are aggregated live.
+_MONTHLY_TOTALS_VIEW = (
+    "mv_monthly_posting_totals",
+    "SELECT t.workspace_id, "
+    "CAST(EXTRACT(YEAR FROM t.timestamp) AS INTEGER) AS year, "
+    "CAST(EXTRACT(MONTH FROM t.timestamp) AS INTEGER) AS month, "
+    "t.category_id, t.subcategory_id, t.fund_id, c.type AS category_type, "
+    "COALESCE(SUM(p.base_amount) FILTER (WHERE p.base_amount > 0), 0) AS sum_pos, "
+    "COALESCE(SUM(p.base_amount) FILTER (WHERE p.base_amount < 0), 0) AS sum_neg, "
+    "COUNT(*) FILTER (WHERE p.base_amount < 0) AS neg_count "
+    "FROM postings p "
+    "JOIN transactions t ON p.transaction_id = t.id "
+    "JOIN categories c ON t.category_id = c.id "
+    "GROUP BY t.workspace_id, year, month, t.category_id, t.subcategory_id, t.fund_id, c.type",
+    "workspace_id, year, month, category_id, subcategory_id, fund_id",
+)
+
+
+def _materialized_views() -> tuple:
+    """Every (name, select_sql, key) view this deployment maintains."""
+    if ANALYTICS_MONTHLY_TOTALS_VIEW:
+        return _GROWTH_VIEWS + (_MONTHLY_TOTALS_VIEW,)
+    return _GROWTH_VIEWS
+
+
+# pg advisory lock key held while refreshing, so one worker refreshes at a time
+_VIEW_REFRESH_LOCK_ID = 0x1ED6E7A
+
+
+def refresh_growth_views(min_interval_seconds: int = 0) -> None:
+    """Refresh the materialized views (no-op outside PostgreSQL).
+
+    Each view's refresh start time (naive UTC) is recorded in _view_refreshes,
+    shared by all workers, so readers know which data a view reflects. Only
+    one worker refreshes at a time (the others return immediately), and views
+    refreshed less than min_interval_seconds ago are skipped, so N workers on
+    the same schedule don't mean N full rebuilds per interval.
+    """
+    if _engine is None or _engine.dialect.name != "postgresql":
+        return
+    # CONCURRENTLY can't run inside a transaction block
+    with _engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if not conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": _VIEW_REFRESH_LOCK_ID}).scalar():
+            return
+        try:
+            last = dict(conn.execute(text("SELECT name, refreshed_at FROM _view_refreshes")).all())
+            for name, _, _ in _materialized_views():
+                started = datetime.utcnow()
+                previous = last.get(name)
+                if previous is not None and (started - previous).total_seconds() < min_interval_seconds:
+                    continue
+                conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+                conn.execute(text(
+                    "INSERT INTO _view_refreshes (name, refreshed_at) VALUES (:name, :at) "
+                    "ON CONFLICT (name) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at"
+                ), {"name": name, "at": started})
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _VIEW_REFRESH_LOCK_ID})
+
+
 def _run_migrations(engine) -> None:
     """Add missing columns to existing tables."""
     insp = inspect(engine)
@@ -249,6 +395,107 @@ def _run_migrations(engine) -> None:
                     "ALTER TABLE fund_allocation_overrides ADD COLUMN mode VARCHAR(20)"
                 ))
 
+        # Range checks (mirrors FundAllocationOverrideModel.__table_args__).
+        # SQLite can't add constraints to an existing table; NOT VALID
+        # enforces new writes without failing on legacy rows.
+        if is_pg:
+            fao_checks = {c["name"] for c in insp.get_check_constraints("fund_allocation_overrides")}
+            with engine.begin() as conn:
+                if "ck_overrides_allocation_percentage" not in fao_checks:
+                    conn.execute(text(
+                        "ALTER TABLE fund_allocation_overrides ADD CONSTRAINT ck_overrides_allocation_percentage "
+                        "CHECK (allocation_percentage BETWEEN 0 AND 100) NOT VALID"
+                    ))
+                if "ck_overrides_month" not in fao_checks:
+                    conn.execute(text(
+                        "ALTER TABLE fund_allocation_overrides ADD CONSTRAINT ck_overrides_month "
+                        "CHECK (month BETWEEN 1 AND 12) NOT VALID"
+                    ))
+
+    # Keyset pagination indexes for admin listings
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_users_created_id ON users (created_at, id)"
+        ))
+        if insp.has_table("audit_logs"):
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_audit_logs_created_id ON audit_logs (created_at, id)"
+            ))
+        if insp.has_table("bug_reports"):
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_bug_reports_created_id ON bug_reports (created_at, id)"
+            ))
+
+    # Admin user-list filter indexes (mirrors UserModel.__table_args__)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_users_provider_created_id "
+            "ON users (auth_provider, created_at, id)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_users_admin_created_id "
+            f"ON users (created_at, id) WHERE is_admin = {BOOL_TRUE}"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_users_disabled_created_id "
+            f"ON users (created_at, id) WHERE is_disabled = {BOOL_TRUE}"
+        ))
+
+    # Analytics range scans (mirrors TransactionModel/PostingModel.__table_args__)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_transactions_ws_ts_category "
+            "ON transactions (workspace_id, timestamp, category_id) WHERE category_id IS NOT NULL"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_postings_transaction_amount ON postings (transaction_id)"
+            + (" INCLUDE (base_amount)" if is_pg else "")
+        ))
+        # Superseded by idx_postings_transaction_amount (same leading column)
+        conn.execute(text("DROP INDEX IF EXISTS ix_postings_transaction_id"))
+
+    # Audit action_prefix filter (LIKE 'admin.user.%'). Under a non-C
+    # collation PostgreSQL only range-scans a prefix LIKE on a
+    # text_pattern_ops index, not on idx_audit_logs_action_created.
+    if is_pg and insp.has_table("audit_logs"):
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_audit_logs_action_pattern "
+                "ON audit_logs (action text_pattern_ops, created_at)"
+            ))
+
+    # Trigram indexes so the admin search's ILIKE '%q%' can use an index.
+    # CREATE EXTENSION needs privileges the app role may not have; the
+    # search still works (sequentially) without them.
+    if is_pg:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                for col in ("email", "first_name", "last_name"):
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS idx_users_{col}_trgm "
+                        f"ON users USING gin ({col} gin_trgm_ops)"
+                    ))
+        except Exception as e:
+            logger.warning("Skipping pg_trgm search indexes: %s", e)
+
+    # Pre-aggregated growth series for the admin dashboard, plus the
+    # analytics monthly totals when enabled (PostgreSQL only).
+    # The unique indexes are required for REFRESH ... CONCURRENTLY.
+    if is_pg:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE IF NOT EXISTS _view_refreshes "
+                "(name VARCHAR(255) PRIMARY KEY, refreshed_at TIMESTAMP NOT NULL)"
+            ))
+            for name, select_sql, key in _materialized_views():
+                conn.execute(text(
+                    f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} AS {select_sql}"
+                ))
+                conn.execute(text(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {name}_key ON {name} ({key})"
+                ))
+
     # ── One-time data migrations (tracked in _migrations table) ──
 
     if not insp.has_table("_migrations"):
@@ -257,6 +504,48 @@ def _run_migrations(engine) -> None:
                 f"CREATE TABLE _migrations (name VARCHAR(255) PRIMARY KEY, applied_at {TIMESTAMP_TYPE} DEFAULT CURRENT_TIMESTAMP)"
             ))
 
+    # Users: JSON array columns TEXT -> JSONB, plus a GIN index for
+    # containment filters (nationalities @> '["FR"]')
+    if is_pg:
+        with engine.begin() as conn:
+            already = conn.execute(
+                text("SELECT 1 FROM _migrations WHERE name = 'users_json_columns_jsonb_v1'")
+            ).fetchone()
+            if not already:
+                for col in ("nationalities", "tax_residencies", "countries_of_interest"):
+                    conn.execute(text(f"ALTER TABLE users ALTER COLUMN {col} DROP DEFAULT"))
+                    conn.execute(text(
+                        f"ALTER TABLE users ALTER COLUMN {col} TYPE jsonb "
+                        f"USING COALESCE(NULLIF({col}::text, ''), '[]')::jsonb"
+                    ))
+                    conn.execute(text(f"ALTER TABLE users ALTER COLUMN {col} SET DEFAULT '[]'::jsonb"))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS users_nationalities_gin ON users USING gin (nationalities)"
+                ))
+                conn.execute(text(
+                    "INSERT INTO _migrations (name) VALUES ('users_json_columns_jsonb_v1')"
+                ))
+
+    # Audit logs: details TEXT -> JSONB, with an expression index for
+    # lookups by the affected user's email
+    if is_pg and insp.has_table("audit_logs"):
+        with engine.begin() as conn:
+            already = conn.execute(
+                text("SELECT 1 FROM _migrations WHERE name = 'audit_details_jsonb_v1'")
+            ).fetchone()
+            if not already:
+                conn.execute(text(
+                    "ALTER TABLE audit_logs ALTER COLUMN details TYPE jsonb "
+                    "USING NULLIF(details::text, '')::jsonb"
+                ))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_audit_logs_details_email "
+                    "ON audit_logs ((details->>'email'))"
+                ))
+                conn.execute(text(
+                    "INSERT INTO _migrations (name) VALUES ('audit_details_jsonb_v1')"
+                ))
+
     # Mark existing "Working Capital" funds as system
     with engine.begin() as conn:
         already = conn.execute(
@@ -401,10 +690,18 @@ def _run_migrations(engine) -> None:
 
 def get_session():
     """Get database session (FastAPI dependency)"""
-    if _SessionLocal is None:
+    if _engine is None:
         raise RuntimeError("Database not initialized. Call init_db() first.")
-    db = _SessionLocal()
+    db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """Get async database session (FastAPI dependency)"""
+    if _async_engine is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,9 +1,10 @@
 """SQLAlchemy database models"""
 
 from sqlalchemy import (
-    Column, String, Numeric, DateTime, ForeignKey,
-    Enum, Text, Boolean, Table, Index, Integer, LargeBinary
+    CheckConstraint, Column, String, Numeric, DateTime, ForeignKey,
+    Enum, Text, Boolean, Table, Index, Integer, LargeBinary, JSON
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 from datetime import datetime
 import uuid
@@ -15,6 +16,11 @@ def new_uuid():
     return str(uuid.uuid4())
 
 
+# JSON columns: native JSONB on PostgreSQL, JSON-encoded TEXT on SQLite.
+# Either way the ORM hands back Python lists/dicts.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
 # === Auth & Tenancy ===
 
 class UserModel(Base):
@@ -28,9 +34,9 @@ class UserModel(Base):
     first_name = Column(String(100))
     last_name = Column(String(100))
     date_of_birth = Column(String(10))
-    nationalities = Column(Text, default='[]')
-    tax_residencies = Column(Text, default='[]')
-    countries_of_interest = Column(Text, default='[]')
+    nationalities = Column(JSONType, default=list)
+    tax_residencies = Column(JSONType, default=list)
+    countries_of_interest = Column(JSONType, default=list)
     phone_country_code = Column(String(5))
     phone_number = Column(String(20))
     address_line1 = Column(String(255))
@@ -60,6 +66,16 @@ class UserModel(Base):
     # Relationships
     workspaces = relationship("WorkspaceModel", back_populates="owner")
 
+    __table_args__ = (
+        Index('idx_users_created_id', 'created_at', 'id'),
+        # Admin user-list filters, each in the listing's (created_at, id) order
+        Index('idx_users_provider_created_id', 'auth_provider', 'created_at', 'id'),
+        Index('idx_users_admin_created_id', 'created_at', 'id',
+              postgresql_where=is_admin == True, sqlite_where=is_admin == True),  # noqa: E712
+        Index('idx_users_disabled_created_id', 'created_at', 'id',
+              postgresql_where=is_disabled == True, sqlite_where=is_disabled == True),  # noqa: E712
+    )
+
 
 class WorkspaceModel(Base):
     """User's workspace (ledger + settings)"""
@@ -257,6 +273,8 @@ class FundAllocationOverrideModel(Base):
 
     __table_args__ = (
         Index('idx_overrides_workspace_fund_period', 'workspace_id', 'fund_id', 'year', 'month', unique=True),
+        CheckConstraint('allocation_percentage BETWEEN 0 AND 100', name='ck_overrides_allocation_percentage'),
+        CheckConstraint('month BETWEEN 1 AND 12', name='ck_overrides_month'),
     )
 
 
@@ -337,6 +355,9 @@ class TransactionModel(Base):
 
     __table_args__ = (
         Index('idx_transactions_workspace_timestamp', 'workspace_id', 'timestamp'),
+        # Analytics month/range aggregations only look at categorised rows
+        Index('idx_transactions_ws_ts_category', 'workspace_id', 'timestamp', 'category_id',
+              postgresql_where=category_id.isnot(None), sqlite_where=category_id.isnot(None)),
         Index('idx_transactions_import_hash', 'workspace_id', 'import_hash'),
         Index('idx_transactions_category', 'category_id'),
         Index('idx_transactions_fund', 'fund_id'),
@@ -352,7 +373,7 @@ class PostingModel(Base):
     __tablename__ = 'postings'
 
     id = Column(String(36), primary_key=True, default=new_uuid)
-    transaction_id = Column(String(36), ForeignKey('transactions.id'), nullable=False, index=True)
+    transaction_id = Column(String(36), ForeignKey('transactions.id'), nullable=False)
     account_id = Column(String(36), ForeignKey('accounts.id'), nullable=False, index=True)
     amount = Column(Numeric(19, 4), nullable=False)  # In posting_currency
     posting_currency = Column(String(3), nullable=False, default='SGD')
@@ -366,6 +387,9 @@ class PostingModel(Base):
 
     __table_args__ = (
         Index('idx_postings_account', 'account_id'),
+        # The only transaction_id index; covering on PostgreSQL, so
+        # SUM(base_amount) per transaction needs no heap fetch
+        Index('idx_postings_transaction_amount', 'transaction_id', postgresql_include=['base_amount']),
     )
 
 
@@ -508,7 +532,7 @@ class AuditLogModel(Base):
     action = Column(String(100), nullable=False)  # e.g., "admin.user.disable", "user.login"
     target_type = Column(String(50), nullable=True)  # "user", "workspace", etc.
     target_id = Column(String(36), nullable=True, index=True)
-    details = Column(Text, nullable=True)  # JSON-encoded context
+    details = Column(JSONType, nullable=True)  # JSON context, e.g. {"email": ...}
     ip_address = Column(String(45), nullable=True)  # IPv4/IPv6
     user_agent = Column(String(500), nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -520,6 +544,7 @@ class AuditLogModel(Base):
         Index('idx_audit_logs_actor_created', 'actor_user_id', 'created_at'),
         Index('idx_audit_logs_action_created', 'action', 'created_at'),
         Index('idx_audit_logs_target', 'target_type', 'target_id'),
+        Index('idx_audit_logs_created_id', 'created_at', 'id'),
     )
 
 
@@ -545,6 +570,7 @@ class BugReportModel(Base):
     __table_args__ = (
         Index('idx_bug_reports_user_status', 'user_id', 'status'),
         Index('idx_bug_reports_status_created', 'status', 'created_at'),
+        Index('idx_bug_reports_created_id', 'created_at', 'id'),
     )
 
 
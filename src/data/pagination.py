@@ -0,0 +1,32 @@
+"""Keyset (cursor) pagination helpers"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Opaque cursor for the row a page ended on"""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor; raises ValueError on a malformed cursor"""
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def before_cursor(created_at_col, id_col, cursor: str):
+    """WHERE clause for rows after the cursor in (created_at DESC, id DESC) order"""
+    created_at, row_id = decode_cursor(cursor)
+    return or_(
+        created_at_col < created_at,
+        and_(created_at_col == created_at, id_col < row_id),
+    )
@@ -1,12 +1,17 @@
 """Repository pattern implementations for data access"""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Float, Row, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from .models import (
+    new_uuid,
     UserModel, WorkspaceModel, AccountModel, TransactionModel, PostingModel,
     CategoryModel, SubcategoryModel, FundModel, FundAccountLinkModel, FundAllocationOverrideModel, TagModel, PriceModel, ScenarioModel,
     CardModel, PaymentMethodModel, RecurringTransactionModel
@@ -51,6 +56,16 @@ class UserRepository(BaseRepository):
     def read(self, user_id) -> Optional[UserModel]:
         return self.session.query(UserModel).filter(UserModel.id == str(user_id)).first()
 
+    def read_emails(self, user_ids: Iterable[str]) -> Dict[str, str]:
+        """Map user id -> email for many users in a single IN query"""
+        ids = {str(uid) for uid in user_ids}
+        if not ids:
+            return {}
+        rows = self.session.query(UserModel.id, UserModel.email).filter(
+            UserModel.id.in_(ids)
+        ).all()
+        return {row.id: row.email for row in rows}
+
     def read_by_email(self, email: str) -> Optional[UserModel]:
         return self.session.query(UserModel).filter(UserModel.email == email).first()
 
@@ -134,6 +149,85 @@ class AccountRepository(BaseRepository):
             self.session.commit()
 
 
+class AsyncAccountRepository:
+    """Async repository for Account entities (used by the async account routes)"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, account: AccountModel) -> AccountModel:
+        self.session.add(account)
+        await self.session.commit()
+        return account
+
+    async def read(self, account_id) -> Optional[AccountModel]:
+        result = await self.session.execute(
+            select(AccountModel).where(AccountModel.id == str(account_id))
+        )
+        return result.scalars().first()
+
+    async def read_by_workspace(self, workspace_id: str) -> List[AccountModel]:
+        result = await self.session.execute(
+            select(AccountModel).where(AccountModel.workspace_id == workspace_id)
+        )
+        return list(result.scalars().all())
+
+    async def list_columns_by_workspace(self, workspace_id: str) -> List[Row]:
+        """Account list projection as plain rows (balance already a float), skipping ORM materialization"""
+        result = await self.session.execute(
+            select(
+                AccountModel.id,
+                AccountModel.name,
+                AccountModel.type,
+                AccountModel.account_currency,
+                func.coalesce(AccountModel.starting_balance, 0).cast(Float).label("balance"),
+                AccountModel.institution,
+                AccountModel.created_at,
+            ).where(AccountModel.workspace_id == workspace_id)
+        )
+        return list(result.all())
+
+    async def version_by_workspace(self, workspace_id: str) -> Tuple[Optional[datetime], int]:
+        """(MAX(updated_at), COUNT(*)) for a workspace's accounts — cheap change marker"""
+        result = await self.session.execute(
+            select(func.max(AccountModel.updated_at), func.count(AccountModel.id))
+            .where(AccountModel.workspace_id == workspace_id)
+        )
+        last_updated, count = result.one()
+        return last_updated, count
+
+    async def read_for_workspace(self, account_id, workspace_id: str) -> Optional[AccountModel]:
+        result = await self.session.execute(
+            select(AccountModel).where(
+                AccountModel.id == str(account_id),
+                AccountModel.workspace_id == workspace_id
+            )
+        )
+        return result.scalars().first()
+
+    async def update(self, account: AccountModel) -> AccountModel:
+        account.updated_at = datetime.utcnow()
+        await self.session.commit()
+        return account
+
+    async def delete(self, account_id: UUID) -> None:
+        # Relationships touched by the delete cascade must be loaded up front;
+        # async sessions cannot lazy-load them mid-flush.
+        result = await self.session.execute(
+            select(AccountModel)
+            .where(AccountModel.id == str(account_id))
+            .options(
+                selectinload(AccountModel.postings),
+                selectinload(AccountModel.fund_links),
+                selectinload(AccountModel.cards),
+            )
+        )
+        account = result.scalars().first()
+        if account:
+            await self.session.delete(account)
+            await self.session.commit()
+
+
 class TransactionRepository(BaseRepository):
     """Repository for Transaction entities"""
 
@@ -512,6 +606,13 @@ class FundAllocationOverrideRepository(BaseRepository):
             FundAllocationOverrideModel.workspace_id == workspace_id
         ).all()
 
+    def read_by_year_range(self, workspace_id: str, start_year: int, end_year: int) -> List[FundAllocationOverrideModel]:
+        """Get all overrides for a workspace with start_year <= year <= end_year"""
+        return self.session.query(FundAllocationOverrideModel).filter(
+            FundAllocationOverrideModel.workspace_id == workspace_id,
+            FundAllocationOverrideModel.year.between(start_year, end_year)
+        ).all()
+
     def update(self, override: FundAllocationOverrideModel) -> FundAllocationOverrideModel:
         override.updated_at = datetime.utcnow()
         self.session.commit()
@@ -536,6 +637,61 @@ class FundAllocationOverrideRepository(BaseRepository):
             self.session.delete(override)
             self.session.commit()
 
+    def upsert_many(self, workspace_id: str, rows: List[Dict]) -> List[FundAllocationOverrideModel]:
+        """Insert or update many (fund, year, month) overrides in one transaction
+
+        Each row carries fund_id, year, month, allocation_percentage,
+        override_amount and mode. Later rows win when a key repeats.
+        Returns the stored overrides in input order (deduplicated).
+        """
+        by_key = {(r["fund_id"], r["year"], r["month"]): r for r in rows}
+        if not by_key:
+            return []
+
+        now = datetime.utcnow()
+        payload = [
+            {**r, "id": new_uuid(), "workspace_id": workspace_id, "created_at": now, "updated_at": now}
+            for r in by_key.values()
+        ]
+
+        dialect = self.session.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert(FundAllocationOverrideModel).values(payload)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["workspace_id", "fund_id", "year", "month"],
+                set_={
+                    "allocation_percentage": stmt.excluded.allocation_percentage,
+                    "override_amount": stmt.excluded.override_amount,
+                    "mode": stmt.excluded.mode,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ).returning(FundAllocationOverrideModel)
+            # RETURNING hands back the stored rows; no read-back query.
+            # Row order is not guaranteed, so map them back by key.
+            stored = {
+                (o.fund_id, o.year, o.month): o
+                for o in self.session.scalars(stmt, execution_options={"populate_existing": True})
+            }
+            self.session.commit()
+            return [stored[k] for k in by_key]
+
+        stored_rows = []
+        for row in payload:
+            existing = self.read_by_fund_and_period(workspace_id, row["fund_id"], row["year"], row["month"])
+            if existing:
+                existing.allocation_percentage = row["allocation_percentage"]
+                existing.override_amount = row["override_amount"]
+                existing.mode = row["mode"]
+                existing.updated_at = now
+                stored_rows.append(existing)
+            else:
+                override = FundAllocationOverrideModel(**row)
+                self.session.add(override)
+                stored_rows.append(override)
+        self.session.commit()
+        return stored_rows
+
 
 class CardRepository(BaseRepository):
     """Repository for Card entities"""
@@ -5,30 +5,63 @@ from typing import Optional, Tuple
 from uuid import UUID
 import hashlib
 import hmac
+import os
 
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
 from jwt import encode, decode, ExpiredSignatureError, InvalidTokenError
 from passlib.context import CryptContext
 
 # Password hashing
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+# JWT signing: HS256 (shared secret) by default; set JWT_ALGORITHM=EdDSA and
+# provide PEM-encoded Ed25519 keys to sign/verify with a key pair instead.
+# Services that only verify tokens need just the public key.
+JWT_ALGORITHM = os.environ.get("JWT_ALGORITHM", "HS256")
+JWT_PRIVATE_KEY = os.environ.get("JWT_PRIVATE_KEY")
+JWT_PUBLIC_KEY = os.environ.get("JWT_PUBLIC_KEY")
+
 
 class AuthService:
     """Auth service for signup, login, JWT management"""
 
-    def __init__(self, secret_key: str, algorithm: str = "HS256", token_expiry_hours: int = 24):
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        token_expiry_hours: int = 24,
+        private_key: Optional[str] = None,
+        public_key: Optional[str] = None,
+    ):
         """
         Initialize auth service.
         
         Args:
             secret_key: Secret for JWT signing (use environment variable in production)
-            algorithm: JWT algorithm (default HS256)
+            algorithm: JWT algorithm (default HS256, or EdDSA for Ed25519 keys)
             token_expiry_hours: Token expiry time (default 24h)
+            private_key: PEM Ed25519 private key (EdDSA only, needed to issue tokens)
+            public_key: PEM Ed25519 public key (EdDSA only, derived from private_key if omitted)
         """
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.token_expiry = timedelta(hours=token_expiry_hours)
 
+        # Parse keys once so PyJWT doesn't re-load PEM on every sign/verify
+        if algorithm == "EdDSA":
+            if not private_key and not public_key:
+                raise ValueError("EdDSA requires private_key and/or public_key")
+            self._signing_key = (
+                load_pem_private_key(private_key.encode(), password=None) if private_key else None
+            )
+            if public_key:
+                self._verify_key = load_pem_public_key(public_key.encode())
+            else:
+                self._verify_key = self._signing_key.public_key()
+        else:
+            self._signing_key = secret_key
+            self._verify_key = secret_key
+
     def hash_password(self, password: str) -> str:
         """Hash a password using Argon2"""
         return pwd_context.hash(password)
@@ -54,7 +87,9 @@ class AuthService:
             "exp": datetime.utcnow() + self.token_expiry,
             "iat": datetime.utcnow()
         }
-        token = encode(payload, self.secret_key, algorithm=self.algorithm)
+        if self._signing_key is None:
+            raise RuntimeError("No private key configured for issuing tokens")
+        token = encode(payload, self._signing_key, algorithm=self.algorithm)
         return token
 
     def decode_access_token(self, token: str) -> Optional[Tuple[UUID, UUID]]:
@@ -67,11 +102,28 @@ class AuthService:
         Returns:
             (user_id, workspace_id) or None if invalid
         """
+        result = self.decode_access_token_with_expiry(token)
+        if result is None:
+            return None
+        user_id, workspace_id, _ = result
+        return user_id, workspace_id
+
+    def decode_access_token_with_expiry(self, token: str) -> Optional[Tuple[UUID, UUID, float]]:
+        """
+        Decode and validate JWT token, also returning its expiry.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            (user_id, workspace_id, exp) with exp as a unix timestamp, or None if invalid
+        """
         try:
-            payload = decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = decode(token, self._verify_key, algorithms=[self.algorithm])
             user_id = UUID(payload.get("sub"))
             workspace_id = UUID(payload.get("workspace_id"))
-            return user_id, workspace_id
+            exp = float(payload.get("exp"))
+            return user_id, workspace_id, exp
         except (ExpiredSignatureError, InvalidTokenError, ValueError, TypeError):
             return None
 
@@ -0,0 +1,168 @@
+"""In-process TTL caching for expensive, argument-keyed computations"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import orjson
+from cachetools import TTLCache
+
+try:
+    import redis.asyncio as _redis
+except ImportError:  # pragma: no cover - optional shared cache
+    _redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class TTLMemo:
+    """
+    Thread-safe TTL cache with a get-or-compute helper.
+
+    Sync FastAPI routes run in a threadpool, so access to the underlying
+    TTLCache is serialized with a lock. Values are per-process; with several
+    workers each keeps its own copy for at most `ttl` seconds.
+
+    Misses are single-flight: when several threads (or, via
+    aget_or_compute, coroutines) miss the same key at once, one computes and
+    the rest wait for its result.
+    """
+
+    def __init__(self, maxsize: int = 64, ttl: float = 60):
+        self.ttl = ttl
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, threading.Lock] = {}
+        self._async_inflight: Dict[Hashable, asyncio.Lock] = {}
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss"""
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                return value
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have filled the entry while we waited
+            with self._lock:
+                value = self._cache.get(key)
+            if value is not None:
+                return value
+
+            try:
+                value = compute()
+                with self._lock:
+                    self._cache[key] = value
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+        return value
+
+    async def aget_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Async get_or_compute: compute is awaited, waiters yield to the loop"""
+        with self._lock:
+            value = self._cache.get(key)
+        if value is not None:
+            return value
+
+        key_lock = self._async_inflight.setdefault(key, asyncio.Lock())
+        async with key_lock:
+            with self._lock:
+                value = self._cache.get(key)
+            if value is not None:
+                return value
+
+            try:
+                value = await compute()
+                with self._lock:
+                    self._cache[key] = value
+            finally:
+                self._async_inflight.pop(key, None)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry"""
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._cache.clear()
+
+
+class RateLimiter:
+    """
+    Thread-safe fixed-window rate limiter (per process).
+
+    `hit(key)` records one request and returns None while the key is within
+    `limit` requests per `window` seconds, or the seconds until the window
+    resets once it is over the limit (suitable for a Retry-After header).
+    """
+
+    def __init__(self, limit: int, window: float = 60, maxsize: int = 10_000):
+        self.limit = limit
+        self.window = window
+        # key -> [window_start, count]; entries expire with their window
+        self._windows: TTLCache = TTLCache(maxsize=maxsize, ttl=window)
+        self._lock = threading.Lock()
+
+    def hit(self, key: Hashable) -> Optional[int]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is None or now - entry[0] >= self.window:
+                self._windows[key] = [now, 1]
+                return None
+            entry[1] += 1
+            if entry[1] <= self.limit:
+                return None
+            return max(1, math.ceil(entry[0] + self.window - now))
+
+
+class RedisJSONCache:
+    """
+    Optional cross-worker cache backed by Redis, storing orjson-encoded values.
+
+    Every Redis error degrades to a cache miss (logged), so callers always
+    fall back to computing the value themselves.
+    """
+
+    def __init__(self, client, prefix: str = "ledgera:"):
+        self._client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: Optional[str], prefix: str = "ledgera:") -> Optional["RedisJSONCache"]:
+        """Build a cache for url, or None when no URL is set or redis isn't installed"""
+        if not url or _redis is None:
+            return None
+        client = _redis.from_url(url, socket_connect_timeout=0.25, socket_timeout=0.25)
+        return cls(client, prefix)
+
+    async def get(self, key: str) -> Any:
+        try:
+            raw = await self._client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning("Redis GET %s failed: %s", key, e)
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        try:
+            await self._client.set(self.prefix + key, orjson.dumps(value), ex=ttl)
+        except Exception as e:
+            logger.warning("Redis SET %s failed: %s", key, e)
+
+    async def delete_prefix(self, key_prefix: str) -> None:
+        """Delete every key starting with key_prefix"""
+        try:
+            keys = [k async for k in self._client.scan_iter(match=self.prefix + key_prefix + "*")]
+            if keys:
+                await self._client.delete(*keys)
+        except Exception as e:
+            logger.warning("Redis invalidation of %s* failed: %s", key_prefix, e)
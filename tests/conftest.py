@@ -8,10 +8,10 @@ from uuid import uuid4
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 from src.data.models import Base
-from src.data.database import get_session
+from src.data.database import get_session, get_async_session
 from src.api.main import app
 
 
@@ -76,15 +76,17 @@ def sample_transaction(sample_ledger: Ledger) -> Transaction:
 # API Test Fixtures
 
 @pytest.fixture
-def test_db():
-    """Create an in-memory SQLite database for testing"""
+def test_db(tmp_path):
+    """Create a temporary SQLite database shared by the sync and async sessions"""
+    db_path = tmp_path / "test.db"
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{db_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool
     )
     Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
     def override_get_session():
         db = SessionLocal()
@@ -93,9 +95,15 @@ def test_db():
         finally:
             db.close()
 
+    async def override_get_async_session():
+        async with AsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
     yield engine
     app.dependency_overrides.clear()
+    engine.dispose()
 
 
 @pytest.fixture
@@ -0,0 +1,109 @@
+"""Batch endpoint tests"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+SIGNUP_DATA = {
+    "email": "batch@example.com",
+    "password": "Password123",
+    "first_name": "Batch",
+    "last_name": "User",
+    "date_of_birth": "1990-01-15",
+    "nationalities": ["SG"],
+    "tax_residencies": ["SG"],
+    "phone_country_code": "+65",
+    "phone_number": "91234567",
+    "address_line1": "1 Main Street",
+    "address_city": "Singapore",
+    "address_postal_code": "018956",
+    "address_country": "SG",
+    "tos_accepted": True,
+    "privacy_accepted": True,
+}
+
+
+@pytest.fixture
+def auth_headers(client: TestClient):
+    """Sign up a user and return (headers, workspace_id)"""
+    response = client.post("/auth/signup", json=SIGNUP_DATA)
+    assert response.status_code == 201, response.text
+    data = response.json()
+    return {"Authorization": f"Bearer {data['access_token']}"}, data["workspace_id"]
+
+
+class TestBatch:
+    """Test in-process request batching"""
+
+    def test_batch_forwards_auth(self, client: TestClient, auth_headers):
+        """Sub-requests run with the caller's Authorization header"""
+        headers, workspace_id = auth_headers
+        response = client.post("/api/v1/batch", headers=headers, json={
+            "requests": [
+                {"id": "ws", "url": "/api/v1/workspace"},
+                {"id": "accounts", "url": "/api/v1/accounts"},
+            ]
+        })
+
+        assert response.status_code == 200
+        results = response.json()["responses"]
+        assert [r["id"] for r in results] == ["ws", "accounts"]
+        assert results[0]["status"] == 200
+        assert results[0]["body"]["id"] == workspace_id
+        assert results[1]["status"] == 200
+
+    def test_batch_requires_auth(self, client: TestClient):
+        """The batch call itself is authenticated"""
+        response = client.post("/api/v1/batch", json={
+            "requests": [{"id": "ws", "url": "/api/v1/workspace"}]
+        })
+        assert response.status_code == 401
+
+    def test_batch_rejects_unsupported_method(self, client: TestClient, auth_headers):
+        """Only the usual REST verbs may be batched"""
+        headers, _ = auth_headers
+        response = client.post("/api/v1/batch", headers=headers, json={
+            "requests": [{"id": "x", "url": "/api/v1/workspace", "method": "OPTIONS"}]
+        })
+        assert response.status_code == 400
+
+    def test_batch_caps_request_count(self, client: TestClient, auth_headers):
+        """At most 20 sub-requests per batch"""
+        headers, _ = auth_headers
+        requests = [{"id": str(i), "url": "/api/v1/workspace"} for i in range(21)]
+        response = client.post("/api/v1/batch", headers=headers, json={"requests": requests})
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize("url", [
+        "/api/v1/batch",
+        "/api/v1/batch/",
+        "/api/v1/%62atch",
+        "/api/v1/accounts/../batch",
+    ])
+    def test_batch_rejects_nested_batch(self, client: TestClient, auth_headers, url):
+        """A batch may not contain another batch, however its path is spelled"""
+        headers, _ = auth_headers
+        response = client.post("/api/v1/batch", headers=headers, json={
+            "requests": [{
+                "id": "nested",
+                "url": url,
+                "method": "POST",
+                "body": {"requests": [{"id": "ws", "url": "/api/v1/workspace"}]},
+            }]
+        })
+        assert response.status_code == 400
+
+    def test_client_cannot_forge_batch_marker(self, client: TestClient, auth_headers):
+        """A client-supplied marker header neither blocks nor passes through"""
+        headers, workspace_id = auth_headers
+        response = client.post(
+            "/api/v1/batch",
+            headers={**headers, "x-ledgera-batch-depth": "forged"},
+            json={"requests": [{
+                "id": "ws",
+                "url": "/api/v1/workspace",
+                "headers": {"X-Ledgera-Batch-Depth": "forged"},
+            }]},
+        )
+        assert response.status_code == 200
+        assert response.json()["responses"][0]["body"]["id"] == workspace_id
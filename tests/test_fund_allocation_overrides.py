@@ -0,0 +1,146 @@
+"""Fund allocation override endpoint tests"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+OVERRIDES_URL = "/api/v1/analytics/fund-allocation-overrides"
+
+
+def _signup(client: TestClient, email: str) -> dict:
+    """Sign up a user and return their auth headers"""
+    response = client.post("/auth/signup", json={
+        "email": email,
+        "password": "Password123",
+        "first_name": email.split("@")[0].title(),
+        "last_name": "User",
+        "date_of_birth": "1990-01-15",
+        "nationalities": ["SG"],
+        "tax_residencies": ["SG"],
+        "phone_country_code": "+65",
+        "phone_number": "91234567",
+        "address_line1": "1 Main Street",
+        "address_city": "Singapore",
+        "address_postal_code": "018956",
+        "address_country": "SG",
+        "tos_accepted": True,
+        "privacy_accepted": True,
+    })
+    assert response.status_code == 201, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _create_fund(client: TestClient, headers: dict, name: str) -> str:
+    response = client.post("/api/v1/categories/funds", headers=headers, json={"name": name})
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+@pytest.fixture
+def headers(client: TestClient) -> dict:
+    return _signup(client, "owner@example.com")
+
+
+class TestFundAllocationOverrides:
+    """Test single and batch override upserts"""
+
+    def test_batch_upsert(self, client: TestClient, headers):
+        """Every (fund, year, month) in the batch is stored"""
+        fund_a = _create_fund(client, headers, "Emergency")
+        fund_b = _create_fund(client, headers, "Travel")
+
+        response = client.post(f"{OVERRIDES_URL}/batch", headers=headers, json=[
+            {"fund_id": fund_a, "year": 2024, "month": 1, "allocation_percentage": "30"},
+            {"fund_id": fund_b, "year": 2024, "month": 1, "allocation_percentage": "20"},
+            {"fund_id": fund_a, "year": 2024, "month": 2, "override_amount": "500", "mode": "MODEL"},
+        ])
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+
+        stored = client.get(OVERRIDES_URL, headers=headers).json()
+        by_key = {(o["fund_id"], o["year"], o["month"]): o for o in stored}
+        assert set(by_key) == {(fund_a, 2024, 1), (fund_b, 2024, 1), (fund_a, 2024, 2)}
+        assert float(by_key[(fund_a, 2024, 1)]["allocation_percentage"]) == 30
+        assert float(by_key[(fund_a, 2024, 2)]["override_amount"]) == 500
+        assert by_key[(fund_a, 2024, 2)]["mode"] == "MODEL"
+
+    def test_batch_upsert_updates_existing_rows(self, client: TestClient, headers):
+        """Upserting an existing key updates it instead of adding a row"""
+        fund_id = _create_fund(client, headers, "Emergency")
+        client.post(f"{OVERRIDES_URL}/batch", headers=headers, json=[
+            {"fund_id": fund_id, "year": 2024, "month": 3, "allocation_percentage": "10"},
+        ])
+        client.post(f"{OVERRIDES_URL}/batch", headers=headers, json=[
+            {"fund_id": fund_id, "year": 2024, "month": 3, "allocation_percentage": "40"},
+        ])
+
+        stored = client.get(OVERRIDES_URL, headers=headers, params={"year": 2024, "month": 3}).json()
+        assert len(stored) == 1
+        assert float(stored[0]["allocation_percentage"]) == 40
+
+    def test_batch_duplicate_keys_last_wins(self, client: TestClient, headers):
+        """Repeated keys in one batch collapse to the last entry"""
+        fund_id = _create_fund(client, headers, "Emergency")
+        response = client.post(f"{OVERRIDES_URL}/batch", headers=headers, json=[
+            {"fund_id": fund_id, "year": 2024, "month": 4, "allocation_percentage": "10"},
+            {"fund_id": fund_id, "year": 2024, "month": 4, "allocation_percentage": "25"},
+        ])
+        assert response.status_code == 200
+
+        stored = client.get(OVERRIDES_URL, headers=headers, params={"year": 2024, "month": 4}).json()
+        assert len(stored) == 1
+        assert float(stored[0]["allocation_percentage"]) == 25
+
+    def test_batch_empty(self, client: TestClient, headers):
+        response = client.post(f"{OVERRIDES_URL}/batch", headers=headers, json=[])
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_batch_rejects_other_workspace_fund(self, client: TestClient, headers):
+        """A fund from another workspace 404s and nothing is written"""
+        own_fund = _create_fund(client, headers, "Emergency")
+        other_headers = _signup(client, "other@example.com")
+        other_fund = _create_fund(client, other_headers, "Theirs")
+
+        response = client.post(f"{OVERRIDES_URL}/batch", headers=headers, json=[
+            {"fund_id": own_fund, "year": 2024, "month": 5, "allocation_percentage": "10"},
+            {"fund_id": other_fund, "year": 2024, "month": 5, "allocation_percentage": "10"},
+        ])
+        assert response.status_code == 404
+
+        assert client.get(OVERRIDES_URL, headers=headers).json() == []
+        assert client.get(OVERRIDES_URL, headers=other_headers).json() == []
+
+    def test_single_upsert_returns_stored_row(self, client: TestClient, headers):
+        """The single-row endpoint returns the row as stored"""
+        fund_id = _create_fund(client, headers, "Emergency")
+        payload = {"fund_id": fund_id, "year": 2024, "month": 6, "allocation_percentage": "15"}
+
+        created = client.post(OVERRIDES_URL, headers=headers, json=payload)
+        assert created.status_code == 200
+        row = created.json()
+        assert row["id"]
+        assert (row["fund_id"], row["year"], row["month"]) == (fund_id, 2024, 6)
+        assert float(row["allocation_percentage"]) == 15
+
+        updated = client.post(OVERRIDES_URL, headers=headers, json={**payload, "allocation_percentage": "35"})
+        assert updated.status_code == 200
+        assert updated.json()["id"] == row["id"]
+        assert float(updated.json()["allocation_percentage"]) == 35
+
+    def test_single_upsert_rejects_other_workspace_fund(self, client: TestClient, headers):
+        other_fund = _create_fund(client, _signup(client, "other@example.com"), "Theirs")
+        response = client.post(OVERRIDES_URL, headers=headers, json={
+            "fund_id": other_fund, "year": 2024, "month": 7, "allocation_percentage": "10",
+        })
+        assert response.status_code == 404
+
+    def test_batch_rejects_invalid_row(self, client: TestClient, headers):
+        """One invalid row 400s the whole batch before anything is written"""
+        fund_id = _create_fund(client, headers, "Emergency")
+        response = client.post(f"{OVERRIDES_URL}/batch", headers=headers, json=[
+            {"fund_id": fund_id, "year": 2024, "month": 8, "allocation_percentage": "10"},
+            {"fund_id": fund_id, "year": 2024, "month": 13, "allocation_percentage": "10"},
+        ])
+        assert response.status_code == 400
+
+        assert client.get(OVERRIDES_URL, headers=headers).json() == []